@@ -0,0 +1,188 @@
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from datetime import date
+from typing import Iterator, List, NamedTuple
+from app.core.config import settings
+from app.models.submission import QuizSubmission
+
+PARENT_TABLE = QuizSubmission.__tablename__
+
+
+class Partition(NamedTuple):
+    """One monthly partition of quiz_submissions."""
+    name: str
+    month: date  # First day of the month it holds
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing a date."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Partition table name for a month, e.g. quiz_submissions_y2026m10."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def create_month_partitions(connection: Connection, first: date, count: int) -> List[str]:
+    """
+    Create monthly partitions that do not exist yet.
+    
+    Args:
+        connection: Database connection
+        first: First month to cover
+        count: Number of consecutive months
+        
+    Returns:
+        Names of the partitions created
+    """
+    created = []
+    for offset in range(count):
+        month = add_months(month_start(first), offset)
+        name = partition_name(month)
+        exists = connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+        ).scalar()
+        if exists:
+            continue
+        connection.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+
+@event.listens_for(QuizSubmission.__table__, "after_create")
+def create_initial_partitions(target, connection: Connection, **kwargs) -> None:
+    """Give a freshly created quiz_submissions somewhere to insert into."""
+    create_month_partitions(
+        connection, date.today(), settings.SUBMISSION_PARTITIONS_AHEAD + 1
+    )
+
+
+def list_partitions(connection: Connection) -> List[Partition]:
+    """
+    List attached monthly partitions, oldest first.
+    
+    Args:
+        connection: Database connection
+        
+    Returns:
+        Partitions of quiz_submissions named by partition_name
+    """
+    rows = connection.execute(
+        text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+            ORDER BY child.relname
+        """),
+        {"parent": PARENT_TABLE}
+    ).scalars()
+    
+    partitions = []
+    prefix = f"{PARENT_TABLE}_y"
+    for name in rows:
+        if name.startswith(prefix) and len(name) == len(prefix) + 7:
+            partitions.append(Partition(name, date(int(name[-7:-3]), int(name[-2:]), 1)))
+    return partitions
+
+
+def detach_partition(connection: Connection, name: str) -> None:
+    """Detach a partition so it stops taking part in queries on the parent."""
+    connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+
+
+def iter_partition_rows(connection: Connection, name: str, batch_size: int) -> Iterator[dict]:
+    """
+    Stream every row of a (detached) partition in submission order.
+    
+    Bitmaps are returned base64-encoded so rows are JSON-serializable.
+    
+    Args:
+        connection: Database connection
+        name: Partition table name
+        batch_size: Rows fetched per round trip
+        
+    Yields:
+        Row dictionaries
+    """
+    result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(
+        text(f"""
+            SELECT id, quiz_id, user_id, score, total_questions, submitted_at,
+                   quiz_version,
+                   encode(correctness, 'base64') AS correctness,
+                   encode(served, 'base64') AS served
+            FROM {name}
+            ORDER BY submitted_at
+        """)
+    )
+    for row in result.mappings():
+        yield dict(row)
+
+
+def drop_partition_table(connection: Connection, name: str) -> None:
+    """Drop a detached partition once it has been archived."""
+    connection.execute(text(f"DROP TABLE {name}"))
+
+
+def list_detached_partitions(connection: Connection) -> List[Partition]:
+    """
+    List monthly partition tables that are detached but not yet dropped
+    (left behind if archiving was interrupted).
+    
+    Args:
+        connection: Database connection
+        
+    Returns:
+        Detached partitions, oldest first
+    """
+    attached = {partition.name for partition in list_partitions(connection)}
+    rows = connection.execute(
+        text("""
+            SELECT relname FROM pg_class
+            WHERE relkind = 'r' AND relname LIKE :pattern
+            ORDER BY relname
+        """),
+        {"pattern": f"{PARENT_TABLE}\\_y%"}
+    ).scalars()
+    prefix = f"{PARENT_TABLE}_y"
+    return [
+        Partition(name, date(int(name[-7:-3]), int(name[-2:]), 1))
+        for name in rows
+        if name not in attached and len(name) == len(prefix) + 7
+    ]
+
+
+def try_maintenance_lock(connection: Connection) -> bool:
+    """
+    Take the session-level lock that lets one worker run partition
+    maintenance at a time.
+    
+    Args:
+        connection: Database connection
+        
+    Returns:
+        True if acquired (release with release_maintenance_lock)
+    """
+    return connection.execute(
+        text("SELECT pg_try_advisory_lock(hashtext(:name))"),
+        {"name": f"{PARENT_TABLE}_partition_maintenance"}
+    ).scalar()
+
+
+def release_maintenance_lock(connection: Connection) -> None:
+    """Release the lock taken by try_maintenance_lock."""
+    connection.execute(
+        text("SELECT pg_advisory_unlock(hashtext(:name))"),
+        {"name": f"{PARENT_TABLE}_partition_maintenance"}
+    )
@@ -1,10 +1,19 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from sqlalchemy import any_, bindparam, case, delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Dict, Iterator, List, NamedTuple, Optional
 from uuid import UUID
-from app.models.quiz import Quiz
+from datetime import datetime
+import io
+import json
+import uuid
+from app.core.cache import invalidate_quiz, invalidate_quizzes
+from app.core.invalidation import notify_quiz_changed, notify_quizzes_changed
+from app.models.quiz import CHANGE_SEQ_HORIZON_SQL, Quiz
 from app.models.question import Question
 from app.models.answer import Answer
-from app.schemas.quiz import QuizCreate, QuizUpdate
+from app.models.submission import QuizSubmission
+from app.schemas.quiz import QuizBulkFilter, QuizCreate, QuizUpdate, QuizQuestionsPatch, QuestionPatch
 
 
 def get_quiz_by_id(db: Session, quiz_id: UUID, load_questions: bool = True) -> Optional[Quiz]:
@@ -19,7 +28,7 @@ def get_quiz_by_id(db: Session, quiz_id: UUID, load_questions: bool = True) -> O
     Returns:
         Quiz instance or None
     """
-    query = db.query(Quiz).filter(Quiz.id == quiz_id)
+    query = db.query(Quiz).filter(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
     
     if load_questions:
         query = query.options(
@@ -29,6 +38,61 @@ def get_quiz_by_id(db: Session, quiz_id: UUID, load_questions: bool = True) -> O
     return query.first()
 
 
+class QuestionPool(NamedTuple):
+    """A quiz's question IDs, for drawing attempts."""
+    ordered: List[UUID]  # Quiz order
+    by_type: Dict[str, List[UUID]]  # Question type value -> IDs in quiz order
+
+
+def get_question_pool(db: Session, quiz_id: UUID) -> QuestionPool:
+    """
+    Get a quiz's question IDs in quiz order and grouped by question type.
+    
+    Only IDs and types are selected, so this stays cheap for large banks.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        QuestionPool
+    """
+    rows = (
+        db.query(Question.id, Question.question_type)
+        .filter(Question.quiz_id == quiz_id)
+        .order_by(Question.order)
+        .all()
+    )
+    
+    by_type: Dict[str, List[UUID]] = {}
+    for row in rows:
+        by_type.setdefault(row.question_type.value, []).append(row.id)
+    return QuestionPool(ordered=[row.id for row in rows], by_type=by_type)
+
+
+def get_answer_constraints(db: Session, quiz_id: UUID) -> List[tuple]:
+    """
+    Get the data needed to bound a quiz's submissions: question IDs, types
+    and MCQ option keys (no question text or answers).
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        List of (question UUID, question type value, option keys or None)
+    """
+    rows = (
+        db.query(Question.id, Question.question_type, Question.options)
+        .filter(Question.quiz_id == quiz_id)
+        .all()
+    )
+    return [
+        (row.id, row.question_type.value, list(row.options) if row.options else None)
+        for row in rows
+    ]
+
+
 def list_quizzes(
     db: Session,
     admin_id: Optional[UUID] = None,
@@ -49,7 +113,7 @@ def list_quizzes(
     Returns:
         List of Quiz instances
     """
-    query = db.query(Quiz)
+    query = db.query(Quiz).filter(Quiz.deleted_at.is_(None))
     
     if admin_id:
         query = query.filter(Quiz.admin_id == admin_id)
@@ -60,6 +124,208 @@ def list_quizzes(
     return query.offset(skip).limit(limit).all()
 
 
+def list_public_quizzes(db: Session, skip: int = 0, limit: int = 100) -> list:
+    """
+    List active quizzes with their question counts, newest first.
+    
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        
+    Returns:
+        Rows with id, title, description, is_active, created_at and
+        question_count
+    """
+    question_count = (
+        select(func.count(Question.id))
+        .where(Question.quiz_id == Quiz.id)
+        .correlate(Quiz)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            Quiz.id, Quiz.title, Quiz.description, Quiz.is_active, Quiz.created_at,
+            question_count.label("question_count")
+        )
+        .where(Quiz.is_active.is_(True), Quiz.deleted_at.is_(None))
+        .order_by(Quiz.created_at.desc(), Quiz.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return rows.all()
+
+
+def list_quiz_summaries(
+    db: Session,
+    admin_id: UUID,
+    limit: int,
+    before: Optional[tuple[datetime, UUID]] = None
+) -> list:
+    """
+    Get a page of an admin's quizzes with dashboard aggregates in one query.
+    
+    The page of quizzes is chosen first (keyset on created_at, id, newest
+    first); question and submission aggregates are then grouped for just
+    those quizzes.
+    
+    Args:
+        db: Database session
+        admin_id: Admin UUID
+        limit: Maximum number of quizzes
+        before: (created_at, id) of the last quiz of the previous page
+        
+    Returns:
+        Rows with id, title, is_active, created_at, version, question_count,
+        submission_count, average_percentage and last_submission_at
+    """
+    keyset = "AND (q.created_at, q.id) < (:before_created_at, :before_id)" if before else ""
+    rows = db.execute(
+        text(f"""
+            WITH page AS (
+                SELECT q.id, q.title, q.is_active, q.created_at, q.version
+                FROM quizzes q
+                WHERE q.admin_id = :admin_id AND q.deleted_at IS NULL {keyset}
+                ORDER BY q.created_at DESC, q.id DESC
+                LIMIT :limit
+            ),
+            question_counts AS (
+                SELECT quiz_id, count(*) AS question_count
+                FROM questions
+                WHERE quiz_id IN (SELECT id FROM page)
+                GROUP BY quiz_id
+            ),
+            submission_stats AS (
+                SELECT quiz_id,
+                       count(*) AS submission_count,
+                       avg(score * 100.0 / NULLIF(total_questions, 0)) AS average_percentage,
+                       max(submitted_at) AS last_submission_at
+                FROM quiz_submissions
+                WHERE quiz_id IN (SELECT id FROM page)
+                GROUP BY quiz_id
+            )
+            SELECT p.id, p.title, p.is_active, p.created_at, p.version,
+                   coalesce(qc.question_count, 0) AS question_count,
+                   coalesce(ss.submission_count, 0) AS submission_count,
+                   ss.average_percentage::float8 AS average_percentage,
+                   ss.last_submission_at
+            FROM page p
+            LEFT JOIN question_counts qc ON qc.quiz_id = p.id
+            LEFT JOIN submission_stats ss ON ss.quiz_id = p.id
+            ORDER BY p.created_at DESC, p.id DESC
+        """),
+        {
+            "admin_id": admin_id,
+            "limit": limit,
+            "before_created_at": before[0] if before else None,
+            "before_id": before[1] if before else None,
+        }
+    )
+    return rows.all()
+
+
+def list_quiz_changes(db: Session, since: int, limit: int) -> list:
+    """
+    Get catalogue changes after a change sequence number, oldest first.
+    
+    A quiz appears once with its current state however often it changed;
+    purged quizzes come from quiz_tombstones. Changes at or above the
+    snapshot horizon (see CHANGE_SEQ_HORIZON_SQL) are held back until
+    every transaction that could still commit below them has finished.
+    
+    Args:
+        db: Database session
+        since: Last change_seq the client has applied
+        limit: Maximum number of changes
+        
+    Returns:
+        Rows with change_seq, id, title, description, is_active,
+        deleted_at, created_at, question_count and purged
+    """
+    rows = db.execute(
+        text(f"""
+            WITH horizon AS MATERIALIZED (
+                SELECT {CHANGE_SEQ_HORIZON_SQL} AS seq
+            ),
+            changes AS (
+                SELECT change_seq, id, title, description, is_active, deleted_at,
+                       created_at, false AS purged
+                FROM quizzes
+                WHERE change_seq > :since AND change_seq < (SELECT seq FROM horizon)
+                UNION ALL
+                SELECT change_seq, quiz_id, NULL, NULL, false, deleted_at,
+                       NULL, true
+                FROM quiz_tombstones
+                WHERE change_seq > :since AND change_seq < (SELECT seq FROM horizon)
+                ORDER BY change_seq
+                LIMIT :limit
+            ),
+            question_counts AS (
+                SELECT quiz_id, count(*) AS question_count
+                FROM questions
+                WHERE quiz_id IN (
+                    SELECT id FROM changes WHERE is_active AND deleted_at IS NULL
+                )
+                GROUP BY quiz_id
+            )
+            SELECT c.change_seq, c.id, c.title, c.description, c.is_active, c.deleted_at,
+                   c.created_at, c.purged, coalesce(qc.question_count, 0) AS question_count
+            FROM changes c
+            LEFT JOIN question_counts qc ON qc.quiz_id = c.id
+            ORDER BY c.change_seq
+        """),
+        {"since": since, "limit": limit}
+    )
+    return rows.all()
+
+
+def get_catalog_watermark(db: Session):
+    """
+    Get the latest servable catalogue change and the database clock.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Row with change_seq and updated_at of the latest change below the
+        horizon (both None if there is none), horizon (changes at or
+        above it are not served yet) and settled_at: the start of the
+        oldest transaction still able to write (the current UTC time if
+        none, None if hidden from this role), before which no new change
+        can still appear
+    """
+    return db.execute(
+        text(f"""
+            WITH horizon AS MATERIALIZED (
+                SELECT {CHANGE_SEQ_HORIZON_SQL} AS seq
+            ),
+            writers AS (
+                SELECT min(xact_start) AS oldest_start,
+                       count(*) FILTER (WHERE xact_start IS NULL) AS hidden
+                FROM pg_stat_activity
+                WHERE datname = current_database() AND backend_xid IS NOT NULL
+            )
+            SELECT latest.change_seq, latest.updated_at, horizon.seq AS horizon,
+                   CASE WHEN writers.hidden > 0 THEN NULL
+                        ELSE timezone('utc', least(writers.oldest_start, clock_timestamp()))
+                   END AS settled_at
+            FROM horizon
+            CROSS JOIN writers
+            LEFT JOIN LATERAL (
+                SELECT change_seq, updated_at FROM (
+                    (SELECT change_seq, updated_at FROM quizzes
+                     WHERE change_seq < horizon.seq ORDER BY change_seq DESC LIMIT 1)
+                    UNION ALL
+                    (SELECT change_seq, deleted_at FROM quiz_tombstones
+                     WHERE change_seq < horizon.seq ORDER BY change_seq DESC LIMIT 1)
+                ) candidates
+                ORDER BY change_seq DESC
+                LIMIT 1
+            ) latest ON true
+        """)
+    ).one()
+
+
 def create_quiz(db: Session, quiz_data: QuizCreate, admin_id: UUID) -> Quiz:
     """
     Create a new quiz with questions and answers.
@@ -83,7 +349,9 @@ def create_quiz(db: Session, quiz_data: QuizCreate, admin_id: UUID) -> Quiz:
         title=quiz_data.title,
         description=quiz_data.description,
         admin_id=admin_id,
-        is_active=quiz_data.is_active
+        is_active=quiz_data.is_active,
+        pool_size=quiz_data.pool_size,
+        pool_rules=quiz_data.model_dump(mode="json")["pool_rules"]
     )
     db.add(quiz)
     db.flush()  # Get quiz ID without committing
@@ -131,19 +399,32 @@ def update_quiz(db: Session, quiz_id: UUID, quiz_data: QuizUpdate) -> Optional[Q
         return None
     
     # Update only provided fields
-    update_data = quiz_data.model_dump(exclude_unset=True)
+    update_data = quiz_data.model_dump(exclude_unset=True, mode="json")
+    if "pool_size" in update_data or "pool_rules" in update_data:
+        _check_stored_pool(
+            db,
+            quiz_id,
+            update_data.get("pool_size", quiz.pool_size),
+            update_data.get("pool_rules", quiz.pool_rules)
+        )
     for field, value in update_data.items():
         setattr(quiz, field, value)
+    # Metadata only: the version (which keys item analysis and attempts)
+    # changes only with question content
+    db.flush()
+    notify_quiz_changed(db, quiz_id)
     
     db.commit()
     db.refresh(quiz)
+    invalidate_quiz(quiz_id)
     
     return quiz
 
 
 def delete_quiz(db: Session, quiz_id: UUID) -> bool:
     """
-    Delete a quiz (hard delete).
+    Soft-delete a quiz: hide it immediately and leave row removal to
+    purge_deleted_quiz.
     
     Args:
         db: Database session
@@ -152,14 +433,385 @@ def delete_quiz(db: Session, quiz_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    quiz = get_quiz_by_id(db, quiz_id, load_questions=False)
-    if not quiz:
-        return False
+    result = db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
+        .values(deleted_at=datetime.utcnow(), is_active=False)
+    )
+    if result.rowcount:
+        notify_quiz_changed(db, quiz_id)
+    db.commit()
+    invalidate_quiz(quiz_id)
+    
+    return result.rowcount > 0
+
+
+def bulk_update_quizzes(
+    db: Session,
+    admin_id: UUID,
+    values: dict,
+    quiz_ids: Optional[List[UUID]] = None,
+    quiz_filter: Optional[QuizBulkFilter] = None
+) -> List[UUID]:
+    """
+    Update many of an admin's live quizzes in one statement.
+    
+    Versions are left alone: these are metadata changes (active flag,
+    owner, soft delete) and a bump would reset item analysis.
+    
+    Runs a single UPDATE ... WHERE admin_id = :me AND id = ANY(:ids)
+    RETURNING id (or the filter's conditions instead of the ID list),
+    notifies listeners in the same transaction, commits and invalidates
+    caches for all updated quizzes at once.
+    
+    Args:
+        db: Database session
+        admin_id: Admin UUID; other admins' quizzes are never touched
+        values: Column values to set
+        quiz_ids: Explicit quiz UUIDs
+        quiz_filter: Attribute filter (used when quiz_ids is None)
+        
+    Returns:
+        IDs of the updated quizzes
+    """
+    statement = update(Quiz).where(Quiz.admin_id == admin_id, Quiz.deleted_at.is_(None))
+    
+    if quiz_ids is not None:
+        statement = statement.where(
+            Quiz.id == any_(bindparam("quiz_ids", quiz_ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+        )
+    elif quiz_filter is not None:
+        if quiz_filter.is_active is not None:
+            statement = statement.where(Quiz.is_active == quiz_filter.is_active)
+        if quiz_filter.created_after is not None:
+            statement = statement.where(Quiz.created_at >= quiz_filter.created_after)
+        if quiz_filter.created_before is not None:
+            statement = statement.where(Quiz.created_at < quiz_filter.created_before)
+        if quiz_filter.title_contains:
+            statement = statement.where(Quiz.title.icontains(quiz_filter.title_contains, autoescape=True))
+    
+    updated_ids = db.execute(
+        statement.values(**values).returning(Quiz.id),
+        execution_options={"synchronize_session": False}
+    ).scalars().all()
     
-    db.delete(quiz)
+    notify_quizzes_changed(db, updated_ids)
     db.commit()
+    invalidate_quizzes(updated_ids)
     
-    return True
+    return updated_ids
+
+
+def clone_quiz(
+    db: Session,
+    quiz_id: UUID,
+    admin_id: UUID,
+    title: str,
+    is_active: Optional[bool] = None
+) -> tuple[UUID, int]:
+    """
+    Copy a quiz with its questions and answers entirely inside Postgres.
+    
+    A single INSERT ... SELECT statement (chained through data-modifying
+    CTEs) writes the quiz, every question and every answer with fresh
+    UUIDs; the old->new question ID mapping is materialized once.
+    
+    Args:
+        db: Database session
+        quiz_id: Source quiz UUID
+        admin_id: Admin UUID owning the copy
+        title: Title of the copy
+        is_active: Active flag of the copy (None = same as the source)
+        
+    Returns:
+        Tuple of (new quiz UUID, number of questions copied)
+    """
+    new_quiz_id = uuid.uuid4()
+    question_count = db.execute(
+        text("""
+            WITH new_quiz AS (
+                INSERT INTO quizzes (id, title, description, admin_id, is_active, created_at,
+                                     version, pool_size, pool_rules)
+                SELECT :new_quiz_id, :title, description, :admin_id,
+                       coalesce(:is_active, is_active), timezone('utc', now()),
+                       1, pool_size, pool_rules
+                FROM quizzes
+                WHERE id = :quiz_id
+                RETURNING id
+            ),
+            question_ids AS MATERIALIZED (
+                SELECT id AS old_id, gen_random_uuid() AS new_id
+                FROM questions
+                WHERE quiz_id = :quiz_id
+            ),
+            new_questions AS (
+                INSERT INTO questions (id, quiz_id, question_type, question_text, options, "order")
+                SELECT m.new_id, (SELECT id FROM new_quiz), q.question_type, q.question_text,
+                       q.options, q."order"
+                FROM questions q
+                JOIN question_ids m ON m.old_id = q.id
+                RETURNING id
+            ),
+            new_answers AS (
+                INSERT INTO answers (id, question_id, correct_answer, explanation)
+                SELECT gen_random_uuid(), m.new_id, a.correct_answer, a.explanation
+                FROM answers a
+                JOIN question_ids m ON m.old_id = a.question_id
+                RETURNING id
+            )
+            SELECT count(*) FROM new_questions
+        """),
+        {
+            "new_quiz_id": new_quiz_id,
+            "quiz_id": quiz_id,
+            "admin_id": admin_id,
+            "title": title,
+            "is_active": is_active,
+        }
+    ).scalar()
+    db.commit()
+    
+    return new_quiz_id, question_count
+
+
+def list_deleted_quiz_ids(db: Session) -> List[UUID]:
+    """
+    List soft-deleted quizzes whose rows have not been purged yet.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        List of quiz UUIDs
+    """
+    return list(db.scalars(select(Quiz.id).where(Quiz.deleted_at.is_not(None))))
+
+
+def purge_deleted_quiz(db: Session, quiz_id: UUID, batch_size: int) -> int:
+    """
+    Hard-delete a soft-deleted quiz in bounded batches.
+    
+    Submissions are deleted ``batch_size`` rows per transaction so no
+    single statement holds locks or WAL for the whole quiz; the quiz row
+    itself goes last and the database cascades its questions and answers.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        batch_size: Maximum submissions deleted per transaction
+        
+    Returns:
+        Number of submissions deleted
+    """
+    deleted = 0
+    while True:
+        batch = (
+            select(QuizSubmission.id)
+            .where(QuizSubmission.quiz_id == quiz_id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = db.execute(
+            delete(QuizSubmission).where(QuizSubmission.id.in_(batch)),
+            execution_options={"synchronize_session": False}
+        )
+        db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+    
+    db.execute(
+        delete(Quiz).where(Quiz.id == quiz_id, Quiz.deleted_at.is_not(None)),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    
+    return deleted
+
+
+def apply_question_changes(db: Session, quiz_id: UUID, changes: QuizQuestionsPatch) -> None:
+    """
+    Apply a minimal diff of question changes to a quiz in one transaction.
+    
+    Only the touched questions are loaded; deletions and the final
+    renumbering each run as a single statement, and only rows whose
+    order actually changes are rewritten.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        changes: Questions to add, update and delete, plus optional new order
+        
+    Raises:
+        ValueError: If a question is not part of the quiz or the diff is invalid
+    """
+    current = (
+        db.query(Question.id, Question.order)
+        .filter(Question.quiz_id == quiz_id)
+        .order_by(Question.order, Question.id)
+        .all()
+    )
+    current_order = {row.id: row.order for row in current}
+    
+    updated_ids = [patch.id for patch in changes.update]
+    deleted_ids = set(changes.delete)
+    if (set(updated_ids) | deleted_ids) - current_order.keys():
+        raise ValueError("Question not found in this quiz")
+    if len(updated_ids) != len(set(updated_ids)):
+        raise ValueError("Duplicate question updates found")
+    if deleted_ids & set(updated_ids):
+        raise ValueError("Cannot update and delete the same question")
+    
+    remaining = [row.id for row in current if row.id not in deleted_ids]
+    if changes.order is not None:
+        if len(changes.order) != len(remaining) or set(changes.order) != set(remaining):
+            raise ValueError("Question order must list every remaining question exactly once")
+        remaining = list(changes.order)
+    
+    for question_data in changes.add:
+        validate_question(
+            question_data.question_type,
+            question_data.options,
+            question_data.answer.correct_answer,
+            question_data.order
+        )
+    
+    # Updates: load only the questions being changed
+    if updated_ids:
+        questions = (
+            db.query(Question)
+            .options(joinedload(Question.answer))
+            .filter(Question.id.in_(updated_ids))
+            .all()
+        )
+        questions_by_id = {question.id: question for question in questions}
+        for patch in changes.update:
+            _apply_question_patch(questions_by_id[patch.id], patch)
+    
+    # Deletes: one statement per table
+    if deleted_ids:
+        db.execute(
+            delete(Answer).where(Answer.question_id.in_(deleted_ids)),
+            execution_options={"synchronize_session": False}
+        )
+        db.execute(
+            delete(Question).where(Question.id.in_(deleted_ids)),
+            execution_options={"synchronize_session": False}
+        )
+    
+    # Adds: created with their final position, so they are never renumbered
+    new_questions = []
+    for question_data in changes.add:
+        question = Question(
+            id=uuid.uuid4(),
+            quiz_id=quiz_id,
+            question_type=question_data.question_type,
+            question_text=question_data.question_text,
+            options=question_data.options
+        )
+        question.answer = Answer(
+            correct_answer=question_data.answer.correct_answer,
+            explanation=question_data.answer.explanation
+        )
+        new_questions.append((question_data.order, question))
+    added_order, moved_order = plan_question_order(
+        current_order, remaining, [(order, question.id) for order, question in new_questions]
+    )
+    for _, question in new_questions:
+        question.order = added_order[question.id]
+        db.add(question)
+    db.flush()
+    
+    # Deletes and type changes must leave enough questions for the pool
+    pool_size, pool_rules = db.query(Quiz.pool_size, Quiz.pool_rules).filter(Quiz.id == quiz_id).one()
+    try:
+        _check_stored_pool(db, quiz_id, pool_size, pool_rules)
+    except ValueError:
+        db.rollback()
+        raise
+    
+    # Renumber 1..n in a single statement, touching only moved rows
+    if moved_order:
+        db.execute(
+            update(Question)
+            .where(Question.id.in_(moved_order.keys()))
+            .values(order=case(moved_order, value=Question.id)),
+            execution_options={"synchronize_session": False}
+        )
+    
+    db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id)
+        .values(version=Quiz.version + 1)
+    )
+    notify_quiz_changed(db, quiz_id)
+    db.commit()
+    invalidate_quiz(quiz_id)
+
+
+def plan_question_order(
+    current_order: Dict[UUID, int],
+    remaining: List[UUID],
+    added: List[tuple[int, UUID]]
+) -> tuple[Dict[UUID, int], Dict[UUID, int]]:
+    """
+    Place added questions among the remaining ones and number them 1..n.
+    
+    Args:
+        current_order: Stored order of each existing question
+        remaining: Existing question IDs left after deletes, in their new order
+        added: (requested 1-based position, ID) of each new question;
+            positions past the end append
+            
+    Returns:
+        Tuple of (position of each added question, new position of each
+        existing question whose stored order changes)
+    """
+    final = list(remaining)
+    for position, question_id in sorted(added, key=lambda item: item[0]):
+        final.insert(min(max(position, 1), len(final) + 1) - 1, question_id)
+    
+    added_ids = {question_id for _, question_id in added}
+    added_order = {}
+    moved_order = {}
+    for position, question_id in enumerate(final, start=1):
+        if question_id in added_ids:
+            added_order[question_id] = position
+        elif current_order[question_id] != position:
+            moved_order[question_id] = position
+    return added_order, moved_order
+
+
+def _apply_question_patch(question: Question, patch: QuestionPatch) -> None:
+    """
+    Apply the provided fields of a patch to a question and its answer.
+    
+    Args:
+        question: Question instance with loaded answer
+        patch: Question patch data
+        
+    Raises:
+        ValueError: If the resulting question is invalid
+    """
+    question_data = patch.model_dump(exclude_unset=True, exclude={"id", "answer"})
+    answer_data = patch.answer.model_dump(exclude_unset=True) if patch.answer else {}
+    
+    question_type = question_data.get("question_type", question.question_type)
+    options = question_data.get("options", question.options)
+    correct_answer = answer_data.get(
+        "correct_answer",
+        question.answer.correct_answer if question.answer else ""
+    )
+    validate_question(question_type, options, correct_answer or "", question.order)
+    
+    for field, value in question_data.items():
+        setattr(question, field, value)
+    
+    if answer_data:
+        if question.answer is None:
+            question.answer = Answer(correct_answer=correct_answer)
+        for field, value in answer_data.items():
+            setattr(question.answer, field, value)
 
 
 def validate_quiz_structure(quiz_data: QuizCreate) -> None:
@@ -177,24 +829,240 @@ def validate_quiz_structure(quiz_data: QuizCreate) -> None:
     if len(orders) != len(set(orders)):
         raise ValueError("Duplicate question orders found")
     
+    # Pool rules can't ask for more questions than exist
+    type_counts: Dict[str, int] = {}
+    for question in quiz_data.questions:
+        type_counts[question.question_type.value] = type_counts.get(question.question_type.value, 0) + 1
+    validate_pool(
+        quiz_data.pool_size,
+        quiz_data.model_dump(mode="json")["pool_rules"],
+        type_counts
+    )
+    
     # Validate each question
     for question in quiz_data.questions:
-        # MCQ must have options
-        if question.question_type == "mcq" and not question.options:
-            raise ValueError(f"MCQ question at order {question.order} must have options")
-        
-        # MCQ answer must be one of the option keys
-        if question.question_type == "mcq" and question.options:
-            if question.answer.correct_answer not in question.options:
-                raise ValueError(
-                    f"MCQ question at order {question.order}: "
-                    f"correct answer must be one of the option keys"
-                )
+        validate_question(
+            question.question_type,
+            question.options,
+            question.answer.correct_answer,
+            question.order
+        )
+
+
+def validate_pool(
+    pool_size: Optional[int],
+    pool_rules: Optional[Dict[str, int]],
+    type_counts: Dict[str, int]
+) -> None:
+    """
+    Check a quiz's pool settings against its questions.
+    
+    Args:
+        pool_size: Questions drawn per attempt (None = no pool)
+        pool_rules: Draws per question type value
+        type_counts: Number of questions per question type value
         
-        # True/False must have valid answer
-        if question.question_type == "true_false":
-            if question.answer.correct_answer.lower() not in ["true", "false"]:
-                raise ValueError(
-                    f"True/False question at order {question.order}: "
-                    f"answer must be 'true' or 'false'"
-                )
+    Raises:
+        ValueError: If the pool asks for more questions than exist
+    """
+    if pool_size and pool_size > sum(type_counts.values()):
+        raise ValueError("Pool size exceeds the number of questions")
+    
+    for question_type, count in (pool_rules or {}).items():
+        available = type_counts.get(question_type, 0)
+        if count < 0 or count > available:
+            raise ValueError(
+                f"Pool rule for {question_type} asks for {count} "
+                f"questions but {available} exist"
+            )
+    
+    if pool_size and pool_rules and sum(pool_rules.values()) > pool_size:
+        raise ValueError("Pool rules draw more questions than the pool size")
+
+
+def _check_stored_pool(db: Session, quiz_id: UUID, pool_size: Optional[int], pool_rules: Optional[dict]) -> None:
+    """Validate pool settings against a quiz's stored (and flushed) questions."""
+    if not pool_size and not pool_rules:
+        return
+    rows = (
+        db.query(Question.question_type, func.count())
+        .filter(Question.quiz_id == quiz_id)
+        .group_by(Question.question_type)
+        .all()
+    )
+    validate_pool(pool_size, pool_rules, {question_type.value: count for question_type, count in rows})
+
+
+def validate_question(
+    question_type: str,
+    options: Optional[Dict[str, str]],
+    correct_answer: str,
+    order: int
+) -> None:
+    """
+    Validate a single question against the business rules for its type.
+    
+    Args:
+        question_type: Type of question
+        options: MCQ options mapping, if any
+        correct_answer: Correct answer
+        order: Question order (used in error messages)
+        
+    Raises:
+        ValueError: If validation fails
+    """
+    # MCQ must have options
+    if question_type == "mcq" and not options:
+        raise ValueError(f"MCQ question at order {order} must have options")
+    
+    # MCQ answer must be one of the option keys
+    if question_type == "mcq" and options:
+        if correct_answer not in options:
+            raise ValueError(
+                f"MCQ question at order {order}: "
+                f"correct answer must be one of the option keys"
+            )
+    
+    # True/False must have valid answer
+    if question_type == "true_false":
+        if correct_answer.lower() not in ["true", "false"]:
+            raise ValueError(
+                f"True/False question at order {order}: "
+                f"answer must be 'true' or 'false'"
+            )
+
+
+def iter_quizzes_for_export(db: Session, admin_id: UUID, batch_size: int = 100) -> Iterator[Quiz]:
+    """
+    Stream an admin's quizzes with questions and answers, batch by batch.
+    
+    Args:
+        db: Database session
+        admin_id: Admin UUID
+        batch_size: Quizzes fetched (with their questions) per round trip
+        
+    Yields:
+        Quiz instances with loaded questions and answers
+    """
+    query = (
+        db.query(Quiz)
+        .filter(Quiz.admin_id == admin_id, Quiz.deleted_at.is_(None))
+        .order_by(Quiz.created_at, Quiz.id)
+        .options(selectinload(Quiz.questions).selectinload(Question.answer))
+        .execution_options(yield_per=batch_size)
+    )
+    yield from query
+
+
+def prepare_import_staging(db: Session) -> None:
+    """
+    Create the transaction-scoped staging tables used by bulk_import_quizzes.
+    
+    Args:
+        db: Database session
+    """
+    db.execute(text("""
+        CREATE TEMP TABLE IF NOT EXISTS import_quizzes (
+            id uuid, title text, description text, is_active boolean,
+            pool_size integer, pool_rules jsonb
+        ) ON COMMIT DROP
+    """))
+    db.execute(text("""
+        CREATE TEMP TABLE IF NOT EXISTS import_questions (
+            id uuid, quiz_id uuid, question_type text, question_text text,
+            options jsonb, "order" integer
+        ) ON COMMIT DROP
+    """))
+    db.execute(text("""
+        CREATE TEMP TABLE IF NOT EXISTS import_answers (
+            id uuid, question_id uuid, correct_answer text, explanation text
+        ) ON COMMIT DROP
+    """))
+
+
+def bulk_import_quizzes(db: Session, quizzes: Dict[UUID, QuizCreate], admin_id: UUID) -> int:
+    """
+    Insert validated quizzes with COPY into staging tables and set-based
+    INSERT ... SELECT into the real tables. Does not commit.
+    
+    Args:
+        db: Database session (prepare_import_staging already called)
+        quizzes: New quiz UUID -> validated quiz data
+        admin_id: Admin UUID owning the imported quizzes
+        
+    Returns:
+        Number of questions inserted
+    """
+    quiz_rows = io.StringIO()
+    question_rows = io.StringIO()
+    answer_rows = io.StringIO()
+    question_count = 0
+    
+    for quiz_id, quiz_data in quizzes.items():
+        pool_rules = quiz_data.model_dump(mode="json")["pool_rules"]
+        _write_copy_row(quiz_rows, [
+            quiz_id, quiz_data.title, quiz_data.description, quiz_data.is_active,
+            quiz_data.pool_size, json.dumps(pool_rules) if pool_rules is not None else None
+        ])
+        for question_data in quiz_data.questions:
+            question_id = uuid.uuid4()
+            _write_copy_row(question_rows, [
+                question_id, quiz_id, question_data.question_type.name,
+                question_data.question_text,
+                json.dumps(question_data.options) if question_data.options is not None else None,
+                question_data.order
+            ])
+            _write_copy_row(answer_rows, [
+                uuid.uuid4(), question_id,
+                question_data.answer.correct_answer, question_data.answer.explanation
+            ])
+            question_count += 1
+    
+    cursor = db.connection().connection.cursor()
+    try:
+        for table, buffer in (
+            ("import_quizzes", quiz_rows),
+            ("import_questions", question_rows),
+            ("import_answers", answer_rows),
+        ):
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+    finally:
+        cursor.close()
+    
+    question_type_enum = Question.__table__.c.question_type.type.name
+    db.execute(text("""
+        INSERT INTO quizzes (id, title, description, admin_id, is_active, created_at,
+                             version, pool_size, pool_rules)
+        SELECT id, title, description, :admin_id, is_active, timezone('utc', now()),
+               1, pool_size, pool_rules
+        FROM import_quizzes
+    """), {"admin_id": admin_id})
+    db.execute(text(f"""
+        INSERT INTO questions (id, quiz_id, question_type, question_text, options, "order")
+        SELECT id, quiz_id, question_type::{question_type_enum}, question_text, options, "order"
+        FROM import_questions
+    """))
+    db.execute(text("""
+        INSERT INTO answers (id, question_id, correct_answer, explanation)
+        SELECT id, question_id, correct_answer, explanation
+        FROM import_answers
+    """))
+    db.execute(text("TRUNCATE import_quizzes, import_questions, import_answers"))
+    
+    return question_count
+
+
+def _write_copy_row(buffer: io.StringIO, values: list) -> None:
+    """Write one COPY csv row: NULL as bare \\N, every string quoted."""
+    fields = []
+    for value in values:
+        if value is None:
+            fields.append("\\N")
+        elif isinstance(value, bool):
+            fields.append("t" if value else "f")
+        elif isinstance(value, (int, UUID)):
+            fields.append(str(value))
+        else:
+            fields.append('"' + str(value).replace('"', '""') + '"')
+    buffer.write(",".join(fields) + "\n")
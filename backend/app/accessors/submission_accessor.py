@@ -1,6 +1,13 @@
+from sqlalchemy import insert, select, text, tuple_
 from sqlalchemy.orm import Session, joinedload
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
 from uuid import UUID
+import json
+import uuid
+from app.core.config import settings
+from app.core.leaderboard import LeaderboardEntry, display_name, leaderboards
+from app.core.live import SUBMISSION_CHANNEL, AggregateSeed, live_hub
 from app.models.submission import QuizSubmission
 from app.models.quiz import Quiz
 from app.models.question import Question, QuestionType
@@ -8,15 +15,25 @@ from app.models.user import User
 from app.schemas.submission import QuestionResult
 
 
+class Correctness(NamedTuple):
+    """Per-question correctness bitmaps for one graded attempt."""
+    quiz_version: int
+    correct: bytes
+    served: Optional[bytes]  # None when every question was served
+
+
 def create_submission_record(
     db: Session,
     quiz_id: UUID,
     user_id: UUID,
     score: int,
-    total_questions: int
+    total_questions: int,
+    correctness: Optional[Correctness] = None,
+    user_email: Optional[str] = None
 ) -> QuizSubmission:
     """
-    Create a quiz submission record with final score.
+    Create a quiz submission record with final score, add it to the
+    quiz's in-memory leaderboard and announce it to live viewers.
     
     Args:
         db: Database session
@@ -24,7 +41,10 @@ def create_submission_record(
         user_id: User UUID
         score: Number of correct answers
         total_questions: Total number of questions
-        
+        correctness: Optional per-question correctness bitmaps
+        user_email: Taker's email, masked for the leaderboard (None = the
+            leaderboard picks the submission up on its next rebuild)
+            
     Returns:
         Created QuizSubmission instance
     """
@@ -34,33 +54,131 @@ def create_submission_record(
         score=score,
         total_questions=total_questions
     )
+    if correctness is not None:
+        submission.quiz_version = correctness.quiz_version
+        submission.correctness = correctness.correct
+        submission.served = correctness.served
     
     db.add(submission)
+    db.flush()
+    event = {
+        "quiz_id": str(quiz_id),
+        "submission_id": str(submission.id),
+        "name": display_name(user_email) if user_email is not None else None,
+        "score": score,
+        "total_questions": total_questions,
+        "submitted_at": submission.submitted_at.isoformat(),
+    }
+    if settings.CACHE_INVALIDATION_LISTEN:
+        # Delivered on commit to every worker's listener, this one included
+        db.execute(
+            text("SELECT pg_notify(:channel, pg_current_xact_id()::text || ' ' || :event)"),
+            {"channel": SUBMISSION_CHANNEL, "event": json.dumps(event, separators=(",", ":"))}
+        )
     db.commit()
     db.refresh(submission)
+    if not settings.CACHE_INVALIDATION_LISTEN:
+        live_hub.publish(event)
+    
+    if user_email is not None:
+        leaderboards.record(quiz_id, LeaderboardEntry(
+            submission_id=submission.id,
+            name=display_name(user_email),
+            score=submission.score,
+            total_questions=submission.total_questions,
+            submitted_at=submission.submitted_at
+        ))
     
     return submission
 
 
+def bulk_create_submissions(db: Session, rows: List[dict]) -> int:
+    """
+    Insert many submission records in one batched statement (no commit).
+    
+    Args:
+        db: Database session
+        rows: Column values per submission (quiz_id, user_id, score,
+            total_questions and optionally quiz_version, correctness, served)
+            
+    Returns:
+        Number of submissions inserted
+    """
+    if not rows:
+        return 0
+    now = datetime.utcnow()
+    db.execute(
+        insert(QuizSubmission),
+        [{"id": uuid.uuid4(), "submitted_at": now, **row} for row in rows]
+    )
+    return len(rows)
+
+
+def get_live_aggregate(db: Session, quiz_id: UUID) -> AggregateSeed:
+    """
+    Get a quiz's submission totals together with the snapshot they were
+    read in, so live updates already included are not counted twice.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        AggregateSeed
+    """
+    row = db.execute(
+        text("""
+            SELECT count(*) AS submission_count,
+                   coalesce(sum(score), 0) AS score_total,
+                   coalesce(sum(score * 100.0 / NULLIF(total_questions, 0)), 0)::float8 AS percentage_total,
+                   max(score) AS best_score,
+                   pg_current_snapshot()::text AS snapshot
+            FROM quiz_submissions
+            WHERE quiz_id = :quiz_id
+        """),
+        {"quiz_id": quiz_id}
+    ).one()
+    return AggregateSeed(**row._mapping)
+
+
 def calculate_score(
     quiz: Quiz,
-    user_answers: Dict[str, str]
-) -> tuple[int, List[QuestionResult]]:
+    user_answers: Dict[str, str],
+    question_ids: Optional[List[UUID]] = None
+) -> tuple[int, List[QuestionResult], Correctness]:
     """
     Calculate quiz score by comparing user answers with correct answers.
-    Returns score and detailed results without storing user answers.
+    Returns score, detailed results and compact correctness bitmaps
+    without storing user answers.
     
     Args:
         quiz: Quiz instance with loaded questions and answers
         user_answers: Dictionary mapping question_id (as string) to user answer
-        
+        question_ids: Questions served to this attempt, in served order
+            (None = every question in the quiz)
+            
     Returns:
-        Tuple of (score, list of question results)
+        Tuple of (score, list of question results, correctness bitmaps)
     """
     score = 0
     results = []
     
-    for question in quiz.questions:
+    # Bit positions follow question order in this quiz version
+    positions = {question.id: index for index, question in enumerate(quiz.questions)}
+    bitmap_size = (len(quiz.questions) + 7) // 8
+    correct_bits = bytearray(bitmap_size)
+    served_bits = bytearray(bitmap_size) if question_ids is not None else None
+    
+    questions = quiz.questions
+    if question_ids is not None:
+        questions_by_id = {question.id: question for question in quiz.questions}
+        questions = [
+            questions_by_id[question_id]
+            for question_id in question_ids
+            if question_id in questions_by_id
+        ]
+    
+    for question in questions:
         question_id_str = str(question.id)
         user_answer = user_answers.get(question_id_str, "").strip()
         
@@ -75,8 +193,12 @@ def calculate_score(
             correct_answer
         )
         
+        position = positions[question.id]
+        if served_bits is not None:
+            served_bits[position // 8] |= 1 << (position % 8)
         if is_correct:
             score += 1
+            correct_bits[position // 8] |= 1 << (position % 8)
         
         # Create result object (not stored in DB)
         result = QuestionResult(
@@ -89,7 +211,13 @@ def calculate_score(
         )
         results.append(result)
     
-    return score, results
+    correctness = Correctness(
+        quiz_version=quiz.version,
+        correct=bytes(correct_bits),
+        served=bytes(served_bits) if served_bits is not None else None
+    )
+    
+    return score, results, correctness
 
 
 def check_answer_correctness(
@@ -131,6 +259,65 @@ def check_answer_correctness(
     return False
 
 
+def get_item_statistics(
+    db: Session,
+    quiz_id: UUID,
+    quiz_version: int,
+    question_count: int
+) -> List[dict]:
+    """
+    Aggregate per-question statistics from submission correctness bitmaps.
+    
+    Aggregation runs in Postgres with get_bit over the bitmaps, so
+    submissions are streamed through the aggregate rather than loaded.
+    Scores are percentages so pooled attempts of different sizes compare.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        quiz_version: Quiz version whose submissions are analysed
+        question_count: Number of questions in that version
+        
+    Returns:
+        One row per question position with served/correct counts and
+        score sums (served_score_sum, served_score_sq_sum, correct_score_sum)
+    """
+    if question_count == 0:
+        return []
+    
+    rows = db.execute(
+        text("""
+            WITH attempts AS (
+                SELECT correctness, served,
+                       score::float8 / NULLIF(total_questions, 0) AS pct
+                FROM quiz_submissions
+                WHERE quiz_id = :quiz_id
+                  AND quiz_version = :quiz_version
+                  AND correctness IS NOT NULL
+            ),
+            bits AS (
+                SELECT i.position,
+                       a.pct,
+                       (a.served IS NULL OR get_bit(a.served, i.position) = 1) AS was_served,
+                       get_bit(a.correctness, i.position) = 1 AS was_correct
+                FROM attempts a
+                CROSS JOIN generate_series(0, :question_count - 1) AS i(position)
+            )
+            SELECT position,
+                   count(*) FILTER (WHERE was_served) AS served,
+                   count(*) FILTER (WHERE was_correct) AS correct,
+                   coalesce(sum(pct) FILTER (WHERE was_served), 0) AS served_score_sum,
+                   coalesce(sum(pct * pct) FILTER (WHERE was_served), 0) AS served_score_sq_sum,
+                   coalesce(sum(pct) FILTER (WHERE was_correct), 0) AS correct_score_sum
+            FROM bits
+            GROUP BY position
+            ORDER BY position
+        """),
+        {"quiz_id": quiz_id, "quiz_version": quiz_version, "question_count": question_count}
+    )
+    return [dict(row._mapping) for row in rows]
+
+
 def get_submission_by_id(db: Session, submission_id: UUID) -> QuizSubmission:
     """
     Get submission by ID with related data.
@@ -145,3 +332,128 @@ def get_submission_by_id(db: Session, submission_id: UUID) -> QuizSubmission:
     return db.query(QuizSubmission).filter(
         QuizSubmission.id == submission_id
     ).first()
+
+
+def get_top_submissions(db: Session, quiz_id: UUID, limit: int) -> List[LeaderboardEntry]:
+    """
+    Get a quiz's best submissions in leaderboard order.
+    
+    Ranked by fraction of questions correct, since pooled attempts may
+    differ in total_questions. Walks ix_quiz_submissions_leaderboard, so
+    only `limit` rows are read.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        limit: Number of entries
+        
+    Returns:
+        Leaderboard entries, best first
+    """
+    rows = db.execute(
+        text("""
+            SELECT s.id, u.email, s.score, s.total_questions, s.submitted_at
+            FROM quiz_submissions s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.quiz_id = :quiz_id
+            ORDER BY coalesce(s.score::float8 / NULLIF(s.total_questions, 0), 0) DESC, s.submitted_at
+            LIMIT :limit
+        """),
+        {"quiz_id": quiz_id, "limit": limit}
+    )
+    return [
+        LeaderboardEntry(
+            submission_id=row.id,
+            name=display_name(row.email),
+            score=row.score,
+            total_questions=row.total_questions,
+            submitted_at=row.submitted_at
+        )
+        for row in rows
+    ]
+
+
+def get_submission_rank(db: Session, quiz_id: UUID, submission_id: UUID) -> Optional[tuple[int, int]]:
+    """
+    Get a submission's leaderboard rank.
+    
+    Rank is one plus the number of better submissions (higher fraction
+    correct, or the same fraction submitted earlier). Each half of the
+    count is a range over ix_quiz_submissions_leaderboard, so both are
+    index-only scans.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        submission_id: Submission UUID
+        
+    Returns:
+        Tuple of (rank, score), or None if the submission is not in this quiz
+    """
+    row = db.execute(
+        text("""
+            WITH target AS (
+                SELECT score, submitted_at,
+                       coalesce(score::float8 / NULLIF(total_questions, 0), 0) AS ratio
+                FROM quiz_submissions
+                WHERE id = :submission_id AND quiz_id = :quiz_id
+            )
+            SELECT t.score,
+                   1 + (SELECT count(*) FROM quiz_submissions
+                        WHERE quiz_id = :quiz_id
+                          AND coalesce(score::float8 / NULLIF(total_questions, 0), 0) > t.ratio)
+                     + (SELECT count(*) FROM quiz_submissions
+                        WHERE quiz_id = :quiz_id
+                          AND coalesce(score::float8 / NULLIF(total_questions, 0), 0) = t.ratio
+                          AND submitted_at < t.submitted_at) AS rank
+            FROM target t
+        """),
+        {"quiz_id": quiz_id, "submission_id": submission_id}
+    ).first()
+    return (row.rank, row.score) if row else None
+
+
+def list_user_submissions(
+    db: Session,
+    user_id: UUID,
+    limit: int,
+    before: Optional[tuple[datetime, UUID]] = None
+) -> list:
+    """
+    Get a page of a user's submissions with quiz titles, newest first.
+    
+    Keyset pagination over ix_quiz_submissions_user_history: each page
+    seeks straight to its start, so deep pages cost the same as the first.
+    Titles come from a join, not from loading Quiz objects.
+    
+    Args:
+        db: Database session
+        user_id: User UUID
+        limit: Maximum number of rows
+        before: (submitted_at, id) of the last row of the previous page
+        
+    Returns:
+        Rows with id, quiz_id, quiz_title, score, total_questions, submitted_at
+    """
+    query = (
+        select(
+            QuizSubmission.id,
+            QuizSubmission.quiz_id,
+            Quiz.title.label("quiz_title"),
+            QuizSubmission.score,
+            QuizSubmission.total_questions,
+            QuizSubmission.submitted_at
+        )
+        .join(Quiz, Quiz.id == QuizSubmission.quiz_id)
+        .where(QuizSubmission.user_id == user_id, Quiz.deleted_at.is_(None))
+        .order_by(QuizSubmission.submitted_at.desc(), QuizSubmission.id.desc())
+        .limit(limit)
+    )
+    if before is not None:
+        # The plain bound lets the planner prune newer partitions, which
+        # it cannot do from the row comparison alone
+        query = query.where(
+            QuizSubmission.submitted_at <= before[0],
+            tuple_(QuizSubmission.submitted_at, QuizSubmission.id) < tuple_(*before)
+        )
+    return db.execute(query).all()
@@ -1,12 +1,16 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
+from app.core.cache import user_id_cache
 from app.models.user import User
+from app.schemas.user import normalize_email
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
-    Get user by email.
+    Get user by email (case-insensitive).
     
     Args:
         db: Database session
@@ -15,7 +19,9 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     Returns:
         User instance or None
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(
+        func.lower(User.email) == normalize_email(email)
+    ).first()
 
 
 def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
@@ -36,6 +42,9 @@ def create_or_get_user(db: Session, email: str) -> User:
     """
     Create a new user or get existing user by email (idempotent operation).
     
+    Uses a single atomic upsert on the lower(email) unique index, so
+    concurrent first submissions for the same email cannot race.
+    
     Args:
         db: Database session
         email: User email
@@ -43,15 +52,69 @@ def create_or_get_user(db: Session, email: str) -> User:
     Returns:
         User instance (existing or newly created)
     """
-    # Check if user already exists
-    existing_user = get_user_by_email(db, email)
-    if existing_user:
-        return existing_user
-    
-    # Create new user
-    user = User(email=email)
-    db.add(user)
+    email = normalize_email(email)
+    stmt = (
+        insert(User)
+        .values(email=email)
+        .on_conflict_do_update(
+            index_elements=[func.lower(User.email)],
+            set_={"email": User.email}
+        )
+        .returning(User)
+    )
+    user = db.scalars(stmt, execution_options={"populate_existing": True}).one()
     db.commit()
-    db.refresh(user)
+    
+    user_id_cache.set(email, user.id)
     
     return user
+
+
+def get_or_create_user_id(db: Session, email: str) -> UUID:
+    """
+    Resolve a quiz taker's user ID, creating the user on first sight.
+    
+    Repeat takers are served from an in-process LRU without a query.
+    
+    Args:
+        db: Database session
+        email: User email
+        
+    Returns:
+        User UUID
+    """
+    email = normalize_email(email)
+    user_id = user_id_cache.get(email)
+    if user_id is not None:
+        return user_id
+    
+    return create_or_get_user(db, email).id
+
+
+def get_or_create_user_ids(db: Session, emails: List[str]) -> Dict[str, UUID]:
+    """
+    Resolve many quiz takers' user IDs with one upsert (no commit).
+    
+    Args:
+        db: Database session
+        emails: User emails
+        
+    Returns:
+        Normalized email -> user UUID
+    """
+    emails = sorted({normalize_email(email) for email in emails})
+    if not emails:
+        return {}
+    stmt = (
+        insert(User)
+        .values([{"email": email} for email in emails])
+        .on_conflict_do_update(
+            index_elements=[func.lower(User.email)],
+            set_={"email": User.email}
+        )
+        .returning(User.id, User.email)
+    )
+    user_ids = {normalize_email(email): user_id for user_id, email in db.execute(stmt)}
+    for email, user_id in user_ids.items():
+        user_id_cache.set(email, user_id)
+    return user_ids
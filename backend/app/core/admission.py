@@ -0,0 +1,199 @@
+from typing import Dict, Optional
+import asyncio
+import json
+import math
+import time
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import settings
+from app.core.database import POOL_SIZE, MAX_OVERFLOW
+from app.core.metrics import register_metrics
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted."""
+    
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class AdmissionGate:
+    """
+    Concurrency limit with a bounded wait queue for one route class.
+    
+    Requests beyond ``limit`` wait in a queue of at most ``max_queue``;
+    a full queue is rejected immediately (429) and a wait longer than
+    ``queue_timeout`` is rejected as unavailable (503).
+    """
+    
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a slot.
+        
+        Args:
+            timeout: Maximum wait (defaults to the gate's queue timeout)
+        
+        Raises:
+            Overloaded: If the queue is full or the wait times out
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise Overloaded(429, f"Too many {self.name} requests queued")
+        
+        self.waiting += 1
+        started = time.monotonic()
+        acquired = False
+        try:
+            wait = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+            # Awaited in this task (not wait_for's inner task), so a timeout
+            # cannot fire after the slot was granted without us knowing
+            async with asyncio.timeout(max(wait, 0)):
+                await self._semaphore.acquire()
+                acquired = True
+        except TimeoutError:
+            if acquired:
+                self._semaphore.release()
+            self.timed_out += 1
+            raise Overloaded(503, f"Timed out waiting for {self.name} capacity")
+        finally:
+            self.waiting -= 1
+        
+        waited = time.monotonic() - started
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.admitted += 1
+        self.in_flight += 1
+    
+    def release(self) -> None:
+        """Free a slot taken by acquire."""
+        self.in_flight -= 1
+        self._semaphore.release()
+    
+    def snapshot(self) -> Dict[str, float]:
+        """Current queue depth, wait times and counters."""
+        return {
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "avg_wait_ms": round(1000 * self.total_wait / self.admitted, 3) if self.admitted else 0.0,
+            "max_wait_ms": round(1000 * self.max_wait, 3),
+        }
+
+
+def _build_gates() -> Dict[str, AdmissionGate]:
+    """Split this worker's DB connections between the route classes."""
+    connections = POOL_SIZE + MAX_OVERFLOW
+    shares = {
+        "submit": settings.ADMISSION_SUBMIT_SHARE,
+        "public_read": settings.ADMISSION_PUBLIC_SHARE,
+        "admin": settings.ADMISSION_ADMIN_SHARE,
+    }
+    gates = {}
+    for name, share in shares.items():
+        limit = max(1, math.floor(connections * share))
+        gates[name] = AdmissionGate(
+            name,
+            limit=limit,
+            max_queue=limit * settings.ADMISSION_QUEUE_FACTOR,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        )
+    return gates
+
+
+gates = _build_gates()
+register_metrics("admission", lambda: {name: gate.snapshot() for name, gate in gates.items()})
+
+
+def total_admission_limit() -> int:
+    """Concurrent requests admitted across all route classes."""
+    return sum(gate.limit for gate in gates.values())
+
+
+def classify_request(method: str, path: str) -> Optional[str]:
+    """
+    Map a request to its route class.
+    
+    Args:
+        method: HTTP method
+        path: URL path
+        
+    Returns:
+        Route class name, or None for ungoverned routes (health, docs,
+        draft autosave, which only reads the database when a quiz's
+        submission limits are not cached, and long-lived live streams)
+    """
+    if path.endswith("/draft") or path.endswith("/live"):
+        return None
+    if path.startswith("/api/public/") or path.startswith("/api/users/"):
+        if method == "GET":
+            return "public_read"
+        return "submit"
+    if path.startswith("/api/quizzes") or path.startswith("/api/auth/") or path.startswith("/api/live/"):
+        return "admin"
+    return None
+
+
+class AdmissionControlMiddleware:
+    """Admit requests per route class and shed load with 429/503 + Retry-After."""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        
+        route_class = classify_request(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+        
+        gate = gates[route_class]
+        deadline = scope.get("state", {}).get("deadline")
+        try:
+            await gate.acquire(deadline.remaining() if deadline is not None else None)
+        except Overloaded as e:
+            await _send_overloaded(send, e)
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+
+async def _send_overloaded(send: Send, error: Overloaded) -> None:
+    body = json.dumps({"detail": error.detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": error.status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,293 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Iterable, List, Optional, Union
+import time
+from app.core.config import settings
+from app.core.metrics import register_metrics
+
+
+class LRUCache:
+    """Thread-safe bounded LRU mapping with an optional per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime for this entry (defaults to the cache TTL)
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SharedCache:
+    """
+    Namespaced view of the configured serialized-value backend
+    (see app.core.cache_backends).
+
+    Values are pre-serialized bytes, so with a shared backend every worker
+    on the host reuses one copy instead of building its own.
+    """
+
+    def __init__(self, namespace: str, ttl: Optional[float] = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._backend = None
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            from app.core.cache_backends import get_cache_backend
+            self._backend = get_cache_backend()
+        return self._backend
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Key within this namespace
+
+        Returns:
+            Stored bytes or None on a miss
+        """
+        value = self.backend.get(f"{self.namespace}:{key}")
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value with this namespace's TTL.
+
+        Args:
+            key: Key within this namespace
+            value: Serialized value
+        """
+        self.backend.set(f"{self.namespace}:{key}", value, self.ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        self.backend.delete(f"{self.namespace}:{key}")
+
+    def clear(self) -> None:
+        """Remove all entries from the backend (every namespace shares it)."""
+        self.backend.clear()
+
+    def snapshot(self) -> dict:
+        """Hit and miss counters for metrics."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Caches keyed by quiz ID (as string); every one of them is flushed for a quiz
+# whenever that quiz or any of its questions change.
+_quiz_caches: List[Union[LRUCache, SharedCache]] = []
+
+# Invalidation clock for this process: each invalidation ticks it and records
+# the tick per quiz, so a reader can tell whether its quiz was invalidated
+# while it was loading from the database. Only the most recent quizzes are
+# remembered; anything older counts as invalidated at _forgotten_tick.
+_RECENT_INVALIDATIONS = 10_000
+_invalidation_lock = Lock()
+_invalidation_tick = 0
+_invalidated_at: "OrderedDict[str, int]" = OrderedDict()
+_forgotten_tick = 0
+
+
+def register_quiz_cache(cache: Union[LRUCache, SharedCache]) -> Union[LRUCache, SharedCache]:
+    """
+    Register a cache whose keys are quiz IDs so it takes part in invalidation.
+
+    Args:
+        cache: Cache keyed by quiz ID string
+
+    Returns:
+        The same cache, for use at module level
+    """
+    _quiz_caches.append(cache)
+    return cache
+
+
+def _record_invalidation(keys: List[str]) -> None:
+    global _invalidation_tick, _forgotten_tick
+    with _invalidation_lock:
+        _invalidation_tick += 1
+        for key in keys:
+            _invalidated_at[key] = _invalidation_tick
+            _invalidated_at.move_to_end(key)
+        while len(_invalidated_at) > _RECENT_INVALIDATIONS:
+            _, tick = _invalidated_at.popitem(last=False)
+            _forgotten_tick = max(_forgotten_tick, tick)
+
+
+def quiz_cache_generation() -> int:
+    """
+    Current invalidation tick, to capture before loading a quiz for a cache.
+
+    Returns:
+        Token to pass to set_if_not_invalidated
+    """
+    with _invalidation_lock:
+        return _invalidation_tick
+
+
+def set_if_not_invalidated(
+    cache: Union[LRUCache, SharedCache], quiz_id: Any, value: Any, generation: int
+) -> bool:
+    """
+    Cache a quiz representation unless the quiz was invalidated after
+    `generation` was captured, so a reader that loaded the quiz before a
+    concurrent write committed never puts its stale copy back.
+
+    The entry is written first and checked after: an invalidation recorded
+    before the check is caught here, one recorded after deletes the entry.
+
+    Args:
+        cache: Registered quiz cache
+        quiz_id: Quiz UUID
+        value: Value to store
+        generation: Result of quiz_cache_generation() taken before the read
+
+    Returns:
+        True if the value was kept
+    """
+    key = str(quiz_id)
+    cache.set(key, value)
+    with _invalidation_lock:
+        invalidated = _invalidated_at.get(key, _forgotten_tick) > generation
+    if invalidated:
+        cache.delete(key)
+    return not invalidated
+
+
+def invalidate_quiz(quiz_id: Any) -> None:
+    """
+    Drop every cached representation of a single quiz.
+
+    Args:
+        quiz_id: Quiz UUID
+    """
+    key = str(quiz_id)
+    _record_invalidation([key])
+    for cache in _quiz_caches:
+        cache.delete(key)
+
+
+def invalidate_quizzes(quiz_ids: Iterable[Any]) -> None:
+    """
+    Drop every cached representation of several quizzes at once.
+    
+    Args:
+        quiz_ids: Quiz UUIDs
+    """
+    keys = [str(quiz_id) for quiz_id in quiz_ids]
+    _record_invalidation(keys)
+    for cache in _quiz_caches:
+        for key in keys:
+            cache.delete(key)
+
+
+def flush_quiz_caches() -> None:
+    """Drop every cached quiz representation, e.g. after missed invalidations."""
+    global _invalidation_tick, _forgotten_tick
+    with _invalidation_lock:
+        _invalidation_tick += 1
+        _forgotten_tick = _invalidation_tick
+        _invalidated_at.clear()
+    for cache in _quiz_caches:
+        cache.clear()
+
+
+# Public (answer-free) quiz representations served to quiz takers
+public_quiz_cache = register_quiz_cache(
+    LRUCache(maxsize=settings.QUIZ_CACHE_SIZE, ttl=settings.QUIZ_CACHE_TTL_SECONDS)
+)
+
+# Serialized public quiz bodies ("<etag>\n<json>"); precompressed variants
+# live under "<quiz_id>@<etag>:<encoding>" and age out with the TTL
+public_quiz_payload_cache = register_quiz_cache(
+    SharedCache("public", ttl=settings.QUIZ_CACHE_TTL_SECONDS)
+)
+
+# Answer keys used to grade submissions without loading the quiz ORM graph
+grading_key_cache = register_quiz_cache(
+    SharedCache("grading", ttl=settings.QUIZ_CACHE_TTL_SECONDS)
+)
+
+register_metrics("cache", lambda: {
+    "backend": settings.CACHE_BACKEND,
+    "public": public_quiz_payload_cache.snapshot(),
+    "grading": grading_key_cache.snapshot(),
+})
+
+# Question IDs grouped by question type, the pool attempts are drawn from
+question_pool_cache = register_quiz_cache(
+    LRUCache(maxsize=settings.QUIZ_CACHE_SIZE, ttl=settings.QUIZ_CACHE_TTL_SECONDS)
+)
+
+# Allowed answer keys, per-answer length caps and body size per quiz
+submission_limits_cache = register_quiz_cache(
+    LRUCache(maxsize=settings.QUIZ_CACHE_SIZE, ttl=settings.QUIZ_CACHE_TTL_SECONDS)
+)
+
+# Admin dashboard pages keyed by (admin ID, limit, cursor); not invalidated
+# per quiz, so the TTL is kept short
+quiz_summary_cache = LRUCache(maxsize=settings.QUIZ_CACHE_SIZE, ttl=settings.QUIZ_SUMMARY_CACHE_TTL_SECONDS)
+
+# Normalized email -> user ID for quiz takers; users are never deleted or
+# renamed, so entries never go stale and need no TTL
+user_id_cache = LRUCache(maxsize=settings.USER_ID_CACHE_SIZE)
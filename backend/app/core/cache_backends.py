@@ -0,0 +1,358 @@
+from abc import ABC, abstractmethod
+from threading import Lock, local
+from typing import Iterator, Optional
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import socket
+import struct
+import time
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Interface for stores of pre-serialized values keyed by string."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a stored value, or None on a miss or an expired entry."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store a value for ttl seconds (None = until evicted)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def open(self) -> None:
+        """Acquire resources up front so misconfiguration fails at startup."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU; each worker keeps its own copy."""
+
+    def __init__(self, maxsize: int):
+        self._data = LRUCache(maxsize=maxsize)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._data.get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._data.set(key, bytes(value), ttl)
+
+    def delete(self, key: str) -> None:
+        self._data.delete(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Slot header: sequence, key hash (0 = empty), expiry (epoch seconds, 0 = none),
+# key length, value length; the key follows, then the value at _VALUE_OFFSET
+_HEADER = struct.Struct("<QQdHI2x")
+_SEQ = struct.Struct("<Q")
+_KEY_MAX = 224
+_VALUE_OFFSET = _HEADER.size + _KEY_MAX
+_PROBE_SLOTS = 8
+_READ_RETRIES = 4
+
+
+def _key_hash(key: bytes) -> int:
+    # Stable across processes (unlike hash()); never 0, which marks empty slots
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") | 1
+
+
+class SharedMemoryCacheBackend(CacheBackend):
+    """
+    Fixed-slot hash table in a memory-mapped file shared by every worker on
+    the host (put it on tmpfs, e.g. /dev/shm).
+
+    The file name carries the geometry, so a worker started with other
+    settings maps its own file instead of resizing one that others still
+    have mapped. The file's pages are allocated up front: a tmpfs too
+    small for it (Docker's /dev/shm is 64 MB by default) fails open()
+    instead of raising SIGBUS on a later write.
+
+    Each key may live in one of _PROBE_SLOTS consecutive slots; when all
+    are taken the entry expiring soonest is evicted. Writers serialize on
+    an flock; readers take no lock and instead validate a per-slot
+    sequence number (odd while a write is in progress, changed after it),
+    retrying on a torn read. Values larger than a slot are not cached.
+    """
+
+    def __init__(self, path: str, slots: int, slot_bytes: int):
+        if slot_bytes <= _VALUE_OFFSET:
+            raise ValueError(f"Cache slots must be larger than {_VALUE_OFFSET} bytes")
+        self.path = f"{path}.{slots}x{slot_bytes}"
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.value_capacity = slot_bytes - _VALUE_OFFSET
+        self._lock = Lock()
+        self._pid: Optional[int] = None
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+
+    def open(self) -> None:
+        self._mapping()
+
+    def _mapping(self) -> mmap.mmap:
+        # Mappings and flocks are reopened after a fork so each worker has its own
+        if self._pid == os.getpid():
+            return self._map
+
+        with self._lock:
+            if self._pid != os.getpid():
+                size = self.slots * self.slot_bytes
+                file = open(self.path, "a+b")
+                fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    if os.fstat(file.fileno()).st_size < size:
+                        # New file: allocate every page now (new pages read as empty slots)
+                        try:
+                            os.posix_fallocate(file.fileno(), 0, size)
+                        except OSError as e:
+                            file.close()
+                            raise RuntimeError(
+                                f"Shared cache {self.path} needs {size} bytes: {e}. Lower "
+                                "CACHE_SHM_SIZE_BYTES or enlarge the filesystem (Docker: --shm-size)"
+                            ) from e
+                finally:
+                    if not file.closed:
+                        fcntl.flock(file, fcntl.LOCK_UN)
+                self._file = file
+                self._map = mmap.mmap(file.fileno(), size)
+                self._pid = os.getpid()
+        return self._map
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        start = key_hash % self.slots
+        for step in range(min(_PROBE_SLOTS, self.slots)):
+            yield ((start + step) % self.slots) * self.slot_bytes
+
+    def _write_lock(self):
+        return _FileLock(self._lock, self._file)
+
+    def get(self, key: str) -> Optional[bytes]:
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        mm = self._mapping()
+
+        for offset in self._probe(key_hash):
+            for _ in range(_READ_RETRIES):
+                seq, slot_hash, expires_at, key_len, value_len = _HEADER.unpack_from(mm, offset)
+                if seq & 1:
+                    continue
+                if slot_hash != key_hash:
+                    break
+
+                key_start = offset + _HEADER.size
+                value_start = offset + _VALUE_OFFSET
+                stored_key = mm[key_start:key_start + key_len]
+                value = mm[value_start:value_start + value_len]
+                if _SEQ.unpack_from(mm, offset)[0] != seq:
+                    continue  # Overwritten while copying
+
+                if stored_key != key_bytes:
+                    break
+                if expires_at and expires_at < time.time():
+                    return None
+                return value
+        return None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        key_bytes = key.encode()
+        if len(key_bytes) > _KEY_MAX or len(value) > self.value_capacity:
+            return
+
+        key_hash = _key_hash(key_bytes)
+        expires_at = time.time() + ttl if ttl else 0.0
+        mm = self._mapping()
+
+        with self._write_lock():
+            target = self._find_slot(mm, key_hash, key_bytes)
+            seq = _SEQ.unpack_from(mm, target)[0] | 1
+            _SEQ.pack_into(mm, target, seq)
+            key_start = target + _HEADER.size
+            value_start = target + _VALUE_OFFSET
+            mm[key_start:key_start + len(key_bytes)] = key_bytes
+            mm[value_start:value_start + len(value)] = value
+            _HEADER.pack_into(mm, target, seq, key_hash, expires_at, len(key_bytes), len(value))
+            _SEQ.pack_into(mm, target, seq + 1)
+
+    def _find_slot(self, mm: mmap.mmap, key_hash: int, key_bytes: bytes) -> int:
+        # Same key first, then a free or expired slot, then the soonest to expire
+        now = time.time()
+        free = None
+        victim = None
+        victim_expiry = None
+        for offset in self._probe(key_hash):
+            _, slot_hash, expires_at, key_len, _ = _HEADER.unpack_from(mm, offset)
+            if slot_hash == key_hash:
+                key_start = offset + _HEADER.size
+                if mm[key_start:key_start + key_len] == key_bytes:
+                    return offset
+            if free is None and (slot_hash == 0 or (expires_at and expires_at < now)):
+                free = offset
+            expiry = expires_at or float("inf")
+            if victim is None or expiry < victim_expiry:
+                victim, victim_expiry = offset, expiry
+        return free if free is not None else victim
+
+    def delete(self, key: str) -> None:
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        mm = self._mapping()
+
+        with self._write_lock():
+            for offset in self._probe(key_hash):
+                seq, slot_hash, _, key_len, _ = _HEADER.unpack_from(mm, offset)
+                key_start = offset + _HEADER.size
+                if slot_hash == key_hash and mm[key_start:key_start + key_len] == key_bytes:
+                    self._clear_slot(mm, offset, seq)
+
+    def clear(self) -> None:
+        mm = self._mapping()
+        with self._write_lock():
+            for index in range(self.slots):
+                offset = index * self.slot_bytes
+                seq, slot_hash, *_ = _HEADER.unpack_from(mm, offset)
+                if slot_hash:
+                    self._clear_slot(mm, offset, seq)
+
+    @staticmethod
+    def _clear_slot(mm: mmap.mmap, offset: int, seq: int) -> None:
+        seq |= 1
+        _SEQ.pack_into(mm, offset, seq)
+        _HEADER.pack_into(mm, offset, seq, 0, 0.0, 0, 0)
+        _SEQ.pack_into(mm, offset, seq + 1)
+
+
+class _FileLock:
+    """Thread lock plus an exclusive flock, for cross-process writers."""
+
+    def __init__(self, lock: Lock, file):
+        self.lock = lock
+        self.file = file
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def __exit__(self, *exc_info):
+        try:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+        finally:
+            self.lock.release()
+
+
+# Cache server wire format. Request: op (G/S/D/C), key length, TTL, value
+# length, then key and value bytes. Response: status (H hit, M miss, K ok)
+# and value length, then the value.
+REQUEST = struct.Struct("<cHdI")
+RESPONSE = struct.Struct("<cI")
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes or raise ConnectionError."""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Cache connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def parse_address(address: str) -> tuple:
+    """Split "host:port" into a socket address."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class ServerCacheBackend(CacheBackend):
+    """
+    Client for the local cache server (app.core.cache_server), a stand-in
+    for an external cache in tests and on hosts without shared memory.
+
+    Connection failures count as misses so the cache never fails a request.
+    """
+
+    def __init__(self, address: str, timeout: float):
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self._local = local()
+
+    def _request(self, op: bytes, key: str, value: bytes = b"", ttl: Optional[float] = None) -> tuple:
+        key_bytes = key.encode()
+        sock = getattr(self._local, "sock", None)
+        try:
+            if sock is None:
+                sock = socket.create_connection(self.address, timeout=self.timeout)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._local.sock = sock
+            sock.sendall(REQUEST.pack(op, len(key_bytes), ttl or 0.0, len(value)) + key_bytes + value)
+            status, length = RESPONSE.unpack(recv_exact(sock, RESPONSE.size))
+            return status, recv_exact(sock, length) if length else b""
+        except OSError:
+            logger.warning("Cache server request failed", exc_info=True)
+            if sock is not None:
+                sock.close()
+            self._local.sock = None
+            return b"M", b""
+
+    def get(self, key: str) -> Optional[bytes]:
+        status, value = self._request(b"G", key)
+        return value if status == b"H" else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._request(b"S", key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self._request(b"D", key)
+
+    def clear(self) -> None:
+        self._request(b"C", "")
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the process-wide cache backend selected by CACHE_BACKEND."""
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    with _backend_lock:
+        if _backend is not None:
+            return _backend
+        if settings.CACHE_BACKEND == "shm":
+            _backend = SharedMemoryCacheBackend(
+                settings.CACHE_SHM_PATH,
+                slots=settings.CACHE_SHM_SIZE_BYTES // settings.CACHE_SHM_SLOT_BYTES,
+                slot_bytes=settings.CACHE_SHM_SLOT_BYTES
+            )
+        elif settings.CACHE_BACKEND == "server":
+            _backend = ServerCacheBackend(
+                settings.CACHE_SERVER_ADDRESS,
+                timeout=settings.CACHE_SERVER_TIMEOUT_SECONDS
+            )
+        else:
+            _backend = MemoryCacheBackend(maxsize=settings.QUIZ_CACHE_SIZE * 4)
+    return _backend
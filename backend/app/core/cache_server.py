@@ -0,0 +1,86 @@
+"""
+Minimal local cache server for the "server" cache backend.
+
+Stands in for an external cache (tests, hosts without /dev/shm):
+``python -m app.core.cache_server --address 127.0.0.1:11311``.
+"""
+from typing import Optional
+import argparse
+import socketserver
+import threading
+from app.core.cache_backends import (
+    REQUEST, RESPONSE, MemoryCacheBackend, parse_address, recv_exact
+)
+
+
+class _CacheRequestHandler(socketserver.BaseRequestHandler):
+    """Serves requests on one client connection until it closes."""
+
+    def handle(self) -> None:
+        store: MemoryCacheBackend = self.server.store
+        sock = self.request
+        while True:
+            try:
+                op, key_len, ttl, value_len = REQUEST.unpack(recv_exact(sock, REQUEST.size))
+                key = recv_exact(sock, key_len).decode() if key_len else ""
+                value = recv_exact(sock, value_len) if value_len else b""
+            except ConnectionError:
+                return
+
+            if op == b"G":
+                found = store.get(key)
+                if found is None:
+                    sock.sendall(RESPONSE.pack(b"M", 0))
+                else:
+                    sock.sendall(RESPONSE.pack(b"H", len(found)) + found)
+                continue
+
+            if op == b"S":
+                store.set(key, value, ttl or None)
+            elif op == b"D":
+                store.delete(key)
+            elif op == b"C":
+                store.clear()
+            sock.sendall(RESPONSE.pack(b"K", 0))
+
+
+class CacheServer(socketserver.ThreadingTCPServer):
+    """Threaded TCP server holding one in-memory LRU."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple, maxsize: int):
+        super().__init__(address, _CacheRequestHandler)
+        self.store = MemoryCacheBackend(maxsize=maxsize)
+
+
+def start_cache_server(address: str = "127.0.0.1:0", maxsize: int = 4096) -> CacheServer:
+    """
+    Start a cache server on a background thread (for tests).
+
+    Args:
+        address: "host:port" to bind (port 0 picks a free one)
+        maxsize: Maximum number of entries
+
+    Returns:
+        Running server; its server_address holds the bound port
+    """
+    server = CacheServer(parse_address(address), maxsize)
+    threading.Thread(target=server.serve_forever, name="cache-server", daemon=True).start()
+    return server
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the cache server until interrupted."""
+    parser = argparse.ArgumentParser(description="Run the local quiz cache server")
+    parser.add_argument("--address", default="127.0.0.1:11311")
+    parser.add_argument("--maxsize", type=int, default=16384)
+    args = parser.parse_args(argv)
+
+    with CacheServer(parse_address(args.address), args.maxsize) as server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+from threading import Lock
+from typing import Dict, Optional
+import gzip
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.cache import SharedCache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+def supported_encodings() -> tuple:
+    """Content encodings this process can produce, in preference order."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best content encoding acceptable to the client.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        "br", "gzip" or None for identity
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in supported_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: "br" or "gzip"
+        static: Use the slower, denser settings meant for payloads
+            compressed once and served many times
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        quality = settings.PRECOMPRESS_BROTLI_QUALITY if static else settings.BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+
+    level = settings.PRECOMPRESS_GZIP_LEVEL if static else settings.GZIP_COMPRESSLEVEL
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class PrecompressedPayload:
+    """
+    Serialized response body whose compressed variants are built at most
+    once and reused for every later request.
+
+    With a store, variants are kept in that shared cache under
+    "<store_key>:<encoding>" so other workers reuse them too.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: Optional[str] = None,
+        media_type: str = "application/json",
+        store: Optional[SharedCache] = None,
+        store_key: Optional[str] = None
+    ):
+        self.body = body
+        self.etag = etag
+        self.media_type = media_type
+        self.store = store
+        self.store_key = store_key
+        self._variants: Dict[str, bytes] = {}
+        self._lock = Lock()
+
+    def variant(self, encoding: str) -> bytes:
+        """
+        Get the body compressed with the given encoding, building it once.
+
+        Args:
+            encoding: "br" or "gzip"
+
+        Returns:
+            Compressed bytes
+        """
+        compressed = self._variants.get(encoding)
+        if compressed is None:
+            with self._lock:
+                compressed = self._variants.get(encoding)
+                if compressed is None and self.store is not None:
+                    compressed = self.store.get(f"{self.store_key}:{encoding}")
+                if compressed is None:
+                    compressed = compress(self.body, encoding, static=True)
+                    if self.store is not None:
+                        self.store.set(f"{self.store_key}:{encoding}", compressed)
+                self._variants[encoding] = compressed
+        return compressed
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Build a response negotiated against the request headers.
+
+        Answers a matching If-None-Match with 304 and otherwise serves the
+        best precompressed variant the client accepts.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            Starlette Response
+        """
+        headers = {"Vary": "Accept-Encoding"}
+        if self.etag:
+            headers["ETag"] = self.etag
+            if_none_match = request.headers.get("if-none-match", "")
+            if self.etag in [tag.strip() for tag in if_none_match.split(",")]:
+                return Response(status_code=304, headers=headers)
+
+        content = self.body
+        encoding = None
+        if len(self.body) >= settings.COMPRESSION_MINIMUM_SIZE:
+            encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            content = self.variant(encoding)
+
+        return Response(content=content, media_type=self.media_type, headers=headers)
+
+
+class _StreamCompressor:
+    """Incremental compressor for streamed response bodies."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(settings.GZIP_COMPRESSLEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Negotiate brotli/gzip compression through Accept-Encoding.
+
+    Responses below the minimum size, already-encoded responses (such as
+    precompressed payloads) and event streams pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self.app, encoding, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    """Per-request state for CompressionMiddleware."""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Hold the start message until the first body chunk decides the headers
+            headers = Headers(raw=message["headers"])
+            self.start_message = message
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+            )
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            if not more_body and len(body) < self.minimum_size:
+                await self._flush_start()
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(scope=self.start_message)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                compressed = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await self._flush_start()
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding)
+            await self._flush_start()
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self.send(self.start_message)
+            self.start_message = None
@@ -1,14 +1,20 @@
-from sqlalchemy import create_engine
+from fastapi import HTTPException, Request, status
+from threading import Lock
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import settings, db_pool_limits
+
+# Per-worker pool sized from the total connection budget
+POOL_SIZE, MAX_OVERFLOW = db_pool_limits()
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
 )
 
 # Create SessionLocal class
@@ -18,13 +24,73 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-def get_db():
+@event.listens_for(SessionLocal, "after_begin")
+def apply_statement_timeout(session, transaction, connection):
+    """
+    Bound every transaction of a request-scoped session by the request's
+    remaining deadline (SET LOCAL only lasts one transaction, so this runs
+    again after each commit).
+    """
+    deadline = session.info.get("deadline")
+    if deadline is None:
+        return
+    
+    with session.info["cancel_lock"]:
+        session.info["dbapi_connection"] = connection.connection.dbapi_connection
+    remaining_ms = max(1, int(deadline.remaining() * 1000))
+    connection.exec_driver_sql(
+        "SELECT set_config('statement_timeout', %s, true)", (str(remaining_ms),)
+    )
+
+
+@event.listens_for(SessionLocal, "after_commit")
+@event.listens_for(SessionLocal, "after_rollback")
+def release_cancel_target(session):
+    """
+    Forget the transaction's connection before it goes back to the pool,
+    so a late cancel can never hit a statement of another request.
+    """
+    lock = session.info.get("cancel_lock")
+    if lock is not None:
+        with lock:
+            session.info.pop("dbapi_connection", None)
+
+
+def get_db(request: Request):
     """
     Dependency function to get database session.
     Yields a database session and ensures it's closed after use.
+    
+    When the request carries a deadline, statements are limited to the
+    remaining budget and the running statement is cancelled if the client
+    disconnects or the deadline passes.
     """
+    deadline = request.scope.get("state", {}).get("deadline")
+    if deadline is not None and deadline.remaining() <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Request deadline exceeded"
+        )
+    
     db = SessionLocal()
+    if deadline is not None:
+        db.info["deadline"] = deadline
+        db.info["cancel_lock"] = Lock()
+        deadline.on_cancel(lambda: _cancel_running_statement(db))
     try:
         yield db
     finally:
+        release_cancel_target(db)
         db.close()
+
+
+def _cancel_running_statement(db) -> None:
+    """
+    Ask Postgres to cancel whatever the session's connection is running,
+    if the session still has a transaction (and so the connection) open.
+    The lock keeps the connection from being released mid-cancel.
+    """
+    with db.info["cancel_lock"]:
+        dbapi_connection = db.info.get("dbapi_connection")
+        if dbapi_connection is not None:
+            dbapi_connection.cancel()
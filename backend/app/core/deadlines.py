@@ -0,0 +1,163 @@
+from typing import Callable, List, Optional
+import asyncio
+import logging
+import math
+import threading
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.admission import classify_request
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Header clients (or the load balancer) use to pass their remaining budget, in seconds
+DEADLINE_HEADER = b"x-request-timeout"
+
+
+class Deadline:
+    """
+    Time budget for one request, plus hooks that abort its in-flight work.
+
+    Cancel callbacks (e.g. cancelling the running SQL statement) fire when
+    the client disconnects or the deadline passes.
+    """
+
+    def __init__(self, timeout: float):
+        self.expires_at = time.monotonic() + timeout
+        self.cancelled = False
+        self._cancel_lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (may be negative)."""
+        return self.expires_at - time.monotonic()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run if the request is cancelled."""
+        self._callbacks.append(callback)
+
+    def cancel(self) -> None:
+        """Run every cancel callback once (timer and disconnect may race)."""
+        with self._cancel_lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Request cancel callback failed")
+
+
+# Streamed bulk import/export run as one long transaction or response
+TRANSFER_PATHS = ("/api/quizzes/import", "/api/quizzes/export")
+
+
+def parse_requested_timeout(value: bytes) -> Optional[float]:
+    """Seconds asked for in an X-Request-Timeout header (None unless finite and positive)."""
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(timeout) or timeout <= 0:
+        return None
+    return timeout
+
+
+def route_timeout(route_class: Optional[str], path: str = "") -> Optional[float]:
+    """Default time budget for a route class or transfer path (None = no deadline)."""
+    if path in TRANSFER_PATHS:
+        return settings.REQUEST_TIMEOUT_TRANSFER_SECONDS or None
+    return {
+        "submit": settings.REQUEST_TIMEOUT_SUBMIT_SECONDS,
+        "public_read": settings.REQUEST_TIMEOUT_PUBLIC_SECONDS,
+        "admin": settings.REQUEST_TIMEOUT_ADMIN_SECONDS,
+    }.get(route_class)
+
+
+class DeadlineMiddleware:
+    """
+    Attach a Deadline to each governed request and cancel its work when
+    the client disconnects or the budget runs out.
+
+    The budget comes from the X-Request-Timeout header (seconds, capped at
+    REQUEST_TIMEOUT_MAX_SECONDS or the route's longer default) or the
+    route class default; quiz import/export get REQUEST_TIMEOUT_TRANSFER_SECONDS.
+    Header values that are not finite and positive are ignored.
+
+    Cancel callbacks block (they take a lock and talk to Postgres), so they
+    run in the loop's default executor, never on the event loop itself.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = route_timeout(classify_request(scope["method"], scope["path"]), scope["path"])
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == DEADLINE_HEADER:
+                requested = parse_requested_timeout(value)
+                if requested is not None:
+                    timeout = min(requested, max(timeout, settings.REQUEST_TIMEOUT_MAX_SECONDS))
+                break
+
+        deadline = Deadline(timeout)
+        scope.setdefault("state", {})["deadline"] = deadline
+
+        loop = asyncio.get_running_loop()
+
+        def cancel() -> None:
+            loop.run_in_executor(None, deadline.cancel)
+
+        timer = loop.call_later(max(timeout, 0), cancel)
+        disconnected = asyncio.Event()
+        watcher: Optional[asyncio.Task] = None
+
+        # Without a body the disconnect watcher can start right away
+        headers = dict(scope["headers"])
+        has_body = b"content-length" in headers or b"transfer-encoding" in headers
+        body_complete = not has_body
+        empty_body_pending = not has_body
+
+        async def watch_disconnect() -> None:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+                cancel()
+
+        async def wrapped_receive() -> Message:
+            nonlocal body_complete, watcher, empty_body_pending
+            if empty_body_pending:
+                empty_body_pending = False
+                return {"type": "http.request", "body": b"", "more_body": False}
+            if body_complete:
+                # The watcher owns the real receive channel once the body is read
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+                cancel()
+            elif not message.get("more_body", False):
+                body_complete = True
+                watcher = asyncio.create_task(watch_disconnect())
+            return message
+
+        if body_complete:
+            watcher = asyncio.create_task(watch_disconnect())
+
+        try:
+            await self.app(scope, wrapped_receive, send)
+        finally:
+            timer.cancel()
+            if watcher is not None:
+                watcher.cancel()
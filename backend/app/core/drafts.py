@@ -0,0 +1,197 @@
+from abc import ABC, abstractmethod
+from threading import Lock, Thread, local
+from typing import Dict, Optional
+import atexit
+import json
+import logging
+import sqlite3
+import time
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Stored in place of a submitted attempt's draft so a save that was still
+# in flight on another worker cannot bring the draft back
+_TOMBSTONE = "null"
+
+# Attempts this worker deleted recently; their late saves are dropped locally
+_RECENT_DELETES = 10_000
+
+
+class DraftStore(ABC):
+    """Interface for storing in-progress attempt answers (drafts)."""
+
+    @abstractmethod
+    def save(self, attempt_id: str, answers: Dict[str, str]) -> None:
+        """Replace the draft answers for an attempt (ignored once deleted)."""
+
+    @abstractmethod
+    def load(self, attempt_id: str) -> Optional[Dict[str, str]]:
+        """Get the draft answers for an attempt, or None if there are none."""
+
+    @abstractmethod
+    def delete(self, attempt_id: str) -> None:
+        """Discard an attempt's draft for good (the attempt was submitted)."""
+
+
+class MemoryDraftStore(DraftStore):
+    """Per-process draft store; suitable for a single worker."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._drafts = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def save(self, attempt_id: str, answers: Dict[str, str]) -> None:
+        with self._lock:
+            if self._drafts.get(attempt_id) is not _TOMBSTONE:
+                self._drafts.set(attempt_id, dict(answers))
+
+    def load(self, attempt_id: str) -> Optional[Dict[str, str]]:
+        answers = self._drafts.get(attempt_id)
+        return dict(answers) if answers is not None and answers is not _TOMBSTONE else None
+
+    def delete(self, attempt_id: str) -> None:
+        with self._lock:
+            self._drafts.set(attempt_id, _TOMBSTONE)
+
+
+class SQLiteDraftStore(DraftStore):
+    """
+    Host-local draft store shared by all workers through a SQLite file.
+
+    Saves are coalesced in memory and written by a background thread in
+    one transaction per flush interval, so write volume is bounded by the
+    number of distinct attempts per interval rather than by request rate.
+    A load reads through this worker's unflushed draft, and a delete drops
+    it before writing a tombstone; flushes never overwrite a tombstone, so
+    a draft buffered on any worker cannot come back after a submit. A
+    draft saved on another worker reaches the file within one interval.
+    """
+
+    def __init__(self, path: str, ttl: float, flush_interval: float):
+        self.path = path
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, tuple[float, str]] = {}  # attempt_id -> (saved_at, answers JSON)
+        self._flushing: Dict[str, tuple[float, str]] = {}  # Taken by the flush in progress
+        self._deleted = LRUCache(maxsize=_RECENT_DELETES, ttl=ttl)
+        self._lock = Lock()
+        self._local = local()
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS drafts ("
+            "attempt_id TEXT PRIMARY KEY, answers TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+        Thread(target=self._run, name="draft-flusher", daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save(self, attempt_id: str, answers: Dict[str, str]) -> None:
+        entry = (time.time(), json.dumps(answers))
+        with self._lock:
+            if self._deleted.get(attempt_id) is None:
+                self._pending[attempt_id] = entry
+
+    def load(self, attempt_id: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            entry = self._pending.get(attempt_id) or self._flushing.get(attempt_id)
+        if entry is not None:
+            return json.loads(entry[1])
+
+        row = self._connect().execute(
+            "SELECT answers FROM drafts WHERE attempt_id = ? AND updated_at > ?",
+            (attempt_id, time.time() - self.ttl)
+        ).fetchone()
+        return json.loads(row[0]) if row else None  # The tombstone decodes to None
+
+    def delete(self, attempt_id: str) -> None:
+        with self._lock:
+            self._deleted.set(attempt_id, True)
+            self._pending.pop(attempt_id, None)
+            self._flushing.pop(attempt_id, None)
+        self._connect().execute(
+            "INSERT INTO drafts (attempt_id, answers, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(attempt_id) DO UPDATE SET "
+            "answers = excluded.answers, updated_at = excluded.updated_at",
+            (attempt_id, _TOMBSTONE, time.time())
+        )
+
+    def flush(self) -> None:
+        """Write all pending drafts in a single transaction."""
+        with self._lock:
+            self._flushing, self._pending = self._pending, {}
+            pending = self._flushing
+        if not pending:
+            return
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO drafts (attempt_id, answers, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(attempt_id) DO UPDATE SET "
+                "answers = excluded.answers, updated_at = excluded.updated_at "
+                "WHERE drafts.answers <> ?",
+                [
+                    (attempt_id, answers, saved_at, _TOMBSTONE)
+                    for attempt_id, (saved_at, answers) in pending.items()
+                ]
+            )
+            conn.execute("DELETE FROM drafts WHERE updated_at < ?", (time.time() - self.ttl,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            # Put the drafts back unless a newer save or a delete came meanwhile
+            with self._lock:
+                for attempt_id, entry in self._flushing.items():
+                    self._pending.setdefault(attempt_id, entry)
+                self._flushing = {}
+            raise
+        with self._lock:
+            self._flushing = {}
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush attempt drafts")
+
+
+_draft_store: Optional[DraftStore] = None
+_draft_store_lock = Lock()
+
+
+def get_draft_store() -> DraftStore:
+    """Get the process-wide draft store selected by DRAFT_STORE."""
+    global _draft_store
+    if _draft_store is not None:
+        return _draft_store
+    
+    with _draft_store_lock:
+        if _draft_store is not None:
+            return _draft_store
+        if settings.DRAFT_STORE == "sqlite":
+            _draft_store = SQLiteDraftStore(
+                settings.DRAFT_STORE_PATH,
+                ttl=settings.DRAFT_TTL_SECONDS,
+                flush_interval=settings.DRAFT_FLUSH_INTERVAL_SECONDS
+            )
+        else:
+            _draft_store = MemoryDraftStore(
+                maxsize=settings.DRAFT_MEMORY_MAX_ENTRIES,
+                ttl=settings.DRAFT_TTL_SECONDS
+            )
+    return _draft_store
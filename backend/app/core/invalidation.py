@@ -0,0 +1,237 @@
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+import logging
+import select
+import time
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from app.core.cache import flush_quiz_caches, invalidate_quiz
+from app.core.config import settings
+from app.core.metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+# Channel carrying "<quiz_id>:<version>:<sent_at epoch seconds>" payloads
+QUIZ_CHANNEL = "quiz_changed"
+
+# Called with the quiz ID of every notification this worker receives
+_subscribers: List[Callable[[str], None]] = []
+
+
+def subscribe_quiz_changes(callback: Callable[[str], None]) -> None:
+    """
+    Register a callback run (on the listener thread) for every quiz change.
+
+    Callbacks must be quick and must not raise; they are not called for
+    changes missed while the listener was disconnected.
+
+    Args:
+        callback: Receives the changed quiz ID as a string
+    """
+    _subscribers.append(callback)
+
+
+# Other channels sharing this worker's listener connection
+_channel_handlers: Dict[str, Callable[[str], None]] = {}
+_reconnect_callbacks: List[Callable[[], None]] = []
+
+
+def listen_channel(
+    channel: str,
+    handler: Callable[[str], None],
+    on_reconnect: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    LISTEN on another channel over the invalidation listener's connection,
+    so each worker keeps a single listening connection however many
+    features need notifications.
+
+    Register before the listener starts (i.e. at import time). Handlers
+    run on the listener thread and must be quick.
+
+    Args:
+        channel: Notification channel name
+        handler: Receives each notification payload
+        on_reconnect: Called after notifications may have been missed
+    """
+    _channel_handlers[channel] = handler
+    if on_reconnect is not None:
+        _reconnect_callbacks.append(on_reconnect)
+
+
+def notify_quiz_changed(db: Session, quiz_id: UUID) -> None:
+    """
+    Queue a quiz_changed notification in the current transaction.
+
+    Postgres delivers it only if the transaction commits, so listeners
+    never evict for a write that rolled back. Call it after the write
+    that bumps the quiz version so the payload carries the new version.
+
+    Args:
+        db: Database session with the pending write
+        quiz_id: Quiz UUID
+    """
+    notify_quizzes_changed(db, [quiz_id])
+
+
+def notify_quizzes_changed(db: Session, quiz_ids: List[UUID]) -> None:
+    """
+    Queue one quiz_changed notification per quiz with a single statement.
+
+    Args:
+        db: Database session with the pending write
+        quiz_ids: Quiz UUIDs
+    """
+    if not quiz_ids:
+        return
+    db.execute(
+        text(
+            "SELECT pg_notify(:channel, id::text || ':' || version || ':' || "
+            "extract(epoch FROM clock_timestamp())::text) FROM quizzes WHERE id = ANY(:quiz_ids)"
+        ).bindparams(bindparam("quiz_ids", type_=ARRAY(PG_UUID(as_uuid=True)))),
+        {"channel": QUIZ_CHANNEL, "quiz_ids": list(quiz_ids)}
+    )
+
+
+class InvalidationListener:
+    """
+    Background LISTEN on quiz_changed that evicts this worker's cached
+    copies of changed quizzes.
+
+    Notifications sent while the listener is disconnected are lost, so
+    every successful connect after a failure flushes all quiz caches.
+    """
+
+    def __init__(self, dsn: str, poll_interval: float, reconnect_delay: float):
+        self.dsn = dsn
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+        self.full_flushes = 0
+        self.last_lag_ms: Optional[float] = None
+        self.max_lag_ms = 0.0
+        self._lag_total_ms = 0.0
+        self._lag_count = 0
+        self._lock = Lock()
+
+    def run(self) -> None:
+        """Listen forever, reconnecting after failures."""
+        import psycopg2
+
+        missed_notifications = False
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.autocommit = True
+                for channel in [QUIZ_CHANNEL, *_channel_handlers]:
+                    conn.cursor().execute(f"LISTEN {channel}")
+                if missed_notifications:
+                    # Changes made during the outage were never delivered
+                    self.reconnects += 1
+                    self.full_flushes += 1
+                    flush_quiz_caches()
+                    for callback in _reconnect_callbacks:
+                        callback()
+                    missed_notifications = False
+                self.connected = True
+                self._listen(conn)
+            except Exception:
+                missed_notifications = True
+                logger.warning("Quiz invalidation listener disconnected", exc_info=True)
+            finally:
+                self.connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            time.sleep(self.reconnect_delay)
+
+    def _listen(self, conn) -> None:
+        while True:
+            if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                # Idle: a round trip detects dead connections
+                conn.cursor().execute("SELECT 1")
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                if notify.channel == QUIZ_CHANNEL:
+                    self.handle(notify.payload)
+                    continue
+                try:
+                    _channel_handlers[notify.channel](notify.payload)
+                except Exception:
+                    logger.exception("Handler for %s notification failed", notify.channel)
+
+    def handle(self, payload: str) -> None:
+        """
+        Evict the quiz named in a notification and record its lag.
+
+        Args:
+            payload: "<quiz_id>:<version>[:<sent_at>]"
+        """
+        quiz_id, _, rest = payload.partition(":")
+        invalidate_quiz(quiz_id)
+        for callback in _subscribers:
+            try:
+                callback(quiz_id)
+            except Exception:
+                logger.exception("Quiz change subscriber failed")
+
+        _, _, sent_at = rest.partition(":")
+        try:
+            lag_ms = max(0.0, (time.time() - float(sent_at)) * 1000) if sent_at else None
+        except ValueError:
+            lag_ms = None
+        with self._lock:
+            self.received += 1
+            if lag_ms is not None:
+                self.last_lag_ms = lag_ms
+                self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+                self._lag_total_ms += lag_ms
+                self._lag_count += 1
+
+    def snapshot(self) -> dict:
+        """Connection state, counters and invalidation lag for metrics."""
+        with self._lock:
+            return {
+                "connected": self.connected,
+                "received": self.received,
+                "reconnects": self.reconnects,
+                "full_flushes": self.full_flushes,
+                "lag_ms_last": self.last_lag_ms,
+                "lag_ms_max": self.max_lag_ms,
+                "lag_ms_avg": self._lag_total_ms / self._lag_count if self._lag_count else None,
+            }
+
+
+_listener: Optional[InvalidationListener] = None
+
+
+def start_invalidation_listener() -> Optional[InvalidationListener]:
+    """
+    Start this worker's listener thread once (no-op when disabled).
+
+    Returns:
+        The running listener, or None if CACHE_INVALIDATION_LISTEN is off
+    """
+    global _listener
+    if not settings.CACHE_INVALIDATION_LISTEN or _listener is not None:
+        return _listener
+
+    dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    _listener = InvalidationListener(
+        dsn.render_as_string(hide_password=False),
+        poll_interval=settings.CACHE_INVALIDATION_POLL_SECONDS,
+        reconnect_delay=settings.CACHE_INVALIDATION_RECONNECT_SECONDS
+    )
+    Thread(target=_listener.run, name="quiz-invalidation", daemon=True).start()
+    register_metrics("invalidation", _listener.snapshot)
+    return _listener
@@ -0,0 +1,113 @@
+from datetime import datetime
+from threading import Lock
+from typing import Callable, List, NamedTuple, Optional
+from uuid import UUID
+import heapq
+import time
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+class LeaderboardEntry(NamedTuple):
+    """One ranked submission."""
+    submission_id: UUID
+    name: str
+    score: int
+    total_questions: int
+    submitted_at: datetime
+
+
+def display_name(email: str) -> str:
+    """Mask an email for public display ("al***@example.com")."""
+    local_part, _, domain = email.partition("@")
+    return f"{local_part[:2]}***@{domain}" if domain else f"{local_part[:2]}***"
+
+
+def _rank_key(entry: LeaderboardEntry) -> tuple:
+    # Higher fraction correct first (pooled attempts differ in total_questions;
+    # same float division as the SQL ordering), then earlier submission;
+    # larger key = better rank
+    ratio = entry.score / entry.total_questions if entry.total_questions else 0.0
+    return (ratio, -entry.submitted_at.timestamp(), str(entry.submission_id))
+
+
+class TopK:
+    """
+    Best k submissions of one quiz, kept in a min-heap so the current
+    worst entry is evicted in O(log k).
+    """
+
+    def __init__(self, k: int, as_of: datetime):
+        self.k = k
+        self.as_of = as_of  # Everything committed before this is included
+        self.loaded_at = time.monotonic()
+        self._heap: List[tuple] = []
+        self._ids = set()
+        self._lock = Lock()
+
+    def offer(self, entry: LeaderboardEntry) -> None:
+        """Add a submission if it ranks within the top k."""
+        item = (_rank_key(entry), entry)
+        with self._lock:
+            if entry.submission_id in self._ids:
+                return
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, item)
+            elif item[0] > self._heap[0][0]:
+                evicted = heapq.heapreplace(self._heap, item)
+                self._ids.discard(evicted[1].submission_id)
+            else:
+                return
+            self._ids.add(entry.submission_id)
+
+    def top(self, n: int) -> List[LeaderboardEntry]:
+        """Best n entries, best first."""
+        with self._lock:
+            return [entry for _, entry in heapq.nlargest(n, self._heap)]
+
+
+class LeaderboardStore:
+    """
+    Per-process top-K boards, rebuilt lazily from the database.
+
+    Submissions graded by this worker are added as they are stored; those
+    graded by other workers appear once the board is rebuilt, which
+    happens when it is older than max_staleness seconds.
+    """
+
+    def __init__(self, k: int, max_staleness: float, maxsize: int):
+        self.k = k
+        self.max_staleness = max_staleness
+        self._boards = LRUCache(maxsize=maxsize)
+
+    def get(self, quiz_id: UUID, loader: Callable[[int], List[LeaderboardEntry]]) -> TopK:
+        """
+        Get a quiz's board, rebuilding it when missing or too old.
+
+        Args:
+            quiz_id: Quiz UUID
+            loader: Returns the best n submissions from the database
+
+        Returns:
+            TopK board
+        """
+        board: Optional[TopK] = self._boards.get(str(quiz_id))
+        if board is None or time.monotonic() - board.loaded_at > self.max_staleness:
+            board = TopK(self.k, as_of=datetime.utcnow())
+            for entry in loader(self.k):
+                board.offer(entry)
+            self._boards.set(str(quiz_id), board)
+        return board
+
+    def record(self, quiz_id: UUID, entry: LeaderboardEntry) -> None:
+        """Add a new submission to the quiz's board if it is loaded."""
+        board: Optional[TopK] = self._boards.get(str(quiz_id))
+        if board is not None:
+            board.offer(entry)
+
+
+leaderboards = LeaderboardStore(
+    k=settings.LEADERBOARD_SIZE,
+    max_staleness=settings.LEADERBOARD_MAX_STALENESS_SECONDS,
+    maxsize=settings.QUIZ_CACHE_SIZE
+)
@@ -0,0 +1,38 @@
+from fastapi import HTTPException, Request, status
+
+
+async def read_body_limited(request: Request, max_bytes: int) -> bytes:
+    """
+    Read a request body, refusing anything larger than ``max_bytes``.
+    
+    A declared Content-Length over the limit is rejected before any of the
+    body is read; otherwise reading stops as soon as the limit is crossed.
+    
+    Args:
+        request: Incoming request
+        max_bytes: Maximum accepted body size
+        
+    Returns:
+        Raw body bytes
+        
+    Raises:
+        HTTPException: 413 if the body is too large
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body exceeds {max_bytes} bytes"
+    )
+    
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+    
+    chunks = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+    
+    return b"".join(chunks)
@@ -0,0 +1,263 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+import asyncio
+import json
+import logging
+from app.core.config import settings
+from app.core.invalidation import listen_channel
+from app.core.metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+# Channel carrying "<writer xid> <submission event JSON>" payloads
+SUBMISSION_CHANNEL = "quiz_submission"
+
+
+class AggregateSeed(NamedTuple):
+    """A quiz's submission totals as of one database snapshot."""
+    submission_count: int
+    score_total: int
+    percentage_total: float
+    best_score: Optional[int]
+    snapshot: Optional[str]  # pg_current_snapshot() text of the totals query
+
+
+def snapshot_includes(snapshot: Optional[str], xid: Optional[int]) -> bool:
+    """
+    Whether a committed transaction was visible to a database snapshot.
+
+    Args:
+        snapshot: pg_snapshot text, "xmin:xmax:xip,..."
+        xid: Writer transaction ID (None = unknown)
+
+    Returns:
+        True if the snapshot already saw that transaction's rows
+    """
+    if snapshot is None or xid is None:
+        return False
+    xmin, xmax, xip = snapshot.split(":")
+    if xid < int(xmin):
+        return True
+    if xid >= int(xmax):
+        return False
+    return str(xid) not in xip.split(",")
+
+
+class Aggregate:
+    """Running submission totals for one quiz."""
+
+    __slots__ = ("submission_count", "score_total", "percentage_total", "best_score")
+
+    def __init__(self, seed: AggregateSeed):
+        self.submission_count = seed.submission_count
+        self.score_total = seed.score_total
+        self.percentage_total = seed.percentage_total
+        self.best_score = seed.best_score
+
+    def add(self, score: int, total_questions: int) -> None:
+        """Count one new submission."""
+        self.submission_count += 1
+        self.score_total += score
+        self.percentage_total += score * 100.0 / total_questions if total_questions else 0.0
+        self.best_score = score if self.best_score is None else max(self.best_score, score)
+
+    def as_dict(self) -> dict:
+        """Totals and averages as sent to viewers."""
+        count = self.submission_count
+        return {
+            "submission_count": count,
+            "average_score": round(self.score_total / count, 3) if count else None,
+            "average_percentage": round(self.percentage_total / count, 2) if count else None,
+            "best_score": self.best_score,
+        }
+
+
+class LiveMessage(NamedTuple):
+    """One event, encoded once for every viewer."""
+    sse: bytes  # Server-Sent Events framing
+    text: str  # JSON object for WebSocket viewers
+
+
+def format_event(event: str, data: dict, event_id: Optional[str] = None) -> LiveMessage:
+    """Encode one event for both SSE and WebSocket viewers."""
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {payload}")
+    return LiveMessage(
+        sse=("\n".join(lines) + "\n\n").encode(),
+        text=f'{{"event":{json.dumps(event)},"data":{payload}}}'
+    )
+
+
+class Subscription:
+    """One viewer's bounded queue of LiveMessages."""
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.overflowed = False  # Fell too far behind and was dropped
+
+
+class _QuizStream:
+    def __init__(self, seeder: Callable[[str], AggregateSeed]):
+        self.seeder = seeder
+        self.subscribers: Set[Subscription] = set()
+        self.aggregate: Optional[Aggregate] = None
+        # Events received while (re)seeding, as (xid, event)
+        self.pending: Optional[List[Tuple[Optional[int], dict]]] = None
+
+
+class LiveHub:
+    """
+    Per-process fan-out of new submissions to live viewers.
+
+    Every worker receives each submission once, as a NOTIFY on its shared
+    listener connection; the hub keeps running totals per watched quiz
+    and hands one pre-encoded message to every viewer's queue. Viewers
+    cost no database work after their quiz's totals are first loaded.
+
+    All stream state lives on the event loop; the listener thread only
+    schedules callbacks onto it.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._streams: Dict[str, _QuizStream] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, quiz_id: str, seeder: Callable[[str], AggregateSeed]) -> Subscription:
+        """
+        Start receiving a quiz's events (call on the event loop).
+
+        Args:
+            quiz_id: Quiz ID
+            seeder: Loads the quiz's totals from the database (blocking;
+                run in a thread when the quiz is first watched)
+
+        Returns:
+            Subscription; pass it to unsubscribe when the viewer leaves
+        """
+        self._loop = asyncio.get_running_loop()
+        stream = self._streams.get(quiz_id)
+        if stream is None:
+            stream = self._streams[quiz_id] = _QuizStream(seeder)
+            self._reseed(quiz_id, stream)
+
+        subscription = Subscription(self.queue_size)
+        stream.subscribers.add(subscription)
+        if stream.aggregate is not None:
+            subscription.queue.put_nowait(format_event("aggregate", {"aggregate": stream.aggregate.as_dict()}))
+        return subscription
+
+    def unsubscribe(self, quiz_id: str, subscription: Subscription) -> None:
+        """Stop a viewer's events; the quiz's totals are dropped with its last viewer."""
+        stream = self._streams.get(quiz_id)
+        if stream is None:
+            return
+        stream.subscribers.discard(subscription)
+        if not stream.subscribers:
+            del self._streams[quiz_id]
+
+    def notify(self, payload: str) -> None:
+        """
+        Handle a quiz_submission notification (listener thread).
+
+        Args:
+            payload: "<xid> <event JSON>"
+        """
+        xid, _, data = payload.partition(" ")
+        event = json.loads(data)
+        self.publish(event, int(xid))
+
+    def publish(self, event: dict, xid: Optional[int] = None) -> None:
+        """
+        Hand a submission event to this worker's viewers (any thread).
+
+        Args:
+            event: Submission event with quiz_id, score and total_questions
+            xid: Writer transaction ID, used to avoid counting it twice
+        """
+        loop = self._loop
+        if loop is None or event["quiz_id"] not in self._streams:
+            return  # Nobody in this worker watches the quiz
+        loop.call_soon_threadsafe(self._dispatch, event, xid)
+
+    def resync(self) -> None:
+        """Reload every watched quiz's totals after missed notifications (any thread)."""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._resync_all)
+
+    def _dispatch(self, event: dict, xid: Optional[int]) -> None:
+        stream = self._streams.get(event["quiz_id"])
+        if stream is None:
+            return
+        self.received += 1
+        if stream.pending is not None:
+            stream.pending.append((xid, event))
+        elif stream.aggregate is not None:
+            stream.aggregate.add(event["score"], event["total_questions"])
+
+        aggregate = stream.aggregate.as_dict() if stream.aggregate is not None else None
+        self._broadcast(stream, format_event(
+            "submission", {"submission": event, "aggregate": aggregate}, event["submission_id"]
+        ))
+
+    def _broadcast(self, stream: _QuizStream, message: LiveMessage) -> None:
+        for subscription in list(stream.subscribers):
+            try:
+                subscription.queue.put_nowait(message)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                # A stalled viewer must not hold memory for everyone else
+                subscription.overflowed = True
+                stream.subscribers.discard(subscription)
+                self.dropped += 1
+
+    def _resync_all(self) -> None:
+        for quiz_id, stream in self._streams.items():
+            if stream.pending is None:
+                self._reseed(quiz_id, stream)
+
+    def _reseed(self, quiz_id: str, stream: _QuizStream) -> None:
+        stream.pending = []
+        asyncio.get_running_loop().create_task(self._seed(quiz_id, stream))
+
+    async def _seed(self, quiz_id: str, stream: _QuizStream) -> None:
+        loop = asyncio.get_running_loop()
+        while self._streams.get(quiz_id) is stream:
+            try:
+                seed = await loop.run_in_executor(None, stream.seeder, quiz_id)
+                break
+            except Exception:
+                logger.exception("Loading live totals for quiz %s failed", quiz_id)
+                await asyncio.sleep(settings.LIVE_RESEED_RETRY_SECONDS)
+        else:
+            return  # Last viewer left
+
+        aggregate = Aggregate(seed)
+        for xid, event in stream.pending:
+            if not snapshot_includes(seed.snapshot, xid):
+                aggregate.add(event["score"], event["total_questions"])
+        stream.pending = None
+        stream.aggregate = aggregate
+        self._broadcast(stream, format_event("aggregate", {"aggregate": aggregate.as_dict()}))
+
+    def snapshot(self) -> dict:
+        """Watched quizzes, viewers and event counters for metrics."""
+        streams = list(self._streams.values())
+        return {
+            "quizzes": len(streams),
+            "viewers": sum(len(stream.subscribers) for stream in streams),
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped_viewers": self.dropped,
+        }
+
+
+live_hub = LiveHub(queue_size=settings.LIVE_QUEUE_SIZE)
+listen_channel(SUBMISSION_CHANNEL, live_hub.notify, on_reconnect=live_hub.resync)
+register_metrics("live", live_hub.snapshot)
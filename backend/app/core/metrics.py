@@ -0,0 +1,20 @@
+from typing import Any, Callable, Dict
+
+# Named providers of point-in-time metric snapshots, exposed at GET /metrics
+_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_metrics(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Register a metrics provider.
+    
+    Args:
+        name: Section name in the metrics output
+        provider: Callable returning a JSON-serializable snapshot
+    """
+    _providers[name] = provider
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """Collect a snapshot from every registered provider."""
+    return {name: provider() for name, provider in _providers.items()}
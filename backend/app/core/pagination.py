@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+import base64
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode a keyset position as an opaque URL-safe cursor.
+    
+    Args:
+        timestamp: Sort timestamp of the last row returned
+        row_id: ID of the last row returned (tie-breaker)
+        
+    Returns:
+        Cursor string
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor made by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+        
+    Returns:
+        Tuple of (timestamp, row ID)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, _, row_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
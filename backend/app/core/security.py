@@ -1,15 +1,27 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import List, Optional
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.core.database import get_db
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib/bcrypt and python-jose/cryptography are slow to import, so they
+# are loaded on first use rather than when the app is imported
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """Password hashing context (created on first use)."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _jwt():
+    """The python-jose jwt module (imported on first use)."""
+    from jose import jwt
+    return jwt
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/admin/login")
@@ -17,12 +29,12 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/admin/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -43,7 +55,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = _jwt().encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
@@ -57,13 +69,114 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         Decoded token payload or None if invalid
     """
+    from jose import JWTError
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _jwt().decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
         return None
 
 
+# Token type claim separating attempt tokens from admin access tokens
+ATTEMPT_TOKEN_TYPE = "attempt"
+
+
+def create_attempt_token(
+    attempt_id: str,
+    quiz_id: str,
+    version: int,
+    question_ids: Optional[List[str]]
+) -> tuple[str, datetime]:
+    """
+    Create a signed token recording which questions an attempt was served.
+    
+    Args:
+        attempt_id: Attempt UUID as string (keys the autosaved draft)
+        quiz_id: Quiz UUID as string
+        version: Quiz version the questions were drawn from
+        question_ids: Served question UUIDs (as strings) in served order;
+            None when every question is served, which keeps the token small
+        
+    Returns:
+        Tuple of (encoded token, expiry time)
+    """
+    expire = datetime.utcnow() + timedelta(minutes=settings.ATTEMPT_TOKEN_EXPIRE_MINUTES)
+    claims = {
+        "typ": ATTEMPT_TOKEN_TYPE,
+        "jti": attempt_id,
+        "quiz": quiz_id,
+        "v": version,
+        "exp": expire,
+    }
+    if question_ids is not None:
+        claims["q"] = question_ids
+    return _jwt().encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM), expire
+
+
+def decode_attempt_token(token: str) -> Optional[dict]:
+    """
+    Decode and verify an attempt token.
+    
+    Args:
+        token: Attempt token string
+        
+    Returns:
+        Decoded claims or None if invalid, expired or not an attempt token
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("typ") != ATTEMPT_TOKEN_TYPE:
+        return None
+    return payload
+
+
+# Token type claim for quiz takers' submission-history tokens
+HISTORY_TOKEN_TYPE = "history"
+
+# Quiz takers send their history token as "Authorization: Bearer <token>"
+history_token_scheme = HTTPBearer(auto_error=False)
+
+
+def create_history_token(user_id: str) -> str:
+    """
+    Create a signed token that lets a quiz taker read their own submissions.
+    
+    Args:
+        user_id: User UUID as string
+        
+    Returns:
+        Encoded token
+    """
+    expire = datetime.utcnow() + timedelta(minutes=settings.HISTORY_TOKEN_EXPIRE_MINUTES)
+    claims = {"typ": HISTORY_TOKEN_TYPE, "sub": user_id, "exp": expire}
+    return _jwt().encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def get_history_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(history_token_scheme)
+) -> str:
+    """
+    Dependency resolving the quiz taker a history token was issued to.
+    
+    Args:
+        credentials: Bearer credentials from the request
+        
+    Returns:
+        User UUID (as string) from the token
+        
+    Raises:
+        HTTPException: If the token is missing, invalid or of another type
+    """
+    payload = decode_access_token(credentials.credentials) if credentials else None
+    if payload is None or payload.get("typ") != HISTORY_TOKEN_TYPE or payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload["sub"]
+
+
 async def get_current_admin(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -92,7 +205,7 @@ async def get_current_admin(
         raise credentials_exception
     
     admin_id: str = payload.get("sub")
-    if admin_id is None:
+    if admin_id is None or payload.get("typ") is not None:
         raise credentials_exception
     
     # Import here to avoid circular dependency
@@ -0,0 +1,248 @@
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+import asyncio
+from app.core.config import settings
+from app.core.security import get_current_admin
+from app.schemas.live_session import LiveJoin, LiveQuestionOpen, LiveSessionCreate, LiveSessionStatus
+from app.services import live_service, live_session_service
+from app.services.live_session_service import Connection
+from app.models.admin import Admin
+
+router = APIRouter(prefix="/api/live", tags=["Live Sessions"])
+
+
+@router.post("/sessions", response_model=LiveSessionStatus, status_code=status.HTTP_201_CREATED)
+async def create_session(
+    session_data: LiveSessionCreate,
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Start a live session of one of the admin's quizzes (Admin only).
+    
+    Participants join with the returned code; the session waits in the
+    lobby until the first question is opened.
+    
+    Args:
+        session_data: Quiz to run and whether to store submissions
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Session status with its join code
+        
+    Raises:
+        HTTPException: If quiz not found, unauthorized or without questions
+    """
+    try:
+        return await live_session_service.create_session(
+            session_data.quiz_id, current_admin.id, session_data.persist
+        )
+    except ValueError as e:
+        raise _session_error_to_http(e)
+
+
+@router.get("/sessions/{code}", response_model=LiveSessionStatus)
+async def get_session(code: str, current_admin: Admin = Depends(get_current_admin)):
+    """
+    Get a live session's state (Admin only).
+    
+    Args:
+        code: Join code
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Session status
+        
+    Raises:
+        HTTPException: If session not found or unauthorized
+    """
+    try:
+        return live_session_service.get_hosted_session(code, current_admin.id).status()
+    except ValueError as e:
+        raise _session_error_to_http(e)
+
+
+@router.post("/sessions/{code}/next", response_model=LiveSessionStatus)
+async def open_next_question(
+    code: str,
+    question_data: LiveQuestionOpen,
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Show the next question to every participant and open its answer
+    window (Admin only).
+    
+    Args:
+        code: Join code
+        question_data: Optional window length
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Session status
+        
+    Raises:
+        HTTPException: If session not found, unauthorized, a question is
+            already open or none are left
+    """
+    try:
+        session = live_session_service.get_hosted_session(code, current_admin.id)
+        session.open_question(question_data.seconds)
+        return session.status()
+    except ValueError as e:
+        raise _session_error_to_http(e)
+
+
+@router.post("/sessions/{code}/close", response_model=LiveSessionStatus)
+async def close_question(code: str, current_admin: Admin = Depends(get_current_admin)):
+    """
+    Close the open question early and reveal its results (Admin only).
+    
+    Args:
+        code: Join code
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Session status
+        
+    Raises:
+        HTTPException: If session not found or unauthorized
+    """
+    try:
+        session = live_session_service.get_hosted_session(code, current_admin.id)
+        session.close_question()
+        return session.status()
+    except ValueError as e:
+        raise _session_error_to_http(e)
+
+
+@router.post("/sessions/{code}/end", response_model=LiveSessionStatus)
+async def end_session(code: str, current_admin: Admin = Depends(get_current_admin)):
+    """
+    End a live session and store its submissions (Admin only).
+    
+    Retry if storing fails; submissions are stored at most once.
+    
+    Args:
+        code: Join code
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Final session status with the number of stored submissions
+        
+    Raises:
+        HTTPException: If session not found or unauthorized, or 503 if the
+            submissions could not be stored (retryable)
+    """
+    try:
+        session = live_session_service.get_hosted_session(code, current_admin.id)
+    except ValueError as e:
+        raise _session_error_to_http(e)
+    try:
+        await session.end()
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not store the session's submissions; retry ending it",
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)}
+        )
+    return session.status()
+
+
+@router.websocket("/sessions/{code}/play")
+async def play(websocket: WebSocket, code: str):
+    """
+    A participant's connection to a live session.
+    
+    The first client message must be {"email": "..."}; the server replies
+    with a "joined" event, then sends "question", "results",
+    "your_result" and "finished" events as the host runs the session.
+    Answers are sent as {"index": <question index>, "answer": "..."} and
+    acknowledged with an "answer" event whose status is "accepted",
+    "duplicate" or "closed". Reconnecting with the same email keeps the
+    score.
+    
+    Args:
+        websocket: WebSocket connection
+        code: Join code
+    """
+    await websocket.accept()
+    try:
+        hello = await asyncio.wait_for(websocket.receive_json(), settings.LIVE_WS_AUTH_TIMEOUT_SECONDS)
+        email = LiveJoin.model_validate(hello).email
+        session = live_session_service.sessions.get(code)
+    except WebSocketDisconnect:
+        return
+    except asyncio.TimeoutError:
+        await websocket.close(code=1008, reason="Join timed out")
+        return
+    except ValueError as e:
+        # Pydantic validation errors are ValueErrors too
+        await websocket.close(code=1008, reason=str(e)[:120])
+        return
+    
+    connection = Connection(websocket, settings.LIVE_SESSION_QUEUE_SIZE)
+    try:
+        participant = session.join(email, connection)
+    except ValueError as e:
+        connection.close(1008, str(e))
+        return
+    
+    try:
+        while True:
+            text = await websocket.receive_text()
+            connection.send(live_session_service.handle_participant_message(session, participant, text))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session.leave(participant, connection)
+        connection.close()
+
+
+@router.websocket("/sessions/{code}/host")
+async def host(websocket: WebSocket, code: str):
+    """
+    The host's event stream for a live session (Admin only).
+    
+    The first client message must be {"token": "<admin access token>"};
+    the server then sends a "status" event, "tally" events while a
+    question is open, and the same "question", "results" and "finished"
+    events participants get. Control is through the REST endpoints.
+    
+    Args:
+        websocket: WebSocket connection
+        code: Join code
+    """
+    await websocket.accept()
+    try:
+        hello = await asyncio.wait_for(websocket.receive_json(), settings.LIVE_WS_AUTH_TIMEOUT_SECONDS)
+        token = hello.get("token") if isinstance(hello, dict) else None
+        admin_id = await run_in_threadpool(live_service.admin_id_from_token, str(token or ""))
+        session = live_session_service.get_hosted_session(code, admin_id)
+    except WebSocketDisconnect:
+        return
+    except (asyncio.TimeoutError, ValueError) as e:
+        await websocket.close(code=1008, reason=str(e) or "Authentication timed out")
+        return
+    
+    connection = Connection(websocket, settings.LIVE_SESSION_QUEUE_SIZE)
+    session.add_host(connection)
+    try:
+        while True:
+            await websocket.receive_text()  # Only used to notice the host leaving
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session.remove_host(connection)
+        connection.close()
+
+
+def _session_error_to_http(e: ValueError) -> HTTPException:
+    """Map a service ValueError to 404 (not found), 403 (ownership) or 409 (state)."""
+    message = str(e)
+    if "not found" in message.lower():
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+    if "unauthorized" in message.lower():
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=message)
+    if "no questions" in message.lower():
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=message)
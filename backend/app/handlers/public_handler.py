@@ -1,17 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import List, Optional
 from uuid import UUID
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.quiz import QuizListItem, QuizPublic
+from app.core.limits import read_body_limited
+from app.schemas.attempt import QuizAttemptResponse, AttemptDraftSave, AttemptDraftResponse
+from app.schemas.leaderboard import LeaderboardResponse
+from app.schemas.quiz import QuizChangeFeed, QuizListItem, QuizPublic
 from app.schemas.submission import QuizSubmissionCreate, QuizSubmissionResponse
-from app.services import quiz_service, submission_service
+from app.services import attempt_service, leaderboard_service, quiz_service, submission_service
 
 router = APIRouter(prefix="/api/public", tags=["Public Quiz"])
 
 
+def _catalog_not_modified(request: Request, version: quiz_service.CatalogVersion) -> bool:
+    """Evaluate If-None-Match, or else If-Modified-Since, against the catalogue."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return version.etag in [tag.strip() for tag in if_none_match.split(",")]
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return version.last_modified.replace(tzinfo=timezone.utc) <= since
+
+
 @router.get("/quizzes", response_model=List[QuizListItem])
 def list_active_quizzes(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     db: Session = Depends(get_db)
@@ -19,7 +47,12 @@ def list_active_quizzes(
     """
     List all active quizzes (public, no authentication required).
     
+    Supports If-None-Match and If-Modified-Since: an unchanged catalogue
+    is answered with 304 after a single index lookup.
+    
     Args:
+        request: Incoming request (for conditional headers)
+        response: Outgoing response (for validators)
         skip: Pagination offset
         limit: Pagination limit
         db: Database session
@@ -27,19 +60,60 @@ def list_active_quizzes(
     Returns:
         List of active quiz summaries
     """
+    version = quiz_service.get_catalog_version(db)
+    headers = {"ETag": version.etag, "Cache-Control": "no-cache"}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            version.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    
+    if _catalog_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
     return quiz_service.list_active_quizzes_for_public(db, skip, limit)
 
 
+@router.get("/quizzes/changes", response_model=QuizChangeFeed)
+def get_quiz_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    """
+    Get quizzes created, updated, deactivated or deleted since a change
+    sequence number (public).
+    
+    Poll with the previous response's next_since; removals come back as
+    tombstones. When reset is true, drop the local copy and start over
+    from since=0.
+    
+    Args:
+        since: next_since from the previous poll (0 = whole catalogue)
+        limit: Maximum number of changes
+        db: Database session
+        
+    Returns:
+        Changes in commit order
+    """
+    return quiz_service.get_quiz_changes(db, since, limit)
+
+
 @router.get("/quizzes/{quiz_id}", response_model=QuizPublic)
 def get_quiz_for_taking(
     quiz_id: UUID,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Get quiz questions without answers (public, for taking the quiz).
     
+    The body is served from a per-quiz cache with precompressed
+    gzip/brotli variants and supports If-None-Match.
+    
     Args:
         quiz_id: Quiz UUID
+        request: Incoming request (for content negotiation)
         db: Database session
         
     Returns:
@@ -49,7 +123,8 @@ def get_quiz_for_taking(
         HTTPException: If quiz not found or inactive
     """
     try:
-        return quiz_service.get_quiz_for_public(db, quiz_id)
+        payload = quiz_service.get_public_quiz_payload(db, quiz_id)
+        return payload.to_response(request)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,10 +132,194 @@ def get_quiz_for_taking(
         )
 
 
-@router.post("/quizzes/{quiz_id}/submit", response_model=QuizSubmissionResponse)
+@router.post("/quizzes/{quiz_id}/attempts", response_model=QuizAttemptResponse, status_code=status.HTTP_201_CREATED)
+def start_attempt(
+    quiz_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """
+    Start an attempt: draw this attempt's questions (public).
+    
+    Quizzes with a question pool serve a random subset in random order;
+    the returned token must be sent back with the submission.
+    
+    Args:
+        quiz_id: Quiz UUID
+        db: Database session
+        
+    Returns:
+        Drawn questions (no answers) and a signed attempt token
+        
+    Raises:
+        HTTPException: If quiz not found or inactive
+    """
+    try:
+        return attempt_service.start_attempt(db, quiz_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+async def _read_bounded_answers(quiz_id: UUID, request: Request, db: Session, schema):
+    """
+    Read a body carrying answers and validate it within the quiz's limits.
+    
+    Oversized bodies are refused before being read (413) and answers to
+    unknown questions or over-long answers are rejected (422) before the
+    quiz itself is loaded.
+    
+    Raises:
+        HTTPException: If the payload is too large or invalid
+    """
+    limits = await run_in_threadpool(submission_service.get_submission_limits, db, quiz_id)
+    body = await read_body_limited(request, limits.max_body_bytes)
+    
+    try:
+        data = schema.model_validate_json(body)
+        submission_service.check_answers_within_limits(limits, data.answers)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    
+    return data
+
+
+async def parse_bounded_submission(
+    quiz_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db)
+) -> QuizSubmissionCreate:
+    """
+    Dependency that reads and validates a submission within the quiz's limits.
+    
+    Args:
+        quiz_id: Quiz UUID
+        request: Incoming request
+        db: Database session
+        
+    Returns:
+        Validated submission data
+        
+    Raises:
+        HTTPException: If the payload is too large or invalid
+    """
+    return await _read_bounded_answers(quiz_id, request, db, QuizSubmissionCreate)
+
+
+async def parse_bounded_draft(
+    quiz_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db)
+) -> AttemptDraftSave:
+    """
+    Dependency that reads and validates an autosave within the quiz's limits.
+    
+    Args:
+        quiz_id: Quiz UUID
+        request: Incoming request
+        db: Database session
+        
+    Returns:
+        Validated draft
+        
+    Raises:
+        HTTPException: If the payload is too large or invalid
+    """
+    return await _read_bounded_answers(quiz_id, request, db, AttemptDraftSave)
+
+
+@router.put(
+    "/quizzes/{quiz_id}/attempts/{attempt_id}/draft",
+    status_code=status.HTTP_204_NO_CONTENT,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": AttemptDraftSave.model_json_schema()}},
+        }
+    }
+)
+def save_attempt_draft(
+    quiz_id: UUID,
+    attempt_id: UUID,
+    draft: AttemptDraftSave = Depends(parse_bounded_draft)
+):
+    """
+    Autosave in-progress answers for an attempt (public).
+    
+    Meant to be called every few seconds; the body is held to the same
+    limits as a submission, which are cached per quiz, so it only reads
+    the database when those limits are not cached.
+    
+    Args:
+        quiz_id: Quiz UUID
+        attempt_id: Attempt UUID
+        draft: Attempt token and current answers (size-bounded)
+        
+    Raises:
+        HTTPException: If the payload is too large or invalid, or the
+            attempt token is invalid
+    """
+    try:
+        attempt_service.save_draft(quiz_id, attempt_id, draft)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/quizzes/{quiz_id}/attempts/{attempt_id}/draft", response_model=AttemptDraftResponse)
+def get_attempt_draft(
+    quiz_id: UUID,
+    attempt_id: UUID,
+    attempt_token: str = Query(...)
+):
+    """
+    Get the autosaved answers for an attempt, e.g. after a reconnect (public).
+    
+    Args:
+        quiz_id: Quiz UUID
+        attempt_id: Attempt UUID
+        attempt_token: Attempt token
+        
+    Returns:
+        Saved draft answers
+        
+    Raises:
+        HTTPException: If the attempt token is invalid
+    """
+    try:
+        return attempt_service.get_draft(quiz_id, attempt_id, attempt_token)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/quizzes/{quiz_id}/submit",
+    response_model=QuizSubmissionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": QuizSubmissionCreate.model_json_schema()}},
+        }
+    }
+)
 def submit_quiz(
     quiz_id: UUID,
-    submission_data: QuizSubmissionCreate,
+    submission_data: QuizSubmissionCreate = Depends(parse_bounded_submission),
     db: Session = Depends(get_db)
 ):
     """
@@ -68,7 +327,7 @@ def submit_quiz(
     
     Args:
         quiz_id: Quiz UUID
-        submission_data: Submission data with email and answers
+        submission_data: Submission data with email and answers (size-bounded)
         db: Database session
         
     Returns:
@@ -84,3 +343,38 @@ def submit_quiz(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+
+
+@router.get("/quizzes/{quiz_id}/leaderboard", response_model=LeaderboardResponse)
+def get_leaderboard(
+    quiz_id: UUID,
+    k: int = Query(10, ge=1, le=settings.LEADERBOARD_SIZE),
+    submission_id: Optional[UUID] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a quiz's top submissions (public).
+    
+    Served from an in-memory top-K board per quiz; the response states
+    how stale it may be. Pass submission_id to also get that
+    submission's exact rank.
+    
+    Args:
+        quiz_id: Quiz UUID
+        k: Number of entries
+        submission_id: Optional submission to rank
+        db: Database session
+        
+    Returns:
+        Leaderboard entries, best first
+        
+    Raises:
+        HTTPException: If quiz or submission not found
+    """
+    try:
+        return leaderboard_service.get_leaderboard(db, quiz_id, k, submission_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
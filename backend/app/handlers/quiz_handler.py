@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect, status, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
+import asyncio
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import get_current_admin
-from app.schemas.quiz import QuizCreate, QuizUpdate, QuizResponse, QuizListItem
-from app.services import quiz_service
+from app.schemas.quiz import (
+    QuizCreate, QuizUpdate, QuizResponse, QuizListItem,
+    QuizQuestionsPatch, QuestionUpdate, QuizImportResult, QuizSummaryPage,
+    BulkQuizAction, QuizBulkRequest, QuizBulkResult,
+    QuizCloneRequest, QuizCloneResult
+)
+from app.schemas.analytics import ItemAnalysisResponse
+from app.services import analytics_service, live_service, quiz_service, transfer_service
 from app.models.admin import Admin
 
 router = APIRouter(prefix="/api/quizzes", tags=["Quiz Management (Admin)"])
@@ -62,6 +72,143 @@ def list_quizzes(
     return quiz_service.list_quizzes_for_admin(db, current_admin.id, skip, limit)
 
 
+@router.get("/summary", response_model=QuizSummaryPage)
+def get_quiz_summary(
+    limit: int = Query(100, ge=1, le=2000),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Dashboard view of the current admin's quizzes in one query (Admin only).
+    
+    Each quiz comes with question count, submission count, average
+    percentage and last submission time. Uses keyset pagination: pass
+    next_cursor from one page as cursor to get the next.
+    
+    Args:
+        limit: Page size
+        cursor: Cursor from the previous page
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Page of quiz summaries, newest first
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        return quiz_service.get_quiz_summaries(db, current_admin.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/bulk", response_model=QuizBulkResult)
+def bulk_quiz_action(
+    request: QuizBulkRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Activate, deactivate, delete or transfer many quizzes at once (Admin only).
+    
+    Select quizzes by ids or by filter; the change runs as one UPDATE
+    restricted to the current admin's quizzes and reports each ID's outcome.
+    
+    Args:
+        request: Action and selection
+        background_tasks: Schedules row purges after a bulk delete
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Number of quizzes updated and per-quiz outcomes
+        
+    Raises:
+        HTTPException: If the request is invalid or the transfer target is unknown
+    """
+    try:
+        result = quiz_service.run_bulk_action(db, request, current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+    
+    if result.action == BulkQuizAction.DELETE:
+        for outcome in result.outcomes:
+            if outcome.status == "updated":
+                background_tasks.add_task(quiz_service.purge_deleted_quiz, outcome.id)
+    return result
+
+
+@router.get("/export")
+def export_quizzes(
+    format: str = Query("ndjson", pattern="^(ndjson|msgpack)$"),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Stream all of the current admin's quizzes with questions and answers.
+    
+    Each record has the same shape as the quiz creation payload, as one
+    NDJSON line or one msgpack object.
+    
+    Args:
+        format: "ndjson" or "msgpack"
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Streamed export
+    """
+    try:
+        transfer_service.check_format(format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return StreamingResponse(
+        transfer_service.export_quizzes(current_admin.id, format),
+        media_type=transfer_service.FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="quizzes.{format}"'}
+    )
+
+
+@router.post("/import", response_model=QuizImportResult, status_code=status.HTTP_201_CREATED)
+async def import_quizzes(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|msgpack)$"),
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Import quizzes from a streamed NDJSON or msgpack body (Admin only).
+    
+    Records are validated one by one and written in COPY batches; the
+    import is all-or-nothing.
+    
+    Args:
+        request: Incoming request (body is streamed)
+        format: "ndjson" or "msgpack"
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Counts and IDs of the imported quizzes
+        
+    Raises:
+        HTTPException: If any record is invalid
+    """
+    importer = transfer_service.QuizImporter(db, current_admin.id)
+    try:
+        transfer_service.check_format(format)
+        async for number, record in transfer_service.iter_records(request.stream(), format):
+            importer.add(record, number)
+            if importer.should_flush():
+                await run_in_threadpool(importer.flush)
+        return await run_in_threadpool(importer.finish)
+    except ValueError as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/{quiz_id}", response_model=QuizResponse)
 def get_quiz(
     quiz_id: UUID,
@@ -131,14 +278,19 @@ def update_quiz(
 @router.delete("/{quiz_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_quiz(
     quiz_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """
     Delete quiz (Admin only, must own the quiz).
     
+    The quiz disappears immediately; its questions, answers and
+    submissions are purged in batches after the response is sent.
+    
     Args:
         quiz_id: Quiz UUID
+        background_tasks: Background task queue for the purge
         db: Database session
         current_admin: Current authenticated admin
         
@@ -147,6 +299,7 @@ def delete_quiz(
     """
     try:
         quiz_service.delete_quiz_by_id(db, quiz_id, current_admin.id)
+        background_tasks.add_task(quiz_service.purge_deleted_quiz, quiz_id)
     except ValueError as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -158,3 +311,232 @@ def delete_quiz(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=str(e)
             )
+
+
+@router.post("/{quiz_id}/clone", response_model=QuizCloneResult, status_code=status.HTTP_201_CREATED)
+def clone_quiz(
+    quiz_id: UUID,
+    clone_data: Optional[QuizCloneRequest] = None,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Copy a quiz with all questions and answers, server-side (Admin only).
+    
+    Args:
+        quiz_id: Source quiz UUID
+        clone_data: Optional title and active flag for the copy
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        ID, title and question count of the copy
+        
+    Raises:
+        HTTPException: If quiz not found or unauthorized
+    """
+    try:
+        return quiz_service.clone_quiz(db, quiz_id, clone_data or QuizCloneRequest(), current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+
+
+@router.patch("/{quiz_id}/questions", response_model=QuizResponse)
+def patch_quiz_questions(
+    quiz_id: UUID,
+    changes: QuizQuestionsPatch,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Add, update, delete and reorder questions in one transaction (Admin only).
+    
+    Args:
+        quiz_id: Quiz UUID
+        changes: Question diff to apply
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Updated quiz information
+        
+    Raises:
+        HTTPException: If quiz/question not found, unauthorized or invalid
+    """
+    try:
+        return quiz_service.update_quiz_questions(db, quiz_id, changes, current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+
+
+@router.patch("/{quiz_id}/questions/{question_id}", response_model=QuizResponse)
+def patch_question(
+    quiz_id: UUID,
+    question_id: UUID,
+    question_data: QuestionUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Update a single question and/or its answer (Admin only).
+    
+    Args:
+        quiz_id: Quiz UUID
+        question_id: Question UUID
+        question_data: Fields to change
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Updated quiz information
+        
+    Raises:
+        HTTPException: If quiz/question not found, unauthorized or invalid
+    """
+    try:
+        return quiz_service.update_question(
+            db, quiz_id, question_id, question_data, current_admin.id
+        )
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+
+
+@router.delete("/{quiz_id}/questions/{question_id}", response_model=QuizResponse)
+def delete_question(
+    quiz_id: UUID,
+    question_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Delete a single question and renumber the rest (Admin only).
+    
+    Args:
+        quiz_id: Quiz UUID
+        question_id: Question UUID
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Updated quiz information
+        
+    Raises:
+        HTTPException: If quiz/question not found or unauthorized
+    """
+    try:
+        return quiz_service.delete_question(db, quiz_id, question_id, current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+
+
+@router.get("/{quiz_id}/item-analysis", response_model=ItemAnalysisResponse)
+def get_item_analysis(
+    quiz_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Per-question difficulty (p-value) and discrimination (Admin only).
+    
+    Args:
+        quiz_id: Quiz UUID
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        Item statistics for the current quiz version
+        
+    Raises:
+        HTTPException: If quiz not found or unauthorized
+    """
+    try:
+        return analytics_service.get_item_analysis(db, quiz_id, current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+
+
+@router.get("/{quiz_id}/live")
+def watch_live_submissions(
+    quiz_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Stream new submissions and running totals as Server-Sent Events (Admin only).
+    
+    Events: "aggregate" (current totals, sent first), "submission" (one
+    new submission with updated totals) and "overflow" (the viewer fell
+    behind; reconnect). Viewers share one database listener per worker.
+    
+    Args:
+        quiz_id: Quiz UUID
+        db: Database session
+        current_admin: Current authenticated admin
+        
+    Returns:
+        text/event-stream response
+        
+    Raises:
+        HTTPException: If quiz not found or unauthorized
+    """
+    try:
+        live_service.authorize_viewer(db, quiz_id, current_admin.id)
+    except ValueError as e:
+        raise _quiz_error_to_http(e)
+    
+    # The stream can stay open for hours; it must not hold a connection
+    db.close()
+    return StreamingResponse(
+        live_service.sse_stream(quiz_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/{quiz_id}/live")
+async def watch_live_submissions_ws(websocket: WebSocket, quiz_id: UUID):
+    """
+    The live submission stream over a WebSocket (Admin only).
+    
+    The first client message must be {"token": "<admin access token>"};
+    after that the server sends {"event": ..., "data": ...} messages with
+    the same events as the SSE stream.
+    
+    Args:
+        websocket: WebSocket connection
+        quiz_id: Quiz UUID
+    """
+    await websocket.accept()
+    try:
+        hello = await asyncio.wait_for(websocket.receive_json(), settings.LIVE_WS_AUTH_TIMEOUT_SECONDS)
+        token = hello.get("token") if isinstance(hello, dict) else None
+        await run_in_threadpool(live_service.authorize_token_viewer, str(token or ""), quiz_id)
+    except WebSocketDisconnect:
+        return
+    except (asyncio.TimeoutError, ValueError) as e:
+        await websocket.close(code=1008, reason=str(e) or "Authentication timed out")
+        return
+    
+    async def forward() -> None:
+        async for message in live_service.iter_messages(quiz_id):
+            await websocket.send_text(message.text)
+        await websocket.close()  # Overflow
+    
+    sender = asyncio.create_task(forward())
+    try:
+        while True:
+            await websocket.receive_text()  # Only used to notice the client leaving
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+
+
+def _quiz_error_to_http(e: ValueError) -> HTTPException:
+    """Map a service ValueError to 404 (not found), 403 (ownership) or 400."""
+    message = str(e)
+    if "not found" in message.lower():
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+    if "unauthorized" in message.lower():
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=message)
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
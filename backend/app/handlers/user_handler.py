@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
 from app.core.database import get_db
+from app.core.security import get_history_user_id
+from app.schemas.submission import SubmissionHistoryPage
 from app.schemas.user import UserCreate, UserResponse
 from app.accessors import user_accessor
+from app.services import submission_service
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
@@ -25,3 +30,49 @@ def register_user_email(
     """
     user = user_accessor.create_or_get_user(db, user_data.email)
     return UserResponse.model_validate(user)
+
+
+@router.get("/{user_id}/submissions", response_model=SubmissionHistoryPage)
+def get_submission_history(
+    user_id: UUID,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    token_user_id: str = Depends(get_history_user_id)
+):
+    """
+    Get a user's past attempts with quiz titles, newest first.
+    
+    Requires the history token returned with each of the user's
+    submissions (Authorization: Bearer), so knowing a user ID is not enough.
+    
+    Uses keyset pagination: pass next_cursor from one page as cursor to
+    get the next; every page costs the same regardless of depth.
+    
+    Args:
+        user_id: User UUID (from registration or a submission)
+        limit: Page size
+        cursor: Cursor from the previous page
+        db: Database session
+        token_user_id: User the history token was issued to
+        
+    Returns:
+        Page of submissions and the cursor for the next one
+        
+    Raises:
+        HTTPException: If the token belongs to another user or the cursor
+            is malformed
+    """
+    if token_user_id != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to view this user's submissions"
+        )
+    
+    try:
+        return submission_service.get_user_submission_history(db, user_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
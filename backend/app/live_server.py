@@ -0,0 +1,53 @@
+"""
+Live session server: ``python -m app.live_server``.
+
+Live sessions keep their state in the memory of one process, so every
+host and participant of a session must reach the same process. A single
+development server serves /api/live itself; in production (several
+gunicorn workers, recycled after WORKER_MAX_REQUESTS) run this server
+once on LIVE_SERVER_PORT and route /api/live/ to it.
+"""
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from app.core.admission import AdmissionControlMiddleware
+from app.core.config import settings
+from app.core.metrics import collect_metrics
+from app.handlers import live_session_handler
+
+app = FastAPI(
+    title=f"{settings.PROJECT_NAME} (live sessions)",
+    version=settings.VERSION
+)
+
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(live_session_handler.router)
+
+
+@app.get("/health")
+def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy"}
+
+
+@app.get("/metrics")
+def metrics():
+    """Point-in-time process metrics (live sessions, admission queues)."""
+    return collect_metrics()
+
+
+def main() -> None:
+    """Start the live session server (always a single process)."""
+    import uvicorn
+    uvicorn.run(app, host=settings.HOST, port=settings.LIVE_SERVER_PORT, workers=1)
+
+
+if __name__ == "__main__":
+    main()
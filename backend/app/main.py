@@ -1,11 +1,20 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError
+import threading
+import anyio.to_thread
+from app.core.admission import AdmissionControlMiddleware, total_admission_limit
+from app.core.compression import CompressionMiddleware
+from app.core.deadlines import DeadlineMiddleware
+from app.core.config import settings, worker_count
 from app.core.database import Base, engine
-from app.handlers import auth_handler, user_handler, quiz_handler, public_handler
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from app.core.invalidation import start_invalidation_listener
+from app.core.metrics import collect_metrics
+from app.core.security import get_current_admin
+from app.models.admin import Admin
+from app.handlers import auth_handler, user_handler, quiz_handler, public_handler, live_session_handler
+from app.services import partition_service, quiz_service, snapshot_service
 
 # Create FastAPI application
 app = FastAPI(
@@ -14,6 +23,12 @@ app = FastAPI(
     description="Quiz Management API with layered architecture"
 )
 
+# Per-route-class admission control (inside CORS so rejections carry CORS headers)
+app.add_middleware(AdmissionControlMiddleware)
+
+# Per-request deadlines; wraps admission so queueing time counts against the budget
+app.add_middleware(DeadlineMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -23,12 +38,88 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Negotiate gzip/brotli for responses above the minimum size
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
 # Include routers
 app.include_router(auth_handler.router)
 app.include_router(user_handler.router)
 app.include_router(quiz_handler.router)
 app.include_router(public_handler.router)
 
+# Live sessions need every connection of a session in one process; with
+# several workers they are served by app.live_server instead
+if worker_count() == 1:
+    app.include_router(live_session_handler.router)
+
+
+# Postgres SQLSTATE for a statement cancelled by statement_timeout or cancel()
+QUERY_CANCELED = "57014"
+
+
+@app.exception_handler(DBAPIError)
+async def handle_database_error(request: Request, exc: DBAPIError):
+    """Turn statements cancelled by the request deadline into clean 504s."""
+    if getattr(exc.orig, "pgcode", None) == QUERY_CANCELED:
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"detail": "Request deadline exceeded"}
+        )
+    raise exc
+
+
+@app.on_event("startup")
+def create_tables():
+    """Create database tables (at startup, so importing the app stays offline)."""
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+def open_cache_backend():
+    """Fail fast when the shared quiz cache does not fit where it is configured."""
+    from app.core.cache_backends import get_cache_backend
+    get_cache_backend().open()
+
+
+@app.on_event("startup")
+async def size_threadpool():
+    """Give sync handlers enough threads for every admitted request."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, total_admission_limit())
+
+
+@app.on_event("startup")
+def listen_for_invalidations():
+    """Evict this worker's cached quizzes when any worker changes them."""
+    start_invalidation_listener()
+
+
+@app.on_event("startup")
+def resume_quiz_purges():
+    """Finish purging quizzes that were soft-deleted before a restart."""
+    threading.Thread(
+        target=quiz_service.purge_pending_quizzes,
+        name="quiz-purge",
+        daemon=True
+    ).start()
+
+
+@app.on_event("startup")
+def maintain_submission_partitions():
+    """Keep future submission partitions created and archive expired ones."""
+    threading.Thread(
+        target=partition_service.maintain_partitions_forever,
+        name="submission-partitions",
+        daemon=True
+    ).start()
+
+
+@app.on_event("startup")
+def publish_public_snapshot():
+    """Keep the static public snapshot current (when PUBLIC_SNAPSHOT_DIR is set)."""
+    snapshot_service.start_snapshot_publisher()
+
 
 @app.get("/")
 def root():
@@ -44,3 +135,9 @@ def root():
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+def metrics(current_admin: Admin = Depends(get_current_admin)):
+    """Point-in-time process metrics (admission queues, caches, ...) (Admin only)."""
+    return collect_metrics()
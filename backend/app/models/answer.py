@@ -11,7 +11,7 @@ class Answer(Base):
     __tablename__ = "answers"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=False, unique=True)
+    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, unique=True)
     correct_answer = Column(Text, nullable=False)  # Stores the correct answer
     explanation = Column(Text, nullable=True)  # Optional explanation
     
@@ -19,7 +19,7 @@ class Question(Base):
     __tablename__ = "questions"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False, index=True)
     question_type = Column(Enum(QuestionType), nullable=False)
     question_text = Column(Text, nullable=False)
     options = Column(JSONB, nullable=True)  # For MCQ options: {"A": "option1", "B": "option2", ...}
@@ -27,7 +27,7 @@ class Question(Base):
     
     # Relationships
     quiz = relationship("Quiz", back_populates="questions")
-    answer = relationship("Answer", back_populates="question", uselist=False, cascade="all, delete-orphan")
+    answer = relationship("Answer", back_populates="question", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Question(id={self.id}, type={self.question_type}, order={self.order})>"
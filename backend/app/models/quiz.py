@@ -1,5 +1,8 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger, Column, DDL, String, Text, Boolean, Integer, DateTime, FetchedValue, ForeignKey, Index,
+    event, text
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -17,11 +20,97 @@ class Quiz(Base):
     admin_id = Column(UUID(as_uuid=True), ForeignKey("admins.id"), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    version = Column(Integer, default=1, nullable=False)  # Bumped on every content change
+    deleted_at = Column(DateTime, nullable=True, index=True)  # Soft delete; rows purged in background
+    pool_size = Column(Integer, nullable=True)  # Questions drawn per attempt (None = all)
+    pool_rules = Column(JSONB, nullable=True)  # Per-type draw counts: {"mcq": 30, "text": 10}
+    
+    # Set by the database on every insert and update (see QUIZ_CHANGE_TRIGGERS)
+    updated_at = Column(
+        DateTime, nullable=False,
+        server_default=text("timezone('utc', clock_timestamp())"), server_onupdate=FetchedValue()
+    )
+    change_seq = Column(
+        BigInteger, nullable=False, unique=True,
+        server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
     
     # Relationships
     admin = relationship("Admin", back_populates="quizzes")
-    questions = relationship("Question", back_populates="quiz", cascade="all, delete-orphan", order_by="Question.order")
-    submissions = relationship("QuizSubmission", back_populates="quiz", cascade="all, delete-orphan")
+    questions = relationship("Question", back_populates="quiz", cascade="all, delete-orphan", order_by="Question.order", passive_deletes=True)
+    submissions = relationship("QuizSubmission", back_populates="quiz", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Quiz(id={self.id}, title={self.title})>"
+
+
+# Admin dashboard keyset order over live quizzes
+Index(
+    "ix_quizzes_admin_created",
+    Quiz.admin_id,
+    Quiz.created_at.desc(),
+    Quiz.id.desc(),
+    postgresql_where=Quiz.deleted_at.is_(None)
+)
+
+
+class QuizTombstone(Base):
+    """Change-feed record of a quiz row that was purged from the database."""
+    
+    __tablename__ = "quiz_tombstones"
+    
+    change_seq = Column(BigInteger, primary_key=True)
+    quiz_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<QuizTombstone(quiz_id={self.quiz_id}, change_seq={self.change_seq})>"
+
+
+# Every write to quizzes (ORM, bulk UPDATE, raw INSERT ... SELECT) gets a
+# change_seq and updated_at, and purged rows leave a tombstone. change_seq
+# is the writer's transaction ID in the high bits and a per-transaction
+# counter in the low CHANGE_SEQ_COUNTER_BITS, so it orders changes by
+# transaction without any lock between writers.
+CHANGE_SEQ_COUNTER_BITS = 24
+
+# Every change below this bound was made by a finished transaction, and
+# every transaction that can still commit writes changes at or above it
+# (its ID is at least the snapshot's xmin). Serving only changes below it
+# means a client that has seen seq N can never miss a later commit < N.
+CHANGE_SEQ_HORIZON_SQL = (
+    f"(pg_snapshot_xmin(pg_current_snapshot())::text::bigint << {CHANGE_SEQ_COUNTER_BITS})"
+)
+
+QUIZ_CHANGE_TRIGGERS = DDL(f"""
+CREATE OR REPLACE FUNCTION quiz_next_change_seq() RETURNS bigint AS $$
+DECLARE
+    counter bigint := coalesce(nullif(current_setting('quiz.change_counter', true), ''), '0')::bigint + 1;
+BEGIN
+    IF counter >= (1::bigint << {CHANGE_SEQ_COUNTER_BITS}) THEN
+        RAISE EXCEPTION 'Too many quiz changes in one transaction';
+    END IF;
+    PERFORM set_config('quiz.change_counter', counter::text, true);
+    RETURN (pg_current_xact_id()::text::bigint << {CHANGE_SEQ_COUNTER_BITS}) | counter;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION quizzes_record_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO quiz_tombstones (change_seq, quiz_id, deleted_at)
+        VALUES (quiz_next_change_seq(), OLD.id, timezone('utc', clock_timestamp()));
+        RETURN OLD;
+    END IF;
+    NEW.change_seq := quiz_next_change_seq();
+    NEW.updated_at := timezone('utc', clock_timestamp());
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER quizzes_change_seq BEFORE INSERT OR UPDATE ON quizzes
+    FOR EACH ROW EXECUTE FUNCTION quizzes_record_change();
+CREATE TRIGGER quizzes_tombstone AFTER DELETE ON quizzes
+    FOR EACH ROW EXECUTE FUNCTION quizzes_record_change();
+""")
+event.listen(Quiz.__table__, "after_create", QUIZ_CHANGE_TRIGGERS.execute_if(dialect="postgresql"))
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, LargeBinary, cast, func
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -10,13 +10,22 @@ class QuizSubmission(Base):
     """Quiz submission model storing only final scores, not individual answers."""
     
     __tablename__ = "quiz_submissions"
+    # Monthly range partitions (see partition_accessor); the partition key
+    # must be part of the primary key
+    __table_args__ = {"postgresql_partition_by": "RANGE (submitted_at)"}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     score = Column(Integer, nullable=False)  # Number of correct answers
     total_questions = Column(Integer, nullable=False)  # Total questions in quiz
-    submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    submitted_at = Column(DateTime, default=datetime.utcnow, primary_key=True)
+    
+    # Item analytics: one bit per question position (LSB-first, matching
+    # Postgres get_bit) of the quiz version graded; no answer text is kept
+    quiz_version = Column(Integer, nullable=True)
+    correctness = Column(LargeBinary, nullable=True)  # Bit set = answered correctly
+    served = Column(LargeBinary, nullable=True)  # Bit set = question served (None = all)
     
     # Relationships
     quiz = relationship("Quiz", back_populates="submissions")
@@ -31,3 +40,27 @@ class QuizSubmission(Base):
         if self.total_questions == 0:
             return 0.0
         return (self.score / self.total_questions) * 100
+
+
+# Leaderboard order (best fraction correct, then earliest). Pooled attempts of
+# one quiz can differ in total_questions, so raw scores are not comparable.
+# The leaderboard queries repeat this expression verbatim so the planner
+# matches it; the included columns keep rank counts index-only.
+Index(
+    "ix_quiz_submissions_leaderboard",
+    QuizSubmission.quiz_id,
+    func.coalesce(
+        cast(QuizSubmission.score, DOUBLE_PRECISION) / func.nullif(QuizSubmission.total_questions, 0), 0
+    ).desc(),
+    QuizSubmission.submitted_at,
+    postgresql_include=["score", "total_questions"]
+)
+
+# Per-user history, newest first; covering, so keyset pages never touch the heap
+Index(
+    "ix_quiz_submissions_user_history",
+    QuizSubmission.user_id,
+    QuizSubmission.submitted_at.desc(),
+    QuizSubmission.id.desc(),
+    postgresql_include=["quiz_id", "score", "total_questions"]
+)
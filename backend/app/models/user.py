@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -12,7 +12,7 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String, unique=True, nullable=False, index=True)
+    email = Column(String, nullable=False)  # Stored normalized (lowercase)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
@@ -20,3 +20,7 @@ class User(Base):
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
+
+
+# Case-insensitive uniqueness; also serves lookups and the upsert conflict target
+Index("uq_users_email_lower", func.lower(User.email), unique=True)
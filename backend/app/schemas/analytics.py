@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+
+class ItemStatistic(BaseModel):
+    """Schema for one question's item-analysis statistics."""
+    question_id: UUID
+    order: int
+    served: int
+    correct: int
+    p_value: Optional[float] = None  # Share of takers who answered correctly (difficulty)
+    discrimination: Optional[float] = None  # Point-biserial correlation with total score
+
+
+class ItemAnalysisResponse(BaseModel):
+    """Schema for a quiz's item analysis (current quiz version only)."""
+    quiz_id: UUID
+    quiz_version: int
+    items: List[ItemStatistic]
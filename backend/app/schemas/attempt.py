@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import Dict
+from datetime import datetime
+from uuid import UUID
+from app.schemas.quiz import QuizPublic
+
+
+class QuizAttemptResponse(BaseModel):
+    """Schema for a started attempt: the drawn questions plus a signed token."""
+    attempt_id: UUID
+    attempt_token: str
+    expires_at: datetime
+    quiz: QuizPublic
+
+
+class AttemptDraftSave(BaseModel):
+    """Schema for autosaving an attempt's answers (replaces the draft)."""
+    attempt_token: str
+    answers: Dict[str, str]  # question_id (as string) -> user_answer
+
+
+class AttemptDraftResponse(BaseModel):
+    """Schema for an attempt's saved draft answers."""
+    attempt_id: UUID
+    answers: Dict[str, str]
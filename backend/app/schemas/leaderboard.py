@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+
+class LeaderboardEntryPublic(BaseModel):
+    """Schema for one leaderboard row."""
+    rank: int
+    name: str  # Masked email
+    score: int
+    total_questions: int
+    percentage: float
+    submitted_at: datetime
+
+
+class LeaderboardRank(BaseModel):
+    """Schema for a single submission's position on the leaderboard."""
+    submission_id: UUID
+    rank: int
+    score: int
+
+
+class LeaderboardResponse(BaseModel):
+    """
+    Schema for a quiz leaderboard.
+    
+    Includes every submission stored before as_of; later ones from other
+    workers may be missing for up to max_staleness_seconds.
+    """
+    quiz_id: UUID
+    entries: List[LeaderboardEntryPublic]
+    as_of: datetime
+    max_staleness_seconds: float
+    submission_rank: Optional[LeaderboardRank] = None
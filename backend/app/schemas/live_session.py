@@ -0,0 +1,55 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from enum import Enum
+from app.schemas.user import NormalizedEmail
+
+
+class LiveSessionState(str, Enum):
+    """Phase of a live session."""
+    LOBBY = "lobby"  # Participants joining, no question shown yet
+    QUESTION = "question"  # Answer window open
+    REVEAL = "reveal"  # Window closed, results shown
+    FINISHED = "finished"
+
+
+class LiveSessionCreate(BaseModel):
+    """Schema for starting a live session of a quiz."""
+    quiz_id: UUID
+    persist: bool = True  # Store each participant's submission when the session ends
+
+
+class LiveQuestionOpen(BaseModel):
+    """Schema for opening the next question."""
+    seconds: Optional[int] = Field(None, ge=1, le=600)  # Answer window (default LIVE_SESSION_ANSWER_SECONDS)
+
+
+class LiveJoin(BaseModel):
+    """Schema for a participant's first WebSocket message."""
+    email: NormalizedEmail
+
+
+class LiveStanding(BaseModel):
+    """Schema for one leaderboard row of a live session."""
+    rank: int
+    name: str  # Masked email
+    score: int
+
+
+class LiveSessionStatus(BaseModel):
+    """Schema for a live session's state (host view)."""
+    code: str  # Participants join with this
+    quiz_id: UUID
+    title: str
+    state: LiveSessionState
+    question_index: Optional[int] = None  # Current or last question (0-based)
+    question_count: int
+    participant_count: int
+    connected_count: int
+    answered: int = 0  # Answers to the current question
+    correct: int = 0
+    counts: Dict[str, int] = {}  # Answers per option (MCQ and true/false)
+    closes_at: Optional[datetime] = None  # UTC, while a question is open
+    leaderboard: List[LiveStanding] = []
+    persisted_submissions: Optional[int] = None  # Set once the session has ended
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, Dict, List
 from datetime import datetime
 from uuid import UUID
@@ -12,12 +12,36 @@ class QuestionType(str, Enum):
     TEXT = "text"
 
 
+def _reject_explicit_nulls(model: BaseModel, fields: tuple) -> BaseModel:
+    """
+    Reject partial updates that set a non-nullable field to null (omit
+    the field instead to leave it unchanged).
+    
+    Raises:
+        ValueError: If any of the fields was sent as null
+    """
+    nulls = [field for field in fields if field in model.model_fields_set and getattr(model, field) is None]
+    if nulls:
+        raise ValueError(f"{', '.join(nulls)} cannot be null")
+    return model
+
+
 class AnswerCreate(BaseModel):
     """Schema for creating an answer."""
     correct_answer: str
     explanation: Optional[str] = None
 
 
+class AnswerUpdate(BaseModel):
+    """Schema for partially updating an answer."""
+    correct_answer: Optional[str] = None
+    explanation: Optional[str] = None
+    
+    @model_validator(mode="after")
+    def check_nulls(self) -> "AnswerUpdate":
+        return _reject_explicit_nulls(self, ("correct_answer",))
+
+
 class AnswerResponse(BaseModel):
     """Schema for answer response (admin view)."""
     id: UUID
@@ -38,6 +62,37 @@ class QuestionCreate(BaseModel):
     answer: AnswerCreate
 
 
+class QuestionUpdate(BaseModel):
+    """Schema for partially updating a question and its answer."""
+    question_type: Optional[QuestionType] = None
+    question_text: Optional[str] = None
+    options: Optional[Dict[str, str]] = None
+    answer: Optional[AnswerUpdate] = None
+    
+    @model_validator(mode="after")
+    def check_nulls(self) -> "QuestionUpdate":
+        return _reject_explicit_nulls(self, ("question_type", "question_text"))
+
+
+class QuestionPatch(QuestionUpdate):
+    """Schema for a question update inside a quiz questions diff."""
+    id: UUID
+
+
+class QuizQuestionsPatch(BaseModel):
+    """
+    Schema for a minimal diff of a quiz's questions.
+    
+    New questions are placed at their 1-based ``order`` in the final list.
+    ``order`` (when given) lists every remaining existing question ID in
+    its new position; questions are renumbered 1..n afterwards.
+    """
+    add: List[QuestionCreate] = []
+    update: List[QuestionPatch] = []
+    delete: List[UUID] = []
+    order: Optional[List[UUID]] = None
+
+
 class QuestionResponse(BaseModel):
     """Schema for question response (admin view with answers)."""
     id: UUID
@@ -69,6 +124,8 @@ class QuizBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     is_active: bool = True
+    pool_size: Optional[int] = Field(None, ge=1)  # Questions drawn per attempt
+    pool_rules: Optional[Dict[QuestionType, int]] = None  # Minimum draws per question type
 
 
 class QuizCreate(QuizBase):
@@ -81,6 +138,8 @@ class QuizUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     is_active: Optional[bool] = None
+    pool_size: Optional[int] = Field(None, ge=1)
+    pool_rules: Optional[Dict[QuestionType, int]] = None
 
 
 class QuizResponse(QuizBase):
@@ -107,13 +166,116 @@ class QuizListItem(BaseModel):
         from_attributes = True
 
 
+class QuizChange(BaseModel):
+    """Schema for one entry of the public catalogue change feed."""
+    seq: int
+    id: UUID
+    removed: bool  # Deactivated, deleted or purged: drop it from the local copy
+    quiz: Optional[QuizListItem] = None  # Current listing when not removed
+
+
+class QuizChangeFeed(BaseModel):
+    """Schema for a page of catalogue changes, oldest first."""
+    changes: List[QuizChange]
+    next_since: int  # Pass back as `since` on the next poll
+    has_more: bool
+    reset: bool = False  # `since` is unknown: drop the local copy and sync from 0
+
+
+class QuizSummaryItem(BaseModel):
+    """Schema for one quiz on the admin dashboard."""
+    id: UUID
+    title: str
+    is_active: bool
+    created_at: datetime
+    version: int
+    question_count: int
+    submission_count: int
+    average_percentage: Optional[float] = None  # None until the first submission
+    last_submission_at: Optional[datetime] = None
+
+
+class QuizSummaryPage(BaseModel):
+    """Schema for a page of the admin dashboard, newest quizzes first."""
+    items: List[QuizSummaryItem]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page
+
+
 class QuizPublic(BaseModel):
     """Schema for public quiz view (without answers)."""
     id: UUID
     title: str
     description: Optional[str] = None
     created_at: datetime
+    version: int = 1
+    pool_size: Optional[int] = None
+    pool_rules: Optional[Dict[str, int]] = None
     questions: List[QuestionPublic] = []
     
     class Config:
         from_attributes = True
+
+
+class QuizImportResult(BaseModel):
+    """Schema for the outcome of a bulk quiz import."""
+    imported_quizzes: int
+    imported_questions: int
+    quiz_ids: List[UUID]
+
+
+class QuizCloneRequest(BaseModel):
+    """Schema for cloning a quiz (all fields optional)."""
+    title: Optional[str] = Field(None, min_length=1, max_length=255)  # Default: "<title> (copy)"
+    is_active: Optional[bool] = None  # Default: same as the source
+
+
+class QuizCloneResult(BaseModel):
+    """Schema for a cloned quiz."""
+    id: UUID
+    source_quiz_id: UUID
+    title: str
+    question_count: int
+
+
+class BulkQuizAction(str, Enum):
+    """Bulk quiz operations."""
+    ACTIVATE = "activate"
+    DEACTIVATE = "deactivate"
+    DELETE = "delete"
+    TRANSFER = "transfer"
+
+
+class QuizBulkFilter(BaseModel):
+    """Schema for selecting an admin's quizzes by attributes instead of IDs."""
+    is_active: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    title_contains: Optional[str] = Field(None, min_length=1)
+    
+    @model_validator(mode="after")
+    def check_criteria(self) -> "QuizBulkFilter":
+        # An empty filter would select every live quiz the admin owns
+        if all(getattr(self, field) is None for field in self.model_fields):
+            raise ValueError("filter must set at least one criterion")
+        return self
+
+
+class QuizBulkRequest(BaseModel):
+    """Schema for a bulk operation on either explicit IDs or a filter."""
+    action: BulkQuizAction
+    ids: Optional[List[UUID]] = Field(None, max_length=10000)
+    filter: Optional[QuizBulkFilter] = None
+    target_admin_id: Optional[UUID] = None  # Required for transfer
+
+
+class QuizBulkOutcome(BaseModel):
+    """Schema for the outcome of a bulk operation on one quiz."""
+    id: UUID
+    status: str  # "updated" or "not_found" (missing, deleted or not yours)
+
+
+class QuizBulkResult(BaseModel):
+    """Schema for a bulk operation result."""
+    action: BulkQuizAction
+    updated: int
+    outcomes: List[QuizBulkOutcome]
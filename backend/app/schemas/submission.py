@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from typing import Dict, List, Optional
 from datetime import datetime
 from uuid import UUID
+from app.schemas.user import NormalizedEmail
 
 
 class UserAnswerInput(BaseModel):
@@ -12,8 +13,9 @@ class UserAnswerInput(BaseModel):
 
 class QuizSubmissionCreate(BaseModel):
     """Schema for submitting a quiz."""
-    email: EmailStr
-    answers: Dict[str, str]  # question_id (as string) -> user_answer
+    email: NormalizedEmail
+    answers: Dict[str, str] = {}  # question_id (as string) -> user_answer; overrides the draft
+    attempt_token: Optional[str] = None  # From POST .../attempts; required for pooled quizzes
 
 
 class QuestionResult(BaseModel):
@@ -31,12 +33,14 @@ class QuizSubmissionResponse(BaseModel):
     submission_id: UUID
     quiz_id: UUID
     quiz_title: str
+    user_id: UUID
     user_email: str
     score: int
     total_questions: int
     percentage: float
     submitted_at: datetime
     results: List[QuestionResult]
+    history_token: str  # Bearer token for GET /api/users/{user_id}/submissions
     
     class Config:
         from_attributes = True
@@ -54,3 +58,20 @@ class SubmissionSummary(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class SubmissionHistoryItem(BaseModel):
+    """Schema for one past attempt in a user's history."""
+    id: UUID
+    quiz_id: UUID
+    quiz_title: str
+    score: int
+    total_questions: int
+    percentage: float
+    submitted_at: datetime
+
+
+class SubmissionHistoryPage(BaseModel):
+    """Schema for a page of a user's history, newest first."""
+    items: List[SubmissionHistoryItem]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page
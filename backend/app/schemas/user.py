@@ -1,11 +1,21 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import AfterValidator, BaseModel, EmailStr
+from typing import Annotated
 from datetime import datetime
 from uuid import UUID
 
 
+def normalize_email(email: str) -> str:
+    """Lowercase quiz-taker emails so identity is case-insensitive."""
+    return email.strip().lower()
+
+
+# Email validated and normalized at the API boundary
+NormalizedEmail = Annotated[EmailStr, AfterValidator(normalize_email)]
+
+
 class UserBase(BaseModel):
     """Base schema for User."""
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class UserCreate(UserBase):
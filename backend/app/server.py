@@ -0,0 +1,21 @@
+"""
+Server entry point: ``python -m app.server``.
+
+SERVER_MODE=development runs a single uvicorn process with auto-reload;
+SERVER_MODE=production hands over to gunicorn with gunicorn.conf.py.
+"""
+import os
+from app.core.config import settings
+
+
+def main() -> None:
+    """Start the API server in the configured mode."""
+    if settings.SERVER_MODE == "production":
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn.conf.py", "app.main:app"])
+    
+    import uvicorn
+    uvicorn.run("app.main:app", host=settings.HOST, port=settings.PORT, reload=True)
+
+
+if __name__ == "__main__":
+    main()
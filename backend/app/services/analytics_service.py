@@ -0,0 +1,72 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+import math
+from app.accessors import quiz_accessor, submission_accessor
+from app.schemas.analytics import ItemAnalysisResponse, ItemStatistic
+
+
+def get_item_analysis(db: Session, quiz_id: UUID, admin_id: UUID) -> ItemAnalysisResponse:
+    """
+    Compute per-question difficulty and discrimination (verify ownership).
+    
+    Only submissions graded against the current quiz version are used,
+    since bit positions follow that version's question order.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        admin_id: Admin UUID
+        
+    Returns:
+        ItemAnalysisResponse schema
+        
+    Raises:
+        ValueError: If quiz not found or unauthorized
+    """
+    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
+    
+    if not quiz:
+        raise ValueError("Quiz not found")
+    
+    if quiz.admin_id != admin_id:
+        raise ValueError("Unauthorized to view this quiz")
+    
+    rows = submission_accessor.get_item_statistics(
+        db, quiz_id, quiz.version, len(quiz.questions)
+    )
+    
+    items = []
+    for question, row in zip(quiz.questions, rows):
+        served, correct = row["served"], row["correct"]
+        items.append(ItemStatistic(
+            question_id=question.id,
+            order=question.order,
+            served=served,
+            correct=correct,
+            p_value=correct / served if served else None,
+            discrimination=_point_biserial(row)
+        ))
+    
+    return ItemAnalysisResponse(quiz_id=quiz.id, quiz_version=quiz.version, items=items)
+
+
+def _point_biserial(row: dict) -> Optional[float]:
+    """
+    Point-biserial correlation between answering an item correctly and the
+    total score, from the streamed sums of get_item_statistics.
+    """
+    served, correct = row["served"], row["correct"]
+    if served < 2 or correct == 0 or correct == served:
+        return None
+    
+    mean = row["served_score_sum"] / served
+    variance = row["served_score_sq_sum"] / served - mean * mean
+    if variance <= 0:
+        return None
+    
+    mean_correct = row["correct_score_sum"] / correct
+    mean_incorrect = (row["served_score_sum"] - row["correct_score_sum"]) / (served - correct)
+    p = correct / served
+    
+    return (mean_correct - mean_incorrect) / math.sqrt(variance) * math.sqrt(p * (1 - p))
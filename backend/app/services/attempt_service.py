@@ -0,0 +1,211 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from uuid import UUID
+import random
+import uuid
+from app.accessors import quiz_accessor
+from app.accessors.quiz_accessor import QuestionPool
+from app.core.cache import question_pool_cache, quiz_cache_generation, set_if_not_invalidated
+from app.core.drafts import get_draft_store
+from app.core.security import create_attempt_token, decode_attempt_token
+from app.schemas.attempt import QuizAttemptResponse, AttemptDraftSave, AttemptDraftResponse
+from app.services import quiz_service
+
+_random = random.SystemRandom()
+
+
+def start_attempt(db: Session, quiz_id: UUID) -> QuizAttemptResponse:
+    """
+    Start a quiz attempt: draw its questions and sign the drawn set.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        QuizAttemptResponse with the drawn questions in served order
+        
+    Raises:
+        ValueError: If quiz not found or inactive
+    """
+    quiz_public = quiz_service.get_quiz_for_public(db, quiz_id)
+    attempt_id = uuid.uuid4()
+    if not quiz_public.pool_size and not quiz_public.pool_rules:
+        # Every question in quiz order; the token need not list them
+        token, expires_at = create_attempt_token(str(attempt_id), str(quiz_id), quiz_public.version, None)
+        return QuizAttemptResponse(
+            attempt_id=attempt_id,
+            attempt_token=token,
+            expires_at=expires_at,
+            quiz=quiz_public
+        )
+    
+    pool = get_question_pool(db, quiz_id)
+    drawn = draw_questions(pool, quiz_public.pool_size, quiz_public.pool_rules)
+    
+    questions_by_id = {question.id: question for question in quiz_public.questions}
+    token, expires_at = create_attempt_token(
+        str(attempt_id),
+        str(quiz_id),
+        quiz_public.version,
+        [str(question_id) for question_id in drawn]
+    )
+    
+    return QuizAttemptResponse(
+        attempt_id=attempt_id,
+        attempt_token=token,
+        expires_at=expires_at,
+        quiz=quiz_public.model_copy(update={
+            "questions": [questions_by_id[question_id] for question_id in drawn]
+        })
+    )
+
+
+def get_question_pool(db: Session, quiz_id: UUID) -> QuestionPool:
+    """
+    Get the cached question ID pool for a quiz.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        QuestionPool (IDs in quiz order and grouped by question type)
+    """
+    pool = question_pool_cache.get(str(quiz_id))
+    if pool is None:
+        generation = quiz_cache_generation()
+        pool = quiz_accessor.get_question_pool(db, quiz_id)
+        set_if_not_invalidated(question_pool_cache, quiz_id, pool, generation)
+    return pool
+
+
+def draw_questions(
+    pool: QuestionPool,
+    pool_size: Optional[int],
+    pool_rules: Optional[Dict[str, int]]
+) -> List[UUID]:
+    """
+    Draw an attempt's questions from a pool.
+    
+    Each rule draws that many questions of its type; any remaining
+    ``pool_size`` is filled from the leftover questions of every type.
+    Draws are shuffled. Without a pool size or rules, every question is
+    served in quiz order.
+    
+    Args:
+        pool: Question IDs in quiz order and grouped by type
+        pool_size: Total questions to draw (None = sum of rules)
+        pool_rules: Per-type draw counts
+        
+    Returns:
+        Drawn question UUIDs in served order
+    """
+    if not pool_size and not pool_rules:
+        return list(pool.ordered)
+    
+    drawn: List[UUID] = []
+    leftovers: List[UUID] = []
+    for question_type, ids in pool.by_type.items():
+        count = min((pool_rules or {}).get(question_type, 0), len(ids))
+        picked = _random.sample(ids, count)
+        drawn.extend(picked)
+        if pool_size:
+            picked_set = set(picked)
+            leftovers.extend(question_id for question_id in ids if question_id not in picked_set)
+    
+    remaining = (pool_size or 0) - len(drawn)
+    if remaining > 0:
+        drawn.extend(_random.sample(leftovers, min(remaining, len(leftovers))))
+    
+    _random.shuffle(drawn)
+    return drawn
+
+
+def resolve_attempt(
+    quiz_id: UUID,
+    attempt_token: str,
+    version: Optional[int] = None
+) -> tuple[str, Optional[List[UUID]]]:
+    """
+    Verify an attempt token and return the attempt and its served questions.
+    
+    Args:
+        quiz_id: Quiz UUID the attempt must belong to
+        attempt_token: Token returned by start_attempt
+        version: Current quiz version; when given, attempts drawn from an
+            older version are rejected
+            
+    Returns:
+        Tuple of (attempt ID, served question UUIDs in served order, or
+        None when every question was served)
+        
+    Raises:
+        ValueError: If the token is invalid, expired, for another quiz or
+            for an older version of the quiz
+    """
+    claims = decode_attempt_token(attempt_token)
+    if claims is None or claims.get("quiz") != str(quiz_id):
+        raise ValueError("Invalid or expired attempt token")
+    if version is not None and claims.get("v") != version:
+        raise ValueError("Quiz has changed since this attempt started; start a new attempt")
+    
+    question_ids = claims.get("q")
+    if question_ids is None:
+        return claims["jti"], None
+    return claims["jti"], [UUID(question_id) for question_id in question_ids]
+
+
+def save_draft(quiz_id: UUID, attempt_id: UUID, draft: AttemptDraftSave) -> None:
+    """
+    Autosave an attempt's answers, replacing any previous draft.
+    
+    No database work happens here; drafts live in the host-local draft store.
+    The caller has already held the answers to the quiz's submission
+    limits (known question IDs, answer lengths); answers to questions
+    the attempt was not served are dropped.
+    
+    Args:
+        quiz_id: Quiz UUID
+        attempt_id: Attempt UUID from the URL
+        draft: Token and current answers
+        
+    Raises:
+        ValueError: If the token is invalid or for another attempt
+    """
+    token_attempt_id, question_ids = resolve_attempt(quiz_id, draft.attempt_token)
+    if token_attempt_id != str(attempt_id):
+        raise ValueError("Invalid or expired attempt token")
+    
+    answers = draft.answers
+    if question_ids is not None:
+        served = {str(question_id) for question_id in question_ids}
+        answers = {
+            question_id: answer
+            for question_id, answer in answers.items()
+            if question_id in served
+        }
+    get_draft_store().save(token_attempt_id, answers)
+
+
+def get_draft(quiz_id: UUID, attempt_id: UUID, attempt_token: str) -> AttemptDraftResponse:
+    """
+    Get an attempt's saved draft answers (to resume after a reconnect).
+    
+    Args:
+        quiz_id: Quiz UUID
+        attempt_id: Attempt UUID from the URL
+        attempt_token: Token returned by start_attempt
+        
+    Returns:
+        AttemptDraftResponse (empty answers if nothing was saved)
+        
+    Raises:
+        ValueError: If the token is invalid or for another attempt
+    """
+    token_attempt_id, _ = resolve_attempt(quiz_id, attempt_token)
+    if token_attempt_id != str(attempt_id):
+        raise ValueError("Invalid or expired attempt token")
+    
+    answers = get_draft_store().load(token_attempt_id) or {}
+    return AttemptDraftResponse(attempt_id=attempt_id, answers=answers)
@@ -0,0 +1,65 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+from app.accessors import submission_accessor
+from app.core.leaderboard import leaderboards
+from app.schemas.leaderboard import LeaderboardEntryPublic, LeaderboardRank, LeaderboardResponse
+from app.services import quiz_service
+
+
+def get_leaderboard(
+    db: Session,
+    quiz_id: UUID,
+    k: int,
+    submission_id: Optional[UUID] = None
+) -> LeaderboardResponse:
+    """
+    Get a quiz's top k submissions, optionally with one submission's rank.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        k: Number of entries (at most LEADERBOARD_SIZE)
+        submission_id: Submission whose exact rank to include
+        
+    Returns:
+        LeaderboardResponse schema
+        
+    Raises:
+        ValueError: If quiz not found or inactive, or the submission
+            does not belong to the quiz
+    """
+    quiz_service.get_quiz_for_public(db, quiz_id)
+    
+    board = leaderboards.get(
+        quiz_id,
+        lambda limit: submission_accessor.get_top_submissions(db, quiz_id, limit)
+    )
+    entries = [
+        LeaderboardEntryPublic(
+            rank=rank,
+            name=entry.name,
+            score=entry.score,
+            total_questions=entry.total_questions,
+            percentage=(entry.score / entry.total_questions) * 100 if entry.total_questions else 0.0,
+            submitted_at=entry.submitted_at
+        )
+        for rank, entry in enumerate(board.top(k), start=1)
+    ]
+    
+    submission_rank = None
+    if submission_id is not None:
+        ranked = submission_accessor.get_submission_rank(db, quiz_id, submission_id)
+        if ranked is None:
+            raise ValueError("Submission not found")
+        submission_rank = LeaderboardRank(
+            submission_id=submission_id, rank=ranked[0], score=ranked[1]
+        )
+    
+    return LeaderboardResponse(
+        quiz_id=quiz_id,
+        entries=entries,
+        as_of=board.as_of,
+        max_staleness_seconds=leaderboards.max_staleness,
+        submission_rank=submission_rank
+    )
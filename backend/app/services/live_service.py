@@ -0,0 +1,123 @@
+from sqlalchemy.orm import Session
+from typing import AsyncIterator
+from uuid import UUID
+import asyncio
+from app.accessors import admin_accessor, quiz_accessor, submission_accessor
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.live import AggregateSeed, LiveMessage, Subscription, format_event, live_hub
+from app.core.security import decode_access_token
+
+# Sent after LIVE_HEARTBEAT_SECONDS of silence so proxies keep the stream open
+KEEPALIVE = LiveMessage(sse=b": keepalive\n\n", text='{"event":"keepalive","data":{}}')
+
+
+def authorize_viewer(db: Session, quiz_id: UUID, admin_id: UUID) -> None:
+    """
+    Check that an admin may watch a quiz's live submissions.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        admin_id: Admin UUID
+        
+    Raises:
+        ValueError: If quiz not found or unauthorized
+    """
+    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=False)
+    if not quiz:
+        raise ValueError("Quiz not found")
+    if quiz.admin_id != admin_id:
+        raise ValueError("Unauthorized to view this quiz")
+
+
+def admin_id_from_token(token: str) -> UUID:
+    """
+    Resolve an admin access token sent over a WebSocket (browsers cannot
+    set headers on one).
+    
+    Args:
+        token: Admin JWT
+        
+    Returns:
+        Admin UUID
+        
+    Raises:
+        ValueError: If the token is invalid or the admin does not exist
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None or payload.get("typ") is not None:
+        raise ValueError("Could not validate credentials")
+    
+    with SessionLocal() as db:
+        admin = admin_accessor.get_admin_by_id(db, payload["sub"])
+        if admin is None:
+            raise ValueError("Could not validate credentials")
+        return admin.id
+
+
+def authorize_token_viewer(token: str, quiz_id: UUID) -> None:
+    """
+    Check an admin access token and that its admin may watch the quiz.
+    
+    Args:
+        token: Admin JWT
+        quiz_id: Quiz UUID
+        
+    Raises:
+        ValueError: If the token is invalid, or quiz not found or unauthorized
+    """
+    admin_id = admin_id_from_token(token)
+    with SessionLocal() as db:
+        authorize_viewer(db, quiz_id, admin_id)
+
+
+def load_aggregate(quiz_id: str) -> AggregateSeed:
+    """Load a quiz's submission totals for the live hub (blocking)."""
+    with SessionLocal() as db:
+        return submission_accessor.get_live_aggregate(db, UUID(quiz_id))
+
+
+async def iter_messages(quiz_id: UUID) -> AsyncIterator[LiveMessage]:
+    """
+    Yield a quiz's live events until the viewer goes away.
+    
+    The first message carries the running totals; then every new
+    submission arrives with updated totals. A keepalive message is
+    yielded after LIVE_HEARTBEAT_SECONDS of silence, and a viewer that
+    falls LIVE_QUEUE_SIZE messages behind gets an "overflow" event and
+    the stream ends (clients reconnect for fresh totals).
+    
+    Args:
+        quiz_id: Quiz UUID
+        
+    Yields:
+        LiveMessage (encoded for SSE and WebSocket)
+    """
+    subscription: Subscription = live_hub.subscribe(str(quiz_id), load_aggregate)
+    try:
+        while True:
+            if subscription.overflowed and subscription.queue.empty():
+                yield format_event("overflow", {"detail": "Viewer fell behind; reconnect"})
+                return
+            try:
+                yield await asyncio.wait_for(subscription.queue.get(), settings.LIVE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE
+    finally:
+        live_hub.unsubscribe(str(quiz_id), subscription)
+
+
+async def sse_stream(quiz_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Live events framed as Server-Sent Events.
+    
+    Args:
+        quiz_id: Quiz UUID
+        
+    Yields:
+        SSE message bytes
+    """
+    yield b"retry: 3000\n\n"
+    async for message in iter_messages(quiz_id):
+        yield message.sse
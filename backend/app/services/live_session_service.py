@@ -0,0 +1,664 @@
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Set
+from uuid import UUID
+import asyncio
+import json
+import logging
+import secrets
+import time
+from fastapi import WebSocket
+from fastapi.concurrency import run_in_threadpool
+from app.accessors import quiz_accessor, submission_accessor, user_accessor
+from app.accessors.submission_accessor import check_answer_correctness
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.leaderboard import display_name
+from app.core.metrics import register_metrics
+from app.models.question import QuestionType
+from app.schemas.live_session import LiveSessionState, LiveSessionStatus, LiveStanding
+
+logger = logging.getLogger(__name__)
+
+# Join codes: digits only, easy to read out to a room
+CODE_LENGTH = 6
+
+
+class LiveQuestion(NamedTuple):
+    """A question as played in a live session, with its answer key."""
+    id: UUID
+    position: int  # Index in quiz order (bit position in correctness bitmaps)
+    question_type: QuestionType
+    question_text: str
+    options: Optional[Dict[str, str]]
+    correct_answer: str
+    explanation: Optional[str]
+
+
+class LiveQuiz(NamedTuple):
+    """Everything a session needs from the database, loaded once."""
+    id: UUID
+    title: str
+    version: int
+    questions: List[LiveQuestion]
+
+
+def encode(event: str, data: dict) -> str:
+    """Encode one WebSocket message as {"event": ..., "data": ...}."""
+    return json.dumps({"event": event, "data": data}, separators=(",", ":"), default=str)
+
+
+def countable_answers(question: LiveQuestion) -> Optional[Set[str]]:
+    """Normalized answers tallied per option (None for free-text questions)."""
+    if question.question_type == QuestionType.MCQ and question.options:
+        return {key.strip().lower() for key in question.options}
+    if question.question_type == QuestionType.TRUE_FALSE:
+        return {"true", "false"}
+    return None
+
+
+class Connection:
+    """
+    Outgoing side of one WebSocket.
+    
+    Messages go into a bounded queue drained by a writer task, so a
+    broadcast to thousands of sockets is a loop of put_nowait calls and a
+    slow client never delays anyone else; a client whose queue fills up
+    is disconnected.
+    """
+    
+    def __init__(self, websocket: WebSocket, maxsize: int):
+        self.websocket = websocket
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._writer = asyncio.get_running_loop().create_task(self._write())
+    
+    def send(self, text: str) -> None:
+        """Queue a message (dropped if the connection is closed)."""
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(text)
+        except asyncio.QueueFull:
+            self.close(1013, "Client too slow")
+    
+    def finish(self) -> None:
+        """Close once every queued message has been sent."""
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            self.close()
+    
+    def close(self, code: int = 1000, reason: str = "") -> None:
+        """Close now, discarding queued messages."""
+        if self.closed:
+            return
+        self.closed = True
+        self._writer.cancel()
+        asyncio.get_running_loop().create_task(self._close(code, reason))
+    
+    async def _close(self, code: int, reason: str) -> None:
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass  # Already gone
+    
+    async def _write(self) -> None:
+        try:
+            while True:
+                text = await self._queue.get()
+                if text is None:
+                    self.closed = True
+                    await self._close(1000, "")
+                    return
+                await self.websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.closed = True  # Client went away; the reader notices too
+
+
+class Participant:
+    """One player: identity, score and answers so far."""
+    
+    __slots__ = ("email", "name", "score", "time_ms", "answers", "connection")
+    
+    def __init__(self, email: str):
+        self.email = email
+        self.name = display_name(email)
+        self.score = 0
+        self.time_ms = 0  # Time taken on correct answers; breaks score ties
+        self.answers: Dict[int, bool] = {}  # Question index -> correct
+        self.connection: Optional[Connection] = None
+
+
+class QuestionTally:
+    """Answer counts for one question."""
+    
+    __slots__ = ("answered", "correct", "counts")
+    
+    def __init__(self):
+        self.answered = 0
+        self.correct = 0
+        self.counts: Dict[str, int] = {}
+
+
+class LiveSession:
+    """
+    One live event: the host opens questions one at a time, participants
+    answer within the window, and everyone sees the results.
+    
+    All state is mutated on the event loop only. Answers are graded as
+    they arrive, so closing a question is a broadcast, not a grading
+    pass; nothing touches the database until the session ends.
+    """
+    
+    def __init__(self, code: str, quiz: LiveQuiz, admin_id: UUID, persist: bool):
+        self.code = code
+        self.quiz = quiz
+        self.admin_id = admin_id
+        self.persist = persist
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.state = LiveSessionState.LOBBY
+        self.index = -1  # Current or last question
+        self.participants: Dict[str, Participant] = {}
+        self.connected = 0
+        self.hosts: Set[Connection] = set()
+        self.tallies: List[QuestionTally] = []
+        self.persisted: Optional[int] = None
+        self._opened_at = 0.0  # Loop time the current window opened
+        self._closes_at: Optional[float] = None  # Epoch seconds
+        self._question_message: Optional[str] = None
+        self._close_timer: Optional[asyncio.TimerHandle] = None
+        self._tally_task: Optional[asyncio.Task] = None
+        self._end_lock = asyncio.Lock()
+    
+    def status(self) -> LiveSessionStatus:
+        """Current state for the host."""
+        tally = self.tallies[self.index] if self.index >= 0 else QuestionTally()
+        return LiveSessionStatus(
+            code=self.code,
+            quiz_id=self.quiz.id,
+            title=self.quiz.title,
+            state=self.state,
+            question_index=self.index if self.index >= 0 else None,
+            question_count=len(self.quiz.questions),
+            participant_count=len(self.participants),
+            connected_count=self.connected,
+            answered=tally.answered,
+            correct=tally.correct,
+            counts=tally.counts,
+            closes_at=(
+                datetime.utcfromtimestamp(self._closes_at)
+                if self.state == LiveSessionState.QUESTION else None
+            ),
+            leaderboard=self.standings(settings.LIVE_SESSION_LEADERBOARD_SIZE),
+            persisted_submissions=self.persisted
+        )
+    
+    def join(self, email: str, connection: Connection) -> Participant:
+        """
+        Add a participant, or move a returning one to a new connection.
+        
+        Args:
+            email: Normalized participant email
+            connection: The participant's connection
+            
+        Returns:
+            Participant
+            
+        Raises:
+            ValueError: If the session has ended or is full
+        """
+        if self.state == LiveSessionState.FINISHED:
+            raise ValueError("Session has ended")
+        
+        participant = self.participants.get(email)
+        if participant is None:
+            if len(self.participants) >= settings.LIVE_SESSION_MAX_PARTICIPANTS:
+                raise ValueError("Session is full")
+            participant = self.participants[email] = Participant(email)
+        if participant.connection is not None:
+            participant.connection.close(4000, "Joined from another connection")
+        else:
+            self.connected += 1
+        participant.connection = connection
+        
+        connection.send(encode("joined", {
+            "code": self.code,
+            "title": self.quiz.title,
+            "name": participant.name,
+            "score": participant.score,
+            "state": self.state.value,
+            "question_count": len(self.quiz.questions),
+        }))
+        if self.state == LiveSessionState.QUESTION and self.index not in participant.answers:
+            connection.send(self._question_message)
+        return participant
+    
+    def leave(self, participant: Participant, connection: Connection) -> None:
+        """Detach a participant's connection (their score is kept)."""
+        if participant.connection is connection:
+            participant.connection = None
+            self.connected -= 1
+    
+    def add_host(self, connection: Connection) -> None:
+        """Start sending a host connection status, tallies and results."""
+        self.hosts.add(connection)
+        connection.send(encode("status", self.status().model_dump(mode="json")))
+    
+    def remove_host(self, connection: Connection) -> None:
+        """Stop sending to a host connection."""
+        self.hosts.discard(connection)
+    
+    def open_question(self, seconds: Optional[int] = None) -> None:
+        """
+        Show the next question and start its answer window.
+        
+        Args:
+            seconds: Window length (default LIVE_SESSION_ANSWER_SECONDS)
+            
+        Raises:
+            ValueError: If a question is open, the session has ended or
+                there are no more questions
+        """
+        if self.state == LiveSessionState.QUESTION:
+            raise ValueError("A question is already open")
+        if self.state == LiveSessionState.FINISHED:
+            raise ValueError("Session has ended")
+        if self.index + 1 >= len(self.quiz.questions):
+            raise ValueError("No more questions")
+        
+        seconds = seconds or settings.LIVE_SESSION_ANSWER_SECONDS
+        loop = asyncio.get_running_loop()
+        self.index += 1
+        self.tallies.append(QuestionTally())
+        self.state = LiveSessionState.QUESTION
+        self._opened_at = loop.time()
+        self._closes_at = time.time() + seconds
+        
+        question = self.quiz.questions[self.index]
+        self._question_message = encode("question", {
+            "index": self.index,
+            "question_count": len(self.quiz.questions),
+            "question": {
+                "id": question.id,
+                "question_type": question.question_type.value,
+                "question_text": question.question_text,
+                "options": question.options,
+            },
+            "seconds": seconds,
+            "opened_at": time.time(),
+            "closes_at": self._closes_at,
+        })
+        self._broadcast(self._question_message)
+        self._close_timer = loop.call_later(seconds, self.close_question, self.index)
+        self._tally_task = loop.create_task(self._stream_tallies())
+    
+    def answer(self, participant: Participant, index: int, answer: str) -> str:
+        """
+        Grade and count one answer.
+        
+        Args:
+            participant: Answering participant
+            index: Question index the answer is for
+            answer: Raw answer
+            
+        Returns:
+            "accepted", "duplicate" or "closed"
+        """
+        if self.state != LiveSessionState.QUESTION or index != self.index:
+            return "closed"
+        if index in participant.answers:
+            return "duplicate"
+        
+        question = self.quiz.questions[index]
+        correct = check_answer_correctness(question.question_type, answer, question.correct_answer)
+        participant.answers[index] = correct
+        tally = self.tallies[index]
+        tally.answered += 1
+        if correct:
+            participant.score += 1
+            participant.time_ms += int((asyncio.get_running_loop().time() - self._opened_at) * 1000)
+            tally.correct += 1
+        
+        countable = countable_answers(question)
+        normalized = answer.strip().lower()
+        if countable is not None and normalized in countable:
+            tally.counts[normalized] = tally.counts.get(normalized, 0) + 1
+        
+        if tally.answered >= self.connected:
+            # Everyone still connected has answered
+            asyncio.get_running_loop().call_soon(self.close_question, index)
+        return "accepted"
+    
+    def close_question(self, index: Optional[int] = None) -> None:
+        """
+        End the answer window and send results.
+        
+        Args:
+            index: Only close if this question is still the open one
+                (None = whichever is open)
+        """
+        if self.state != LiveSessionState.QUESTION or index not in (None, self.index):
+            return
+        if self._close_timer is not None:
+            self._close_timer.cancel()
+        self.state = LiveSessionState.REVEAL
+        
+        question = self.quiz.questions[self.index]
+        tally = self.tallies[self.index]
+        ranking = self._ranking()
+        self._broadcast(encode("results", {
+            "index": self.index,
+            "correct_answer": question.correct_answer,
+            "explanation": question.explanation,
+            "answered": tally.answered,
+            "correct": tally.correct,
+            "counts": tally.counts,
+            "leaderboard": self._standings(ranking, settings.LIVE_SESSION_LEADERBOARD_SIZE),
+        }))
+        for rank, participant in enumerate(ranking, start=1):
+            if participant.connection is not None:
+                participant.connection.send(encode("your_result", {
+                    "index": self.index,
+                    "correct": participant.answers.get(self.index),
+                    "score": participant.score,
+                    "rank": rank,
+                    "participants": len(ranking),
+                }))
+    
+    async def end(self) -> int:
+        """
+        Finish the session and store one submission per participant who
+        answered anything. Safe to call again if storing failed: nothing
+        was stored then, and a stored session is never stored again.
+        
+        Returns:
+            Number of submissions stored
+        """
+        async with self._end_lock:
+            if self.state == LiveSessionState.QUESTION:
+                self.close_question()
+            if self.state != LiveSessionState.FINISHED:
+                self.state = LiveSessionState.FINISHED
+                self.finished_at = time.time()
+                message = encode("finished", {
+                    "participants": len(self.participants),
+                    "leaderboard": self._standings(self._ranking(), settings.LIVE_SESSION_LEADERBOARD_SIZE),
+                })
+                self._broadcast(message)
+                for participant in self.participants.values():
+                    if participant.connection is not None:
+                        participant.connection.finish()
+            
+            if self.persisted is None:
+                rows = self._submission_rows() if self.persist else []
+                self.persisted = await run_in_threadpool(persist_submissions, rows)
+                for host in self.hosts:
+                    host.send(encode("stored", {"submissions": self.persisted}))
+                    host.finish()
+            return self.persisted
+    
+    def standings(self, limit: int) -> List[LiveStanding]:
+        """Top participants, best first."""
+        return [LiveStanding(**row) for row in self._standings(self._ranking(), limit)]
+    
+    def _ranking(self) -> List[Participant]:
+        return sorted(self.participants.values(), key=lambda p: (-p.score, p.time_ms))
+    
+    @staticmethod
+    def _standings(ranking: List[Participant], limit: int) -> List[dict]:
+        return [
+            {"rank": rank, "name": participant.name, "score": participant.score}
+            for rank, participant in enumerate(ranking[:limit], start=1)
+        ]
+    
+    def _broadcast(self, text: str) -> None:
+        for participant in self.participants.values():
+            if participant.connection is not None:
+                participant.connection.send(text)
+        for host in self.hosts:
+            host.send(text)
+    
+    async def _stream_tallies(self) -> None:
+        """Send hosts the answer counts while a question is open."""
+        index = self.index
+        sent = -1
+        while self.state == LiveSessionState.QUESTION and self.index == index:
+            tally = self.tallies[index]
+            if self.hosts and tally.answered != sent:
+                sent = tally.answered
+                message = encode("tally", {
+                    "index": index,
+                    "answered": tally.answered,
+                    "correct": tally.correct,
+                    "counts": tally.counts,
+                    "connected": self.connected,
+                })
+                for host in self.hosts:
+                    host.send(message)
+            await asyncio.sleep(settings.LIVE_SESSION_TALLY_INTERVAL_SECONDS)
+    
+    def _submission_rows(self) -> List[dict]:
+        """One QuizSubmission row (plus email) per participant who answered."""
+        questions = self.quiz.questions
+        asked = questions[:self.index + 1]
+        bitmap_size = (len(questions) + 7) // 8
+        served = None
+        if len(asked) < len(questions):
+            served_bits = bytearray(bitmap_size)
+            for question in asked:
+                served_bits[question.position // 8] |= 1 << (question.position % 8)
+            served = bytes(served_bits)
+        
+        rows = []
+        for participant in self.participants.values():
+            if not participant.answers:
+                continue
+            correct_bits = bytearray(bitmap_size)
+            for index, correct in participant.answers.items():
+                if correct:
+                    position = questions[index].position
+                    correct_bits[position // 8] |= 1 << (position % 8)
+            rows.append({
+                "email": participant.email,
+                "quiz_id": self.quiz.id,
+                "score": participant.score,
+                "total_questions": len(asked),
+                "quiz_version": self.quiz.version,
+                "correctness": bytes(correct_bits) if settings.ITEM_ANALYTICS_ENABLED else None,
+                "served": served if settings.ITEM_ANALYTICS_ENABLED else None,
+            })
+        return rows
+
+
+class LiveSessionRegistry:
+    """This process's live sessions by join code."""
+    
+    def __init__(self):
+        self._sessions: Dict[str, LiveSession] = {}
+    
+    def create(self, quiz: LiveQuiz, admin_id: UUID, persist: bool) -> LiveSession:
+        """Register a new session under a fresh join code."""
+        self._prune()
+        code = self._new_code()
+        session = self._sessions[code] = LiveSession(code, quiz, admin_id, persist)
+        return session
+    
+    def get(self, code: str) -> LiveSession:
+        """
+        Get a session by join code.
+        
+        Raises:
+            ValueError: If there is no such session
+        """
+        session = self._sessions.get(code)
+        if session is None:
+            raise ValueError("Live session not found")
+        return session
+    
+    def _new_code(self) -> str:
+        while True:
+            code = "".join(secrets.choice("0123456789") for _ in range(CODE_LENGTH))
+            if code not in self._sessions:
+                return code
+    
+    def _prune(self) -> None:
+        now = time.time()
+        for code, session in list(self._sessions.items()):
+            ended = session.finished_at is not None and session.persisted is not None
+            if ended and now - session.finished_at > settings.LIVE_SESSION_RETENTION_SECONDS:
+                del self._sessions[code]
+            elif now - session.created_at > settings.LIVE_SESSION_MAX_AGE_SECONDS:
+                logger.warning("Dropping abandoned live session %s", code)
+                for participant in session.participants.values():
+                    if participant.connection is not None:
+                        participant.connection.close(1001, "Session expired")
+                del self._sessions[code]
+    
+    def snapshot(self) -> dict:
+        """Sessions and participants for metrics."""
+        sessions = list(self._sessions.values())
+        return {
+            "sessions": len(sessions),
+            "open_questions": sum(session.state == LiveSessionState.QUESTION for session in sessions),
+            "participants": sum(len(session.participants) for session in sessions),
+            "connected": sum(session.connected for session in sessions),
+        }
+
+
+sessions = LiveSessionRegistry()
+register_metrics("live_sessions", sessions.snapshot)
+
+
+def load_live_quiz(quiz_id: UUID, admin_id: UUID) -> LiveQuiz:
+    """
+    Load a quiz with its answer key for a live session (blocking).
+    
+    Args:
+        quiz_id: Quiz UUID
+        admin_id: Host admin UUID
+        
+    Returns:
+        LiveQuiz
+        
+    Raises:
+        ValueError: If quiz not found, unauthorized or without questions
+    """
+    with SessionLocal() as db:
+        quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
+        if not quiz:
+            raise ValueError("Quiz not found")
+        if quiz.admin_id != admin_id:
+            raise ValueError("Unauthorized to run this quiz")
+        if not quiz.questions:
+            raise ValueError("Quiz has no questions")
+        
+        return LiveQuiz(
+            id=quiz.id,
+            title=quiz.title,
+            version=quiz.version,
+            questions=[
+                LiveQuestion(
+                    id=question.id,
+                    position=position,
+                    question_type=question.question_type,
+                    question_text=question.question_text,
+                    options=question.options,
+                    correct_answer=question.answer.correct_answer if question.answer else "",
+                    explanation=question.answer.explanation if question.answer else None
+                )
+                for position, question in enumerate(quiz.questions)
+            ]
+        )
+
+
+def persist_submissions(rows: List[dict]) -> int:
+    """
+    Store a finished session's submissions in one transaction (blocking).
+    
+    Each batch resolves its users with one upsert and inserts its
+    submissions with one batched INSERT; everything is committed once at
+    the end, so a failure stores nothing and the caller can retry.
+    
+    Args:
+        rows: Submission rows with an "email" key
+        
+    Returns:
+        Number of submissions stored
+    """
+    stored = 0
+    batch_size = settings.LIVE_SESSION_PERSIST_BATCH_SIZE
+    with SessionLocal() as db:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            user_ids = user_accessor.get_or_create_user_ids(db, [row["email"] for row in batch])
+            stored += submission_accessor.bulk_create_submissions(db, [
+                {**{key: value for key, value in row.items() if key != "email"}, "user_id": user_ids[row["email"]]}
+                for row in batch
+            ])
+        db.commit()
+    return stored
+
+
+async def create_session(quiz_id: UUID, admin_id: UUID, persist: bool) -> LiveSessionStatus:
+    """
+    Start a live session in the lobby state.
+    
+    Args:
+        quiz_id: Quiz UUID
+        admin_id: Host admin UUID
+        persist: Store submissions when the session ends
+        
+    Returns:
+        LiveSessionStatus with the join code
+        
+    Raises:
+        ValueError: If quiz not found, unauthorized or without questions
+    """
+    quiz = await run_in_threadpool(load_live_quiz, quiz_id, admin_id)
+    return sessions.create(quiz, admin_id, persist).status()
+
+
+def get_hosted_session(code: str, admin_id: UUID) -> LiveSession:
+    """
+    Get a session the admin hosts.
+    
+    Args:
+        code: Join code
+        admin_id: Admin UUID
+        
+    Returns:
+        LiveSession
+        
+    Raises:
+        ValueError: If session not found or hosted by someone else
+    """
+    session = sessions.get(code)
+    if session.admin_id != admin_id:
+        raise ValueError("Unauthorized to control this session")
+    return session
+
+
+def handle_participant_message(session: LiveSession, participant: Participant, text: str) -> str:
+    """
+    Apply one participant message ({"index": n, "answer": "..."}).
+    
+    Args:
+        session: Live session
+        participant: Sending participant
+        text: Raw message
+        
+    Returns:
+        Encoded acknowledgement
+    """
+    try:
+        message = json.loads(text)
+        index = int(message["index"])
+        answer = str(message["answer"])[:settings.TEXT_ANSWER_MAX_LENGTH]
+    except (ValueError, TypeError, KeyError):
+        return encode("error", {"detail": 'Expected {"index": <int>, "answer": <string>}'})
+    return encode("answer", {"index": index, "status": session.answer(participant, index, answer)})
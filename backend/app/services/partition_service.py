@@ -0,0 +1,127 @@
+from datetime import date
+from typing import List, Optional
+import gzip
+import json
+import logging
+import os
+import time
+from app.accessors import partition_accessor
+from app.core.config import settings
+from app.core.database import engine
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; archives fall back to gzip
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+def archive_path(name: str) -> str:
+    """Archive file for a partition (zstd NDJSON, or gzip without zstandard)."""
+    extension = "ndjson.zst" if zstandard is not None else "ndjson.gz"
+    return os.path.join(settings.SUBMISSION_ARCHIVE_DIR, f"{name}.{extension}")
+
+
+def write_archive(connection, name: str) -> str:
+    """
+    Write a detached partition's rows to a compressed NDJSON file.
+    
+    The file is written under a temporary name, fsynced and renamed, so
+    a finished archive is never partial.
+    
+    Args:
+        connection: Database connection
+        name: Detached partition table name
+        
+    Returns:
+        Path of the archive
+    """
+    os.makedirs(settings.SUBMISSION_ARCHIVE_DIR, exist_ok=True)
+    path = archive_path(name)
+    temporary = f"{path}.tmp"
+    
+    with open(temporary, "wb") as raw:
+        if zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=settings.SUBMISSION_ARCHIVE_ZSTD_LEVEL)
+            writer = compressor.stream_writer(raw, closefd=False)
+        else:
+            writer = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+        with writer:
+            for row in partition_accessor.iter_partition_rows(connection, name, batch_size=5000):
+                writer.write(json.dumps(row, default=str, separators=(",", ":")).encode() + b"\n")
+        raw.flush()
+        os.fsync(raw.fileno())
+    
+    os.replace(temporary, path)
+    return path
+
+
+def run_partition_maintenance(today: Optional[date] = None) -> List[str]:
+    """
+    Create upcoming monthly partitions and archive expired ones.
+    
+    Only one worker runs it at a time (advisory lock); others return
+    immediately. An expired partition is detached first, so queries stop
+    seeing it, then archived and dropped; partitions detached by an
+    interrupted run are picked up again.
+    
+    Args:
+        today: Reference date (defaults to today)
+        
+    Returns:
+        Paths of the archives written
+    """
+    today = today or date.today()
+    archived = []
+    
+    with engine.connect() as connection:
+        if not partition_accessor.try_maintenance_lock(connection):
+            connection.rollback()
+            return archived
+        connection.commit()
+        
+        try:
+            created = partition_accessor.create_month_partitions(
+                connection, today, settings.SUBMISSION_PARTITIONS_AHEAD + 1
+            )
+            connection.commit()
+            if created:
+                logger.info("Created submission partitions: %s", ", ".join(created))
+            
+            if not settings.SUBMISSION_RETENTION_MONTHS:
+                return archived
+            
+            oldest_kept = partition_accessor.add_months(
+                partition_accessor.month_start(today), -settings.SUBMISSION_RETENTION_MONTHS
+            )
+            for partition in partition_accessor.list_partitions(connection):
+                if partition.month < oldest_kept:
+                    partition_accessor.detach_partition(connection, partition.name)
+                    connection.commit()
+            
+            for partition in partition_accessor.list_detached_partitions(connection):
+                if partition.month >= oldest_kept:
+                    continue  # Detached by hand; not ours to archive
+                path = write_archive(connection, partition.name)
+                connection.commit()
+                partition_accessor.drop_partition_table(connection, partition.name)
+                connection.commit()
+                archived.append(path)
+                logger.info("Archived submission partition %s to %s", partition.name, path)
+        finally:
+            connection.rollback()
+            partition_accessor.release_maintenance_lock(connection)
+            connection.commit()
+    
+    return archived
+
+
+def maintain_partitions_forever() -> None:
+    """Run partition maintenance now and then every configured interval."""
+    while True:
+        try:
+            run_partition_maintenance()
+        except Exception:
+            logger.exception("Submission partition maintenance failed")
+        time.sleep(settings.SUBMISSION_PARTITION_CHECK_SECONDS)
@@ -1,12 +1,31 @@
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import List, NamedTuple, Optional
 from uuid import UUID
-from app.accessors import quiz_accessor
+import hashlib
+import json
+import logging
+from app.accessors import admin_accessor, quiz_accessor
+from app.core.cache import (
+    LRUCache, grading_key_cache, public_quiz_cache, public_quiz_payload_cache, quiz_summary_cache,
+    quiz_cache_generation, set_if_not_invalidated
+)
+from app.core.compression import PrecompressedPayload
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.pagination import decode_cursor, encode_cursor
 from app.schemas.quiz import (
     QuizCreate, QuizUpdate, QuizResponse, 
-    QuizListItem, QuizPublic, QuestionPublic
+    QuizListItem, QuizPublic, QuestionPublic,
+    QuizQuestionsPatch, QuestionPatch, QuestionUpdate,
+    QuizSummaryItem, QuizSummaryPage, QuizChange, QuizChangeFeed,
+    BulkQuizAction, QuizBulkRequest, QuizBulkOutcome, QuizBulkResult,
+    QuizCloneRequest, QuizCloneResult
 )
 from app.models.quiz import Quiz
+from app.models.question import QuestionType
+
+logger = logging.getLogger(__name__)
 
 
 def create_quiz_with_questions(
@@ -68,6 +87,12 @@ def get_quiz_for_public(db: Session, quiz_id: UUID) -> QuizPublic:
     Raises:
         ValueError: If quiz not found or inactive
     """
+    cached = public_quiz_cache.get(str(quiz_id))
+    if cached is not None:
+        return cached
+    
+    # Captured before the read so a write committed meanwhile is not undone
+    generation = quiz_cache_generation()
     quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
     
     if not quiz:
@@ -76,7 +101,156 @@ def get_quiz_for_public(db: Session, quiz_id: UUID) -> QuizPublic:
     if not quiz.is_active:
         raise ValueError("Quiz is not active")
     
-    return QuizPublic.model_validate(quiz)
+    quiz_public = QuizPublic.model_validate(quiz)
+    set_if_not_invalidated(public_quiz_cache, quiz_id, quiz_public, generation)
+    
+    return quiz_public
+
+
+def get_public_quiz_payload(db: Session, quiz_id: UUID) -> PrecompressedPayload:
+    """
+    Get the serialized public quiz, compressed at most once per body.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        PrecompressedPayload with a version and content based ETag
+        
+    Raises:
+        ValueError: If quiz not found or inactive
+    """
+    cached = public_quiz_payload_cache.get(str(quiz_id))
+    if cached is not None:
+        etag, _, body = cached.partition(b"\n")
+        etag = etag.decode()
+    else:
+        generation = quiz_cache_generation()
+        quiz_public = get_quiz_for_public(db, quiz_id)
+        body = quiz_public.model_dump_json().encode()
+        # Metadata edits keep the version, so the body digest tells them apart
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        etag = f'"{quiz_public.id}-{quiz_public.version}-{digest}"'
+        set_if_not_invalidated(public_quiz_payload_cache, quiz_id, etag.encode() + b"\n" + body, generation)
+    
+    # Compressed variants are keyed by ETag, so a changed body never reuses them
+    return PrecompressedPayload(
+        body,
+        etag=etag,
+        store=public_quiz_payload_cache,
+        store_key=f"{quiz_id}@{etag}"
+    )
+
+
+class GradingAnswer(NamedTuple):
+    """Correct answer and explanation for one question."""
+    correct_answer: str
+    explanation: Optional[str]
+
+
+class GradingQuestion(NamedTuple):
+    """The parts of a question needed to grade it."""
+    id: UUID
+    question_type: QuestionType
+    question_text: str
+    answer: Optional[GradingAnswer]
+
+
+class GradingQuiz(NamedTuple):
+    """
+    Answer key for a quiz; duck-types the Quiz attributes used by
+    submission_accessor.calculate_score.
+    """
+    id: UUID
+    title: str
+    is_active: bool
+    version: int
+    pool_size: Optional[int]
+    pool_rules: Optional[dict]
+    questions: List[GradingQuestion]
+
+
+# Decoded answer keys per worker, keyed by "<quiz_id>@<stamp>"; the stamp
+# heads the shared entry and changes with every quiz write, so stale keys
+# are never reused and simply age out
+_decoded_grading_quizzes = LRUCache(maxsize=settings.QUIZ_CACHE_SIZE)
+
+
+def _serialize_grading_quiz(quiz: Quiz) -> bytes:
+    return json.dumps({
+        "id": str(quiz.id),
+        "title": quiz.title,
+        "is_active": quiz.is_active,
+        "version": quiz.version,
+        "pool_size": quiz.pool_size,
+        "pool_rules": quiz.pool_rules,
+        "questions": [
+            [
+                str(question.id),
+                question.question_type.value,
+                question.question_text,
+                question.answer.correct_answer if question.answer else None,
+                question.answer.explanation if question.answer else None,
+            ]
+            for question in quiz.questions
+        ],
+    }, separators=(",", ":")).encode()
+
+
+def _deserialize_grading_quiz(data: bytes) -> GradingQuiz:
+    key = json.loads(data)
+    return GradingQuiz(
+        id=UUID(key["id"]),
+        title=key["title"],
+        is_active=key["is_active"],
+        version=key["version"],
+        pool_size=key["pool_size"],
+        pool_rules=key["pool_rules"],
+        questions=[
+            GradingQuestion(
+                id=UUID(question_id),
+                question_type=QuestionType(question_type),
+                question_text=question_text,
+                answer=GradingAnswer(correct_answer, explanation) if correct_answer is not None else None
+            )
+            for question_id, question_type, question_text, correct_answer, explanation in key["questions"]
+        ],
+    )
+
+
+def get_grading_quiz(db: Session, quiz_id: UUID) -> GradingQuiz:
+    """
+    Get a quiz's answer key for grading, from the shared cache when possible.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        GradingQuiz with questions in quiz order
+        
+    Raises:
+        ValueError: If quiz not found
+    """
+    cached = grading_key_cache.get(str(quiz_id))
+    if cached is None:
+        generation = quiz_cache_generation()
+        quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
+        if not quiz:
+            raise ValueError("Quiz not found")
+        stamp = f"{quiz.version}.{quiz.change_seq}\n".encode()
+        cached = stamp + _serialize_grading_quiz(quiz)
+        set_if_not_invalidated(grading_key_cache, quiz_id, cached, generation)
+    
+    # Only decode (json + NamedTuples) the first time this worker sees a stamp
+    split = cached.index(b"\n")
+    decoded_key = f"{quiz_id}@{cached[:split].decode()}"
+    grading_quiz = _decoded_grading_quizzes.get(decoded_key)
+    if grading_quiz is None:
+        grading_quiz = _deserialize_grading_quiz(cached[split + 1:])
+        _decoded_grading_quizzes.set(decoded_key, grading_quiz)
+    return grading_quiz
 
 
 def list_quizzes_for_admin(
@@ -120,13 +294,60 @@ def list_quizzes_for_admin(
     return result
 
 
+def get_quiz_summaries(
+    db: Session,
+    admin_id: UUID,
+    limit: int,
+    cursor: Optional[str] = None
+) -> QuizSummaryPage:
+    """
+    Get a page of the admin dashboard: every quiz with question and
+    submission counts, average percentage and last submission time.
+    
+    Args:
+        db: Database session
+        admin_id: Admin UUID
+        limit: Page size
+        cursor: next_cursor from the previous page (None = first page)
+        
+    Returns:
+        QuizSummaryPage schema
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    cache_key = (admin_id, limit, cursor)
+    if settings.QUIZ_SUMMARY_CACHE_TTL_SECONDS:
+        cached = quiz_summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    before = decode_cursor(cursor) if cursor else None
+    
+    # One extra row tells whether another page exists
+    rows = quiz_accessor.list_quiz_summaries(db, admin_id, limit + 1, before)
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    
+    page = QuizSummaryPage(
+        items=[QuizSummaryItem.model_validate(row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
+    if settings.QUIZ_SUMMARY_CACHE_TTL_SECONDS:
+        quiz_summary_cache.set(cache_key, page)
+    return page
+
+
 def list_active_quizzes_for_public(
     db: Session,
     skip: int = 0,
     limit: int = 100
 ) -> List[QuizListItem]:
     """
-    List active quizzes for public view.
+    List active quizzes for public view, newest first.
     
     Args:
         db: Database session
@@ -136,27 +357,85 @@ def list_active_quizzes_for_public(
     Returns:
         List of QuizListItem schemas
     """
-    quizzes = quiz_accessor.list_quizzes(
-        db,
-        is_active=True,
-        skip=skip,
-        limit=limit
-    )
+    rows = quiz_accessor.list_public_quizzes(db, skip, limit)
+    return [QuizListItem.model_validate(row._mapping) for row in rows]
+
+
+class CatalogVersion(NamedTuple):
+    """Validators for the public quiz list."""
+    etag: str  # Changes with every catalogue change
+    last_modified: Optional[datetime]  # UTC, whole seconds; None while not yet safe to send
+
+
+def get_catalog_version(db: Session) -> CatalogVersion:
+    """
+    Get the public catalogue's current ETag and Last-Modified time.
     
-    # Convert to list items
-    result = []
-    for quiz in quizzes:
-        item = QuizListItem(
-            id=quiz.id,
-            title=quiz.title,
-            description=quiz.description,
-            is_active=quiz.is_active,
-            created_at=quiz.created_at,
-            question_count=len(quiz.questions)
+    HTTP dates have one-second resolution, so Last-Modified is only given
+    once the second of the latest change is over and no transaction that
+    began within or before that second can still commit a change; a
+    client holding that date then cannot have missed one.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        CatalogVersion
+    """
+    watermark = quiz_accessor.get_catalog_watermark(db)
+    if watermark.change_seq is None:
+        return CatalogVersion(etag='"catalog-0"', last_modified=None)
+    
+    last_modified = watermark.updated_at.replace(microsecond=0)
+    settled_at = watermark.settled_at
+    if settled_at is None or settled_at.replace(microsecond=0) <= last_modified:
+        last_modified = None
+    return CatalogVersion(etag=f'"catalog-{watermark.change_seq}"', last_modified=last_modified)
+
+
+def get_quiz_changes(db: Session, since: int, limit: int) -> QuizChangeFeed:
+    """
+    Get the public catalogue changes after a change sequence number.
+    
+    Deactivated, deleted and purged quizzes come back as removals
+    (tombstones); since=0 walks the whole catalogue.
+    
+    Args:
+        db: Database session
+        since: next_since from the previous poll (0 = from the start)
+        limit: Maximum number of changes
+        
+    Returns:
+        QuizChangeFeed schema
+    """
+    watermark = quiz_accessor.get_catalog_watermark(db)
+    if since >= watermark.horizon:
+        # Not a sequence number this database has served (e.g. restored)
+        return QuizChangeFeed(changes=[], next_since=0, has_more=True, reset=True)
+    
+    # One extra row tells whether another page exists
+    rows = quiz_accessor.list_quiz_changes(db, since, limit + 1)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    changes = []
+    for row in rows:
+        removed = row.purged or row.deleted_at is not None or not row.is_active
+        quiz = None if removed else QuizListItem(
+            id=row.id,
+            title=row.title,
+            description=row.description,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            question_count=row.question_count
         )
-        result.append(item)
+        changes.append(QuizChange(seq=row.change_seq, id=row.id, removed=removed, quiz=quiz))
     
-    return result
+    return QuizChangeFeed(
+        changes=changes,
+        next_since=rows[-1].change_seq if rows else since,
+        has_more=has_more
+    )
 
 
 def update_quiz_details(
@@ -199,6 +478,9 @@ def delete_quiz_by_id(db: Session, quiz_id: UUID, admin_id: UUID) -> bool:
     """
     Delete quiz (verify ownership).
     
+    The quiz is hidden immediately; callers schedule purge_deleted_quiz
+    to remove its rows in the background.
+    
     Args:
         db: Database session
         quiz_id: Quiz UUID
@@ -220,3 +502,219 @@ def delete_quiz_by_id(db: Session, quiz_id: UUID, admin_id: UUID) -> bool:
         raise ValueError("Unauthorized to delete this quiz")
     
     return quiz_accessor.delete_quiz(db, quiz_id)
+
+
+def clone_quiz(
+    db: Session,
+    quiz_id: UUID,
+    clone_data: QuizCloneRequest,
+    admin_id: UUID
+) -> QuizCloneResult:
+    """
+    Clone a quiz with its questions and answers (verify ownership).
+    
+    Args:
+        db: Database session
+        quiz_id: Source quiz UUID
+        clone_data: Optional title and active flag for the copy
+        admin_id: Admin UUID
+        
+    Returns:
+        QuizCloneResult schema
+        
+    Raises:
+        ValueError: If quiz not found or unauthorized
+    """
+    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=False)
+    
+    if not quiz:
+        raise ValueError("Quiz not found")
+    
+    if quiz.admin_id != admin_id:
+        raise ValueError("Unauthorized to clone this quiz")
+    
+    title = clone_data.title or f"{quiz.title} (copy)"[:255]
+    new_quiz_id, question_count = quiz_accessor.clone_quiz(
+        db, quiz_id, admin_id, title, clone_data.is_active
+    )
+    
+    return QuizCloneResult(
+        id=new_quiz_id,
+        source_quiz_id=quiz_id,
+        title=title,
+        question_count=question_count
+    )
+
+
+def run_bulk_action(db: Session, request: QuizBulkRequest, admin_id: UUID) -> QuizBulkResult:
+    """
+    Activate, deactivate, delete or transfer many quizzes in one statement.
+    
+    Only the admin's own live quizzes are affected; every other requested
+    ID is reported as not_found. Deleted quizzes still need
+    purge_deleted_quiz scheduled by the caller.
+    
+    Args:
+        db: Database session
+        request: Action plus either explicit IDs or a filter
+        admin_id: Admin UUID
+        
+    Returns:
+        QuizBulkResult schema with one outcome per requested (or matched) quiz
+        
+    Raises:
+        ValueError: If the selection is ambiguous or the transfer target is invalid
+    """
+    if (request.ids is None) == (request.filter is None):
+        raise ValueError("Provide either ids or filter")
+    
+    if request.action == BulkQuizAction.ACTIVATE:
+        values = {"is_active": True}
+    elif request.action == BulkQuizAction.DEACTIVATE:
+        values = {"is_active": False}
+    elif request.action == BulkQuizAction.DELETE:
+        values = {"is_active": False, "deleted_at": datetime.utcnow()}
+    else:
+        if request.target_admin_id is None:
+            raise ValueError("target_admin_id is required for transfer")
+        if not admin_accessor.get_admin_by_id(db, request.target_admin_id):
+            raise ValueError("Target admin not found")
+        values = {"admin_id": request.target_admin_id}
+    
+    updated_ids = quiz_accessor.bulk_update_quizzes(
+        db, admin_id, values, quiz_ids=request.ids, quiz_filter=request.filter
+    )
+    
+    if request.ids is not None:
+        updated = set(updated_ids)
+        outcomes = [
+            QuizBulkOutcome(id=quiz_id, status="updated" if quiz_id in updated else "not_found")
+            for quiz_id in dict.fromkeys(request.ids)
+        ]
+    else:
+        outcomes = [QuizBulkOutcome(id=quiz_id, status="updated") for quiz_id in updated_ids]
+    
+    return QuizBulkResult(action=request.action, updated=len(updated_ids), outcomes=outcomes)
+
+
+def purge_deleted_quiz(quiz_id: UUID) -> None:
+    """
+    Remove a soft-deleted quiz's rows in bounded batches.
+    
+    Runs outside the request, so it uses its own database session.
+    
+    Args:
+        quiz_id: Quiz UUID
+    """
+    db = SessionLocal()
+    try:
+        deleted = quiz_accessor.purge_deleted_quiz(
+            db, quiz_id, settings.QUIZ_PURGE_BATCH_SIZE
+        )
+        logger.info("Purged quiz %s (%d submissions)", quiz_id, deleted)
+    except Exception:
+        logger.exception("Failed to purge quiz %s; will retry on next startup", quiz_id)
+    finally:
+        db.close()
+
+
+def purge_pending_quizzes() -> None:
+    """Resume purges of soft-deleted quizzes left over from a previous run."""
+    db = SessionLocal()
+    try:
+        quiz_ids = quiz_accessor.list_deleted_quiz_ids(db)
+    finally:
+        db.close()
+    
+    for quiz_id in quiz_ids:
+        purge_deleted_quiz(quiz_id)
+
+
+def update_quiz_questions(
+    db: Session,
+    quiz_id: UUID,
+    changes: QuizQuestionsPatch,
+    admin_id: UUID
+) -> QuizResponse:
+    """
+    Apply a diff of question changes to a quiz (verify ownership).
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        changes: Questions to add, update, delete and reorder
+        admin_id: Admin UUID
+        
+    Returns:
+        QuizResponse schema
+        
+    Raises:
+        ValueError: If quiz not found, unauthorized or the diff is invalid
+    """
+    # Verify quiz exists and belongs to admin
+    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=False)
+    
+    if not quiz:
+        raise ValueError("Quiz not found")
+    
+    if quiz.admin_id != admin_id:
+        raise ValueError("Unauthorized to update this quiz")
+    
+    quiz_accessor.apply_question_changes(db, quiz_id, changes)
+    
+    return get_quiz_for_admin(db, quiz_id)
+
+
+def update_question(
+    db: Session,
+    quiz_id: UUID,
+    question_id: UUID,
+    question_data: QuestionUpdate,
+    admin_id: UUID
+) -> QuizResponse:
+    """
+    Update a single question and/or its answer (verify ownership).
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        question_id: Question UUID
+        question_data: Fields to change
+        admin_id: Admin UUID
+        
+    Returns:
+        QuizResponse schema
+        
+    Raises:
+        ValueError: If quiz or question not found, unauthorized or invalid
+    """
+    patch = QuestionPatch(
+        id=question_id,
+        **question_data.model_dump(exclude_unset=True)
+    )
+    return update_quiz_questions(db, quiz_id, QuizQuestionsPatch(update=[patch]), admin_id)
+
+
+def delete_question(
+    db: Session,
+    quiz_id: UUID,
+    question_id: UUID,
+    admin_id: UUID
+) -> QuizResponse:
+    """
+    Delete a single question and renumber the rest (verify ownership).
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        question_id: Question UUID
+        admin_id: Admin UUID
+        
+    Returns:
+        QuizResponse schema
+        
+    Raises:
+        ValueError: If quiz or question not found, or unauthorized
+    """
+    changes = QuizQuestionsPatch(delete=[question_id])
+    return update_quiz_questions(db, quiz_id, changes, admin_id)
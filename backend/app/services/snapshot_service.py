@@ -0,0 +1,389 @@
+from contextlib import contextmanager
+from threading import Event, Lock, Thread
+from typing import Iterator, NamedTuple, Optional, Set
+from uuid import UUID
+import fcntl
+import hashlib
+import logging
+import os
+from sqlalchemy.orm import Session
+from app.accessors import quiz_accessor
+from app.core.compression import compress, supported_encodings
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.invalidation import subscribe_quiz_changes
+from app.core.metrics import register_metrics
+from app.schemas.quiz import QuizListItem, QuizPublic
+from app.services import quiz_service
+
+logger = logging.getLogger(__name__)
+
+# Snapshot directory layout:
+#   objects/<ab>/<sha256>.json[.gz|.br]  immutable content-addressed bodies
+#   quizzes/<quiz_id>.json[.gz|.br]      symlinks to a quiz's current body
+#   list/<page>.json[.gz|.br]            symlinks to page n (from 1) of the active list
+#   state.json                           change_seq published so far
+OBJECTS_DIR = "objects"
+QUIZZES_DIR = "quizzes"
+LIST_DIR = "list"
+STATE_FILE = "state.json"
+LOCK_FILE = ".publisher.lock"
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+class PublishResult(NamedTuple):
+    """Outcome of one publishing pass."""
+    since: int  # change_seq the snapshot is now current to
+    quizzes_written: int
+    quizzes_removed: int
+    pages: int  # List pages written (0 when the catalogue did not change)
+    objects_removed: int
+
+
+class SnapshotWriter:
+    """
+    Writes content-addressed bodies into a snapshot directory and points
+    the public names at them by atomically replacing symlinks.
+    
+    A body (and its compressed variants) is written once per distinct
+    content, so unchanged quizzes and list pages cost a hash and a
+    readlink; readers always see a complete old or new file.
+    """
+    
+    def __init__(self, root: str, precompress: bool):
+        self.root = root
+        self.encodings = supported_encodings() if precompress else ()
+        self.suffixes = [ENCODING_SUFFIXES[encoding] for encoding in self.encodings]
+    
+    def write_object(self, body: bytes) -> str:
+        """
+        Store a JSON body (and its compressed variants) under its hash.
+        
+        Args:
+            body: Serialized JSON
+            
+        Returns:
+            Path of the object relative to the snapshot root
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        relative = os.path.join(OBJECTS_DIR, digest[:2], f"{digest}.json")
+        path = os.path.join(self.root, relative)
+        if os.path.exists(path):
+            return relative
+        
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Variants first: an existing .json means the object is complete
+        for encoding in self.encodings:
+            _write_file(path + ENCODING_SUFFIXES[encoding], compress(body, encoding, static=True))
+        _write_file(path, body)
+        return relative
+    
+    def link(self, name: str, target: str) -> bool:
+        """
+        Point a public name (and its compressed variants) at an object.
+        
+        Args:
+            name: Path relative to the root, e.g. "quizzes/<id>.json"
+            target: Object path returned by write_object
+            
+        Returns:
+            True if the name pointed elsewhere before
+        """
+        changed = False
+        # Compressed variants first, so the plain file is never the newer one
+        for suffix in self.suffixes + [""]:
+            link_path = os.path.join(self.root, name + suffix)
+            os.makedirs(os.path.dirname(link_path), exist_ok=True)
+            relative = os.path.relpath(
+                os.path.join(self.root, target + suffix), os.path.dirname(link_path)
+            )
+            if os.path.islink(link_path) and os.readlink(link_path) == relative:
+                continue
+            temporary = f"{link_path}.{os.getpid()}.tmp"
+            os.symlink(relative, temporary)
+            os.replace(temporary, link_path)
+            changed = True
+        
+        # Variants no longer produced (precompression off, brotli missing)
+        for suffix in set(ENCODING_SUFFIXES.values()) - set(self.suffixes):
+            try:
+                os.unlink(os.path.join(self.root, name + suffix))
+            except FileNotFoundError:
+                pass
+        return changed
+    
+    def unlink(self, name: str) -> bool:
+        """
+        Remove a public name and its compressed variants.
+        
+        Args:
+            name: Path relative to the root
+            
+        Returns:
+            True if anything was removed
+        """
+        removed = False
+        for suffix in [""] + list(ENCODING_SUFFIXES.values()):
+            try:
+                os.unlink(os.path.join(self.root, name + suffix))
+                removed = True
+            except FileNotFoundError:
+                pass
+        return removed
+    
+    def names(self, directory: str) -> Set[str]:
+        """Public names (without compression suffixes) in a directory."""
+        path = os.path.join(self.root, directory)
+        if not os.path.isdir(path):
+            return set()
+        return {
+            os.path.join(directory, entry)
+            for entry in os.listdir(path)
+            if entry.endswith(".json")
+        }
+    
+    def collect_garbage(self) -> int:
+        """
+        Delete objects no public name points at.
+        
+        Returns:
+            Number of files deleted
+        """
+        referenced = set()
+        for directory in (QUIZZES_DIR, LIST_DIR):
+            path = os.path.join(self.root, directory)
+            if os.path.isdir(path):
+                for entry in os.listdir(path):
+                    referenced.add(os.path.realpath(os.path.join(path, entry)))
+        
+        deleted = 0
+        for directory, _, files in os.walk(os.path.join(self.root, OBJECTS_DIR)):
+            for entry in files:
+                path = os.path.join(directory, entry)
+                if os.path.realpath(path) not in referenced:
+                    os.unlink(path)
+                    deleted += 1
+        return deleted
+
+
+def _write_file(path: str, data: bytes) -> None:
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+def quiz_name(quiz_id: UUID) -> str:
+    """Public name of a quiz body, e.g. quizzes/<id>.json."""
+    return os.path.join(QUIZZES_DIR, f"{quiz_id}.json")
+
+
+def page_name(page: int) -> str:
+    """Public name of a list page (1-based), e.g. list/1.json."""
+    return os.path.join(LIST_DIR, f"{page}.json")
+
+
+def read_state(root: str) -> int:
+    """change_seq the snapshot in root was last published at (0 if none)."""
+    try:
+        with open(os.path.join(root, STATE_FILE), "rb") as file:
+            return int(file.read().decode().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def render_quiz(db: Session, quiz_id: UUID) -> Optional[bytes]:
+    """
+    Serialize a quiz exactly as GET /api/public/quizzes/{id} returns it.
+    
+    Reads the database directly, bypassing this worker's caches.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        JSON body, or None if the quiz is gone or inactive
+    """
+    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
+    if quiz is None or not quiz.is_active:
+        return None
+    return QuizPublic.model_validate(quiz).model_dump_json().encode()
+
+
+def publish_list_pages(db: Session, writer: SnapshotWriter, page_size: int) -> int:
+    """
+    Write every page of the active quiz list, as GET /api/public/quizzes
+    returns it with skip=(page - 1) * page_size and limit=page_size.
+    
+    Args:
+        db: Database session
+        writer: Snapshot writer
+        page_size: Quizzes per page
+        
+    Returns:
+        Number of pages (an empty catalogue still has page 1)
+    """
+    page = 0
+    while True:
+        rows = quiz_accessor.list_public_quizzes(db, page * page_size, page_size)
+        page += 1
+        items = [QuizListItem.model_validate(row._mapping).model_dump_json().encode() for row in rows]
+        writer.link(page_name(page), writer.write_object(b"[" + b",".join(items) + b"]"))
+        if len(rows) < page_size:
+            break
+    
+    for name in writer.names(LIST_DIR) - {page_name(number) for number in range(1, page + 1)}:
+        writer.unlink(name)
+    return page
+
+
+def publish_changes(db: Session, root: str, full: bool = False) -> PublishResult:
+    """
+    Bring a snapshot directory up to date with the database.
+    
+    Only quizzes in the change feed since the last pass are rendered;
+    list pages are rewritten only when something changed. A full pass
+    walks the whole catalogue and also drops names of quizzes that no
+    longer exist.
+    
+    Args:
+        db: Database session
+        root: Snapshot directory
+        full: Republish everything instead of only the changes
+        
+    Returns:
+        PublishResult
+    """
+    writer = SnapshotWriter(root, settings.PUBLIC_SNAPSHOT_PRECOMPRESS)
+    os.makedirs(root, exist_ok=True)
+    since = 0 if full else read_state(root)
+    published: Set[str] = set()
+    written = removed = 0
+    changed = full
+    
+    while True:
+        feed = quiz_service.get_quiz_changes(db, since, settings.PUBLIC_SNAPSHOT_BATCH_SIZE)
+        if feed.reset:
+            return publish_changes(db, root, full=True)
+        
+        for change in feed.changes:
+            changed = True
+            body = None if change.removed else render_quiz(db, change.id)
+            if body is None:
+                removed += writer.unlink(quiz_name(change.id))
+            else:
+                writer.link(quiz_name(change.id), writer.write_object(body))
+                published.add(quiz_name(change.id))
+                written += 1
+        db.expunge_all()
+        since = feed.next_since
+        if not feed.has_more:
+            break
+    
+    if full:
+        for name in writer.names(QUIZZES_DIR) - published:
+            removed += writer.unlink(name)
+    
+    pages = objects_removed = 0
+    if changed:
+        pages = publish_list_pages(db, writer, settings.PUBLIC_SNAPSHOT_PAGE_SIZE)
+        objects_removed = writer.collect_garbage()
+        _write_file(os.path.join(root, STATE_FILE), str(since).encode())
+    
+    return PublishResult(since, written, removed, pages, objects_removed)
+
+
+@contextmanager
+def directory_lock(root: str) -> Iterator[None]:
+    """Serialize publishers (workers, hosts sharing the directory, the CLI)."""
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, LOCK_FILE), "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
+
+
+class SnapshotPublisher:
+    """
+    Background publisher that refreshes the snapshot after quiz changes.
+    
+    It wakes on this worker's quiz_changed notifications and otherwise
+    every poll interval; each pass costs one feed query when nothing
+    changed.
+    """
+    
+    def __init__(self, root: str, poll_interval: float):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.since = 0
+        self.passes = 0
+        self.quizzes_written = 0
+        self.quizzes_removed = 0
+        self.failures = 0
+        self._wake = Event()
+        self._lock = Lock()
+    
+    def wake(self, quiz_id: str) -> None:
+        """Request a pass (quiz change subscriber)."""
+        self._wake.set()
+    
+    def run(self) -> None:
+        """Publish forever."""
+        while True:
+            self._wake.clear()
+            try:
+                with directory_lock(self.root), SessionLocal() as db:
+                    result = publish_changes(db, self.root)
+                with self._lock:
+                    self.since = result.since
+                    self.passes += 1
+                    self.quizzes_written += result.quizzes_written
+                    self.quizzes_removed += result.quizzes_removed
+                if result.pages:
+                    logger.info(
+                        "Published snapshot at change %d (%d quizzes written, %d removed)",
+                        result.since, result.quizzes_written, result.quizzes_removed
+                    )
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                logger.exception("Public snapshot publishing failed")
+            self._wake.wait(self.poll_interval)
+    
+    def snapshot(self) -> dict:
+        """Progress counters for metrics."""
+        with self._lock:
+            return {
+                "since": self.since,
+                "passes": self.passes,
+                "quizzes_written": self.quizzes_written,
+                "quizzes_removed": self.quizzes_removed,
+                "failures": self.failures,
+            }
+
+
+_publisher: Optional[SnapshotPublisher] = None
+
+
+def start_snapshot_publisher() -> Optional[SnapshotPublisher]:
+    """
+    Start this worker's publisher thread once (no-op when disabled).
+    
+    Returns:
+        The running publisher, or None if PUBLIC_SNAPSHOT_DIR is unset
+    """
+    global _publisher
+    if not settings.PUBLIC_SNAPSHOT_DIR or _publisher is not None:
+        return _publisher
+    
+    _publisher = SnapshotPublisher(
+        settings.PUBLIC_SNAPSHOT_DIR,
+        poll_interval=settings.PUBLIC_SNAPSHOT_POLL_SECONDS
+    )
+    subscribe_quiz_changes(_publisher.wake)
+    Thread(target=_publisher.run, name="public-snapshot", daemon=True).start()
+    register_metrics("public_snapshot", _publisher.snapshot)
+    return _publisher
@@ -1,9 +1,91 @@
 from sqlalchemy.orm import Session, joinedload
-from typing import Dict
+from typing import Dict, FrozenSet, NamedTuple, Optional
 from uuid import UUID
 from app.accessors import user_accessor, quiz_accessor, submission_accessor
 from app.models.question import Question
-from app.schemas.submission import QuizSubmissionCreate, QuizSubmissionResponse
+from app.schemas.submission import (
+    QuizSubmissionCreate, QuizSubmissionResponse,
+    SubmissionHistoryItem, SubmissionHistoryPage
+)
+from app.core.cache import quiz_cache_generation, set_if_not_invalidated, submission_limits_cache
+from app.core.config import settings
+from app.core.drafts import get_draft_store
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.security import create_history_token
+from app.services import attempt_service, quiz_service
+
+
+class SubmissionLimits(NamedTuple):
+    """Bounds for one quiz's submission payloads."""
+    question_ids: FrozenSet[str]
+    max_answer_length: Dict[str, int]  # question_id -> maximum answer length
+    max_body_bytes: int
+
+
+def get_submission_limits(db: Session, quiz_id: UUID) -> SubmissionLimits:
+    """
+    Get (cached) payload bounds derived from a quiz's question count and types.
+    
+    MCQ answers are capped at the longest option key, true/false at
+    "false", and text answers at TEXT_ANSWER_MAX_LENGTH.
+    
+    Args:
+        db: Database session
+        quiz_id: Quiz UUID
+        
+    Returns:
+        SubmissionLimits for the quiz (empty if the quiz has no questions)
+    """
+    limits = submission_limits_cache.get(str(quiz_id))
+    if limits is not None:
+        return limits
+    
+    generation = quiz_cache_generation()
+    max_answer_length = {}
+    for question_id, question_type, option_keys in quiz_accessor.get_answer_constraints(db, quiz_id):
+        if question_type == "mcq":
+            length = max((len(key) for key in option_keys or []), default=1)
+        elif question_type == "true_false":
+            length = len("false")
+        else:
+            length = settings.TEXT_ANSWER_MAX_LENGTH
+        max_answer_length[str(question_id)] = length
+    
+    # Answers may be JSON-escaped, so allow twice their length on the wire
+    max_body_bytes = settings.SUBMISSION_BODY_OVERHEAD_BYTES + sum(
+        settings.SUBMISSION_BODY_BYTES_PER_QUESTION + 2 * length
+        for length in max_answer_length.values()
+    )
+    limits = SubmissionLimits(
+        question_ids=frozenset(max_answer_length),
+        max_answer_length=max_answer_length,
+        max_body_bytes=max_body_bytes
+    )
+    set_if_not_invalidated(submission_limits_cache, quiz_id, limits, generation)
+    
+    return limits
+
+
+def check_answers_within_limits(limits: SubmissionLimits, answers: Dict[str, str]) -> None:
+    """
+    Reject answers to unknown questions or longer than their question allows.
+    
+    Args:
+        limits: Bounds for the quiz
+        answers: Dictionary mapping question_id (as string) to user answer
+        
+    Raises:
+        ValueError: If any answer is out of bounds
+    """
+    if len(answers) > len(limits.question_ids):
+        raise ValueError("More answers than questions in this quiz")
+    
+    for question_id, answer in answers.items():
+        max_length = limits.max_answer_length.get(question_id)
+        if max_length is None:
+            raise ValueError(f"Unknown question ID: {question_id[:64]}")
+        if len(answer.strip()) > max_length:
+            raise ValueError(f"Answer to question {question_id} exceeds {max_length} characters")
 
 
 def process_quiz_submission(
@@ -25,39 +107,110 @@ def process_quiz_submission(
     Raises:
         ValueError: If quiz not found or inactive
     """
-    # Get quiz with questions and answers
-    quiz = quiz_accessor.get_quiz_by_id(db, quiz_id, load_questions=True)
-    
-    if not quiz:
-        raise ValueError("Quiz not found")
+    # Get the quiz's answer key (shared cache, else questions and answers)
+    quiz = quiz_service.get_grading_quiz(db, quiz_id)
     
     if not quiz.is_active:
         raise ValueError("Quiz is not active")
     
-    # Create or get user
-    user = user_accessor.create_or_get_user(db, submission_data.email)
+    # Pooled quizzes grade only the questions the attempt was served;
+    # attempts are graded from their autosaved draft plus submitted answers
+    question_ids = None
+    attempt_id = None
+    answers = submission_data.answers
+    if submission_data.attempt_token:
+        attempt_id, question_ids = attempt_service.resolve_attempt(
+            quiz_id, submission_data.attempt_token, quiz.version
+        )
+        draft = get_draft_store().load(attempt_id)
+        if draft:
+            answers = {**draft, **answers}
+            # The submitted answers were checked on their own; check the merge
+            check_answers_within_limits(get_submission_limits(db, quiz_id), answers)
+    elif quiz.pool_size or quiz.pool_rules:
+        raise ValueError("This quiz requires an attempt token")
+    
+    # Resolve user ID (cached for repeat takers)
+    user_id = user_accessor.get_or_create_user_id(db, submission_data.email)
     
     # Calculate score and get results (real-time, not stored)
-    score, results = submission_accessor.calculate_score(quiz, submission_data.answers)
+    score, results, correctness = submission_accessor.calculate_score(
+        quiz, answers, question_ids
+    )
     
     # Create submission record (only stores final score)
     submission = submission_accessor.create_submission_record(
         db=db,
         quiz_id=quiz_id,
-        user_id=user.id,
+        user_id=user_id,
         score=score,
-        total_questions=len(quiz.questions)
+        total_questions=len(results),
+        correctness=correctness if settings.ITEM_ANALYTICS_ENABLED else None,
+        user_email=submission_data.email
     )
     
+    if attempt_id is not None:
+        get_draft_store().delete(attempt_id)
+    
     # Format and return response
     return QuizSubmissionResponse(
         submission_id=submission.id,
         quiz_id=quiz.id,
         quiz_title=quiz.title,
-        user_email=user.email,
+        user_id=user_id,
+        user_email=submission_data.email,
         score=submission.score,
         total_questions=submission.total_questions,
         percentage=submission.percentage,
         submitted_at=submission.submitted_at,
-        results=results
+        results=results,
+        history_token=create_history_token(str(user_id))
+    )
+
+
+def get_user_submission_history(
+    db: Session,
+    user_id: UUID,
+    limit: int,
+    cursor: Optional[str] = None
+) -> SubmissionHistoryPage:
+    """
+    Get a page of a user's past attempts, newest first.
+    
+    Args:
+        db: Database session
+        user_id: User UUID
+        limit: Page size
+        cursor: next_cursor from the previous page (None = first page)
+        
+    Returns:
+        SubmissionHistoryPage schema
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    before = decode_cursor(cursor) if cursor else None
+    
+    # One extra row tells whether another page exists
+    rows = submission_accessor.list_user_submissions(db, user_id, limit + 1, before)
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].submitted_at, rows[-1].id)
+    
+    return SubmissionHistoryPage(
+        items=[
+            SubmissionHistoryItem(
+                id=row.id,
+                quiz_id=row.quiz_id,
+                quiz_title=row.quiz_title,
+                score=row.score,
+                total_questions=row.total_questions,
+                percentage=(row.score / row.total_questions) * 100 if row.total_questions else 0.0,
+                submitted_at=row.submitted_at
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor
     )
@@ -0,0 +1,217 @@
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, Dict, Iterator, List
+from uuid import UUID
+import json
+import uuid
+from pydantic import ValidationError
+from app.accessors import quiz_accessor
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.quiz import Quiz
+from app.schemas.quiz import QuizCreate, QuizImportResult
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; NDJSON is always available
+    msgpack = None
+
+# Bulk transfer formats and their media types
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "msgpack": "application/msgpack",
+}
+
+
+def check_format(fmt: str) -> None:
+    """
+    Ensure a transfer format is known and usable in this process.
+
+    Args:
+        fmt: "ndjson" or "msgpack"
+
+    Raises:
+        ValueError: If the format is unknown or msgpack is not installed
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if fmt == "msgpack" and msgpack is None:
+        raise ValueError("msgpack format requires the msgpack package")
+
+
+def quiz_to_record(quiz: Quiz) -> dict:
+    """
+    Convert a quiz to its transfer record (the QuizCreate shape).
+
+    Args:
+        quiz: Quiz instance with loaded questions and answers
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    return {
+        "title": quiz.title,
+        "description": quiz.description,
+        "is_active": quiz.is_active,
+        "pool_size": quiz.pool_size,
+        "pool_rules": quiz.pool_rules,
+        "questions": [
+            {
+                "question_type": question.question_type.value,
+                "question_text": question.question_text,
+                "options": question.options,
+                "order": question.order,
+                "answer": {
+                    "correct_answer": question.answer.correct_answer if question.answer else "",
+                    "explanation": question.answer.explanation if question.answer else None,
+                },
+            }
+            for question in quiz.questions
+        ],
+    }
+
+
+def export_quizzes(admin_id: UUID, fmt: str) -> Iterator[bytes]:
+    """
+    Stream an admin's quizzes as NDJSON lines or concatenated msgpack objects.
+
+    Runs after the request's own session is closed, so it opens its own.
+
+    Args:
+        admin_id: Admin UUID
+        fmt: "ndjson" or "msgpack"
+
+    Yields:
+        Encoded records, one quiz each
+    """
+    db = SessionLocal()
+    try:
+        for quiz in quiz_accessor.iter_quizzes_for_export(db, admin_id):
+            record = quiz_to_record(quiz)
+            if fmt == "msgpack":
+                yield msgpack.packb(record, use_bin_type=True)
+            else:
+                yield json.dumps(record, separators=(",", ":")).encode() + b"\n"
+    finally:
+        db.close()
+
+
+async def iter_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[tuple[int, dict]]:
+    """
+    Decode a streamed import body into records without buffering it whole.
+
+    Args:
+        chunks: Request body chunks
+        fmt: "ndjson" or "msgpack"
+
+    Yields:
+        Tuples of (1-based record number, decoded record)
+
+    Raises:
+        ValueError: If a record is malformed or larger than IMPORT_MAX_RECORD_BYTES
+    """
+    number = 0
+    if fmt == "msgpack":
+        unpacker = msgpack.Unpacker(raw=False, max_buffer_size=settings.IMPORT_MAX_RECORD_BYTES)
+        async for chunk in chunks:
+            try:
+                unpacker.feed(chunk)
+                for record in unpacker:
+                    number += 1
+                    yield number, record
+            except (msgpack.BufferFull, msgpack.UnpackException, ValueError):
+                raise ValueError(f"Record {number + 1}: malformed or too large")
+        return
+
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > settings.IMPORT_MAX_RECORD_BYTES:
+            raise ValueError(f"Record {number + 1}: exceeds {settings.IMPORT_MAX_RECORD_BYTES} bytes")
+        for line in lines:
+            if line.strip():
+                number += 1
+                yield number, _decode_json_line(line, number)
+    if buffer.strip():
+        number += 1
+        yield number, _decode_json_line(buffer, number)
+
+
+def _decode_json_line(line: bytes, number: int) -> dict:
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise ValueError(f"Record {number}: invalid JSON")
+
+
+class QuizImporter:
+    """
+    Validates imported quizzes one by one and writes them in COPY batches,
+    all inside a single transaction committed by finish().
+    """
+
+    def __init__(self, db: Session, admin_id: UUID):
+        self.db = db
+        self.admin_id = admin_id
+        self.pending: Dict[UUID, QuizCreate] = {}
+        self.pending_questions = 0
+        self.quiz_ids: List[UUID] = []
+        self.question_count = 0
+        self._staged = False
+
+    def add(self, record: dict, number: int) -> None:
+        """
+        Validate one record and queue it for the next batch.
+
+        Args:
+            record: Decoded quiz record
+            number: Record number (for error messages)
+
+        Raises:
+            ValueError: If the record is not a valid quiz
+        """
+        try:
+            quiz_data = QuizCreate.model_validate(record)
+            quiz_accessor.validate_quiz_structure(quiz_data)
+        except ValidationError as e:
+            raise ValueError(f"Record {number}: {e.errors(include_url=False)[0]['msg']}")
+        except ValueError as e:
+            raise ValueError(f"Record {number}: {e}")
+
+        quiz_id = uuid.uuid4()
+        self.pending[quiz_id] = quiz_data
+        self.pending_questions += len(quiz_data.questions)
+
+    def should_flush(self) -> bool:
+        """Whether enough questions are queued to write a batch."""
+        return self.pending_questions >= settings.IMPORT_BATCH_QUESTIONS
+
+    def flush(self) -> None:
+        """Write queued quizzes through the staging tables (no commit)."""
+        if not self.pending:
+            return
+        if not self._staged:
+            quiz_accessor.prepare_import_staging(self.db)
+            self._staged = True
+
+        self.question_count += quiz_accessor.bulk_import_quizzes(
+            self.db, self.pending, self.admin_id
+        )
+        self.quiz_ids.extend(self.pending)
+        self.pending = {}
+        self.pending_questions = 0
+
+    def finish(self) -> QuizImportResult:
+        """
+        Write the last batch and commit the whole import.
+
+        Returns:
+            QuizImportResult schema
+        """
+        self.flush()
+        self.db.commit()
+        return QuizImportResult(
+            imported_quizzes=len(self.quiz_ids),
+            imported_questions=self.question_count,
+            quiz_ids=self.quiz_ids
+        )
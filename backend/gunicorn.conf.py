@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration for SERVER_MODE=production.
+
+Run with: gunicorn -c gunicorn.conf.py app.main:app
+(or simply ``python -m app.server`` with SERVER_MODE=production).
+"""
+from app.core.config import settings, worker_count
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = worker_count()
+worker_class = "app.core.workers.ProductionUvicornWorker"
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = settings.WORKER_MAX_REQUESTS
+max_requests_jitter = settings.WORKER_MAX_REQUESTS_JITTER
+
+timeout = settings.WORKER_TIMEOUT
+graceful_timeout = settings.WORKER_GRACEFUL_TIMEOUT
+keepalive = settings.WORKER_KEEPALIVE
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """Create tables once in the master instead of racing in every worker."""
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        from app.core.database import Base, engine
+        import app.main  # noqa: F401  (registers every model)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        settings.DB_CREATE_ALL_ON_STARTUP = False
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the preloaded master."""
+    from app.core.database import engine
+    engine.dispose(close=False)
@@ -0,0 +1,144 @@
+"""
+Load-test a live session with many simulated participants.
+
+Creates a session of --quiz-id, connects --clients WebSocket participants
+(emails loadtest-<n>@example.com), runs every question with each client
+answering at a random moment inside the window, then ends the session.
+Reports connect time, question fan-out latency (host open request to the
+question arriving at each client), answers accepted and the time taken
+to end the session. Sessions are created with persist=false unless
+--persist is given, so a run leaves no submissions behind.
+
+Needs the ``websockets`` package (installed with uvicorn[standard]) and a
+raised open-file limit on both ends for large runs.
+
+Usage (from the backend directory):
+    python scripts/live_session_loadtest.py --token <admin JWT> --quiz-id <uuid> --clients 2000
+"""
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+import urllib.request
+
+import websockets
+
+
+def request(base_url: str, token: str, method: str, path: str, body: dict = None) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(
+        base_url + path,
+        data=data,
+        method=method,
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
+
+
+def percentiles(values: list) -> str:
+    if not values:
+        return "n/a"
+    values = sorted(values)
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]  # noqa: E731
+    return f"p50 {pick(0.5) * 1000:.0f}ms  p95 {pick(0.95) * 1000:.0f}ms  p99 {pick(0.99) * 1000:.0f}ms  max {values[-1] * 1000:.0f}ms"
+
+
+class Client:
+    def __init__(self, n: int, url: str, window: float):
+        self.email = f"loadtest-{n}@example.com"
+        self.url = url
+        self.window = window
+        self.received: dict = {}  # Question index -> arrival time
+        self.accepted = 0
+        self.connect_seconds = None
+        self.ready = asyncio.Event()
+
+    async def run(self) -> None:
+        started = time.perf_counter()
+        async with websockets.connect(self.url, max_queue=None) as ws:
+            await ws.send(json.dumps({"email": self.email}))
+            async for text in ws:
+                message = json.loads(text)
+                event, data = message["event"], message["data"]
+                if event == "joined":
+                    self.connect_seconds = time.perf_counter() - started
+                    self.ready.set()
+                elif event == "question":
+                    self.received[data["index"]] = time.perf_counter()
+                    asyncio.get_running_loop().create_task(self.answer(ws, data))
+                elif event == "answer" and data["status"] == "accepted":
+                    self.accepted += 1
+
+    async def answer(self, ws, data: dict) -> None:
+        await asyncio.sleep(random.uniform(0, self.window * 0.8))
+        options = data["question"].get("options") or {}
+        choices = list(options) or ["true", "false"]
+        try:
+            await ws.send(json.dumps({"index": data["index"], "answer": random.choice(choices)}))
+        except websockets.ConnectionClosed:
+            pass
+
+
+async def run(args) -> int:
+    session = request(args.base_url, args.token, "POST", "/api/live/sessions", {
+        "quiz_id": args.quiz_id, "persist": args.persist
+    })
+    code = session["code"]
+    ws_url = args.base_url.replace("http", "ws", 1) + f"/api/live/sessions/{code}/play"
+    print(f"Session {code}: {session['question_count']} questions, {args.clients} clients")
+
+    clients = [Client(n, ws_url, args.window) for n in range(args.clients)]
+    tasks = []
+    started = time.perf_counter()
+    for start in range(0, len(clients), args.connect_batch):
+        batch = clients[start:start + args.connect_batch]
+        tasks += [asyncio.create_task(client.run()) for client in batch]
+        await asyncio.gather(*(client.ready.wait() for client in batch))
+    print(f"Connected in {time.perf_counter() - started:.1f}s  "
+          f"({percentiles([c.connect_seconds for c in clients])})")
+
+    loop = asyncio.get_running_loop()
+    for index in range(session["question_count"]):
+        opened = time.perf_counter()
+        await loop.run_in_executor(None, request, args.base_url, args.token, "POST",
+                                   f"/api/live/sessions/{code}/next", {"seconds": max(1, round(args.window))})
+        await asyncio.sleep(args.window + 1)
+        status = await loop.run_in_executor(None, request, args.base_url, args.token, "GET",
+                                            f"/api/live/sessions/{code}")
+        latencies = [c.received[index] - opened for c in clients if index in c.received]
+        print(f"Question {index}: delivered to {len(latencies)}, answered {status['answered']}  "
+              f"fan-out {percentiles(latencies)}")
+
+    ended = time.perf_counter()
+    final = await loop.run_in_executor(None, request, args.base_url, args.token, "POST",
+                                       f"/api/live/sessions/{code}/end")
+    print(f"Ended in {time.perf_counter() - ended:.2f}s; "
+          f"{final['persisted_submissions']} submissions stored, "
+          f"{sum(c.accepted for c in clients)} answers accepted")
+    await asyncio.wait(tasks, timeout=10)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API (or live server) base URL")
+    parser.add_argument("--token", required=True, help="admin access token")
+    parser.add_argument("--quiz-id", required=True, help="quiz to run (owned by the token's admin)")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--window", type=float, default=10.0, help="answer window in seconds")
+    parser.add_argument("--connect-batch", type=int, default=200, help="clients connected concurrently")
+    parser.add_argument("--persist", action="store_true", help="store submissions when the session ends")
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.clients + 100:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, args.clients + 100), hard))
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
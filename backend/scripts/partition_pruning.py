@@ -0,0 +1,127 @@
+"""
+Partition pruning check for quiz_submissions.
+
+Runs EXPLAIN ANALYZE on the per-user and per-quiz submission queries
+against the configured database and reports which monthly partitions
+each one actually scanned. With --check it exits non-zero when a
+time-bounded query touches partitions outside its bound (for CI).
+
+Usage (from the backend directory):
+    python scripts/partition_pruning.py
+    python scripts/partition_pruning.py --check
+"""
+import argparse
+import os
+import sys
+from typing import List, NamedTuple, Optional, Set
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import text  # noqa: E402
+from app.accessors import partition_accessor  # noqa: E402
+from app.core.database import engine  # noqa: E402
+
+
+class PruningResult(NamedTuple):
+    """Partitions one query scanned versus the ones it was allowed to."""
+    name: str
+    scanned: Set[str]
+    allowed: Optional[Set[str]]  # None = no time bound, report only
+    
+    @property
+    def ok(self) -> bool:
+        return self.allowed is None or self.scanned <= self.allowed
+
+
+def scanned_partitions(plan: dict) -> Set[str]:
+    """Partition tables in a JSON plan whose scan nodes actually ran."""
+    scanned = set()
+    relation = plan.get("Relation Name", "")
+    if relation.startswith(f"{partition_accessor.PARENT_TABLE}_y") and plan.get("Actual Loops", 0) > 0:
+        scanned.add(relation)
+    for child in plan.get("Plans", []):
+        scanned |= scanned_partitions(child)
+    return scanned
+
+
+def explain(connection, sql: str, params: dict) -> Set[str]:
+    """Run EXPLAIN ANALYZE and collect the partitions scanned."""
+    plan = connection.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).scalar()
+    return scanned_partitions(plan[0]["Plan"])
+
+
+def run_checks() -> List[PruningResult]:
+    """
+    Explain the per-user and per-quiz queries against real data.
+    
+    Returns:
+        One result per query (empty if there are no submissions)
+    """
+    results = []
+    with engine.connect() as connection:
+        partitions = partition_accessor.list_partitions(connection)
+        sample = connection.execute(text(
+            "SELECT user_id, quiz_id, submitted_at FROM quiz_submissions "
+            "ORDER BY submitted_at DESC LIMIT 1"
+        )).first()
+        if sample is None or not partitions:
+            return results
+        
+        month = partition_accessor.month_start(sample.submitted_at.date())
+        cursor_month = {p.name for p in partitions if p.month <= month}
+        window = {partition_accessor.partition_name(month)}
+        params = {"user_id": sample.user_id, "quiz_id": sample.quiz_id, "ts": sample.submitted_at}
+        
+        # Per-user history, second page (same shape as list_user_submissions)
+        results.append(PruningResult("user history (keyset page)", explain(connection, """
+            SELECT s.id, s.quiz_id, q.title, s.score, s.total_questions, s.submitted_at
+            FROM quiz_submissions s JOIN quizzes q ON q.id = s.quiz_id
+            WHERE s.user_id = :user_id AND q.deleted_at IS NULL
+              AND s.submitted_at <= :ts
+              AND (s.submitted_at, s.id) < (:ts, 'ffffffff-ffff-ffff-ffff-ffffffffffff'::uuid)
+            ORDER BY s.submitted_at DESC, s.id DESC LIMIT 21
+        """, params), cursor_month))
+        
+        # Per-quiz submissions within one month
+        results.append(PruningResult("quiz submissions (one month)", explain(connection, """
+            SELECT count(*) FROM quiz_submissions
+            WHERE quiz_id = :quiz_id
+              AND submitted_at >= date_trunc('month', CAST(:ts AS timestamp))
+              AND submitted_at < date_trunc('month', CAST(:ts AS timestamp)) + interval '1 month'
+        """, params), window))
+        
+        # Per-quiz queries without a time bound probe every partition's index
+        results.append(PruningResult("quiz leaderboard (top 10)", explain(connection, """
+            SELECT id FROM quiz_submissions WHERE quiz_id = :quiz_id
+            ORDER BY coalesce(score::float8 / NULLIF(total_questions, 0), 0) DESC, submitted_at LIMIT 10
+        """, params), None))
+        connection.rollback()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="exit 1 if a bounded query is not pruned")
+    args = parser.parse_args()
+    
+    results = run_checks()
+    if not results:
+        print("No submissions to explain")
+        return 0
+    
+    for result in results:
+        allowed = "unbounded" if result.allowed is None else f"allowed {len(result.allowed)}"
+        status = "ok" if result.ok else "NOT PRUNED"
+        print(f"{result.name:32} scanned {len(result.scanned):3} ({allowed})  {status}")
+        for name in sorted(result.scanned - (result.allowed or result.scanned)):
+            print(f"{'':32} unexpected: {name}")
+    
+    if args.check and not all(result.ok for result in results):
+        print("Partition pruning check failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Publish the static snapshot of the public read path.
+
+Brings PUBLIC_SNAPSHOT_DIR (or --dir) up to date with the database and
+exits; with --full every quiz and list page is republished and names of
+quizzes that no longer exist are removed. Workers started with
+PUBLIC_SNAPSHOT_DIR set keep the snapshot current on their own; this is
+for a first build, cron, or a host that only serves the files.
+
+Usage (from the backend directory):
+    python scripts/publish_snapshot.py
+    python scripts/publish_snapshot.py --full --dir /srv/quiz-snapshot
+"""
+import argparse
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.services import snapshot_service  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=settings.PUBLIC_SNAPSHOT_DIR, help="snapshot directory")
+    parser.add_argument("--full", action="store_true", help="republish everything")
+    args = parser.parse_args()
+
+    if not args.dir:
+        print("Set PUBLIC_SNAPSHOT_DIR or pass --dir", file=sys.stderr)
+        return 2
+
+    with snapshot_service.directory_lock(args.dir), SessionLocal() as db:
+        result = snapshot_service.publish_changes(db, args.dir, full=args.full)
+
+    print(
+        f"Snapshot at change {result.since}: {result.quizzes_written} quizzes written, "
+        f"{result.quizzes_removed} removed, {result.pages} list pages, "
+        f"{result.objects_removed} old objects deleted"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
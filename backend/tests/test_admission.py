@@ -0,0 +1,40 @@
+"""Admission gate queueing, timeouts and permit accounting."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.core.admission import AdmissionGate, Overloaded  # noqa: E402
+
+
+def test_timed_out_waiters_do_not_shrink_the_gate():
+    async def scenario():
+        gate = AdmissionGate("test", limit=1, max_queue=100, queue_timeout=0.01)
+        await gate.acquire()
+        for _ in range(20):
+            with pytest.raises(Overloaded) as rejected:
+                await gate.acquire()
+            assert rejected.value.status_code == 503
+        gate.release()
+
+        await gate.acquire()  # The single permit is still there
+        assert gate.in_flight == 1
+        assert gate.timed_out == 20
+        gate.release()
+        assert not gate._semaphore.locked()
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_is_rejected_immediately():
+    async def scenario():
+        gate = AdmissionGate("test", limit=1, max_queue=0, queue_timeout=1.0)
+        await gate.acquire()
+        with pytest.raises(Overloaded) as rejected:
+            await gate.acquire()
+        assert rejected.value.status_code == 429
+        gate.release()
+
+    asyncio.run(scenario())
@@ -0,0 +1,46 @@
+"""Quiz cache fills never undo an invalidation that raced the read."""
+import uuid
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from app.core.cache import (  # noqa: E402
+    LRUCache, flush_quiz_caches, invalidate_quiz, invalidate_quizzes,
+    quiz_cache_generation, register_quiz_cache, set_if_not_invalidated
+)
+
+cache = register_quiz_cache(LRUCache(maxsize=16))
+
+
+def test_fill_without_concurrent_invalidation_is_kept():
+    quiz_id = uuid.uuid4()
+    generation = quiz_cache_generation()
+    assert set_if_not_invalidated(cache, quiz_id, "v1", generation)
+    assert cache.get(str(quiz_id)) == "v1"
+
+
+def test_stale_fill_after_invalidation_is_dropped():
+    quiz_id = uuid.uuid4()
+    generation = quiz_cache_generation()  # Reader starts loading v1
+    invalidate_quiz(quiz_id)  # A writer commits v2 meanwhile
+    assert not set_if_not_invalidated(cache, quiz_id, "v1", generation)
+    assert cache.get(str(quiz_id)) is None
+
+    # A reader that starts after the invalidation may fill again
+    assert set_if_not_invalidated(cache, quiz_id, "v2", quiz_cache_generation())
+    assert cache.get(str(quiz_id)) == "v2"
+
+
+def test_invalidating_another_quiz_does_not_block_the_fill():
+    quiz_id = uuid.uuid4()
+    generation = quiz_cache_generation()
+    invalidate_quizzes([uuid.uuid4(), uuid.uuid4()])
+    assert set_if_not_invalidated(cache, quiz_id, "v1", generation)
+
+
+def test_flush_drops_every_fill_in_flight():
+    quiz_id = uuid.uuid4()
+    generation = quiz_cache_generation()
+    flush_quiz_caches()
+    assert not set_if_not_invalidated(cache, quiz_id, "v1", generation)
@@ -0,0 +1,77 @@
+"""Request deadlines: header parsing and off-loop cancellation."""
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.core.config import settings  # noqa: E402
+from app.core.deadlines import DeadlineMiddleware, parse_requested_timeout  # noqa: E402
+
+
+@pytest.mark.parametrize("value, expected", [
+    (b"2.5", 2.5),
+    (b"30", 30.0),
+    (b"nan", None),
+    (b"inf", None),
+    (b"-inf", None),
+    (b"-1", None),
+    (b"0", None),
+    (b"soon", None),
+    (b"", None),
+])
+def test_parse_requested_timeout(value, expected):
+    assert parse_requested_timeout(value) == expected
+
+
+def _run(headers, handler):
+    """Drive a submit request through the middleware; return the deadline it got."""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["deadline"] = scope["state"]["deadline"]
+        await handler(scope["state"]["deadline"])
+
+    async def receive():
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": f"/api/public/quizzes/{'0' * 32}/submit",
+        "headers": headers,
+    }
+    asyncio.run(DeadlineMiddleware(app)(scope, receive, send))
+    return seen["deadline"]
+
+
+def test_invalid_header_falls_back_to_the_route_default():
+    async def handler(deadline):
+        pass
+
+    deadline = _run([(b"x-request-timeout", b"nan")], handler)
+    assert 0 < deadline.remaining() <= settings.REQUEST_TIMEOUT_SUBMIT_SECONDS
+
+
+def test_cancel_callbacks_run_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    fired = threading.Event()
+    callback_threads = []
+
+    def callback():
+        callback_threads.append(threading.get_ident())
+        fired.set()
+
+    async def handler(deadline):
+        deadline.on_cancel(callback)
+        while not fired.is_set():
+            await asyncio.sleep(0.01)
+
+    deadline = _run([(b"x-request-timeout", b"0.05")], handler)
+    assert deadline.cancelled
+    assert callback_threads and callback_threads[0] != loop_thread
@@ -0,0 +1,64 @@
+"""Attempt draft stores: coalesced writes, read-through and tombstones."""
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from app.core.drafts import MemoryDraftStore, SQLiteDraftStore  # noqa: E402
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "drafts.sqlite3")
+
+
+def _store(path):
+    # A long interval keeps the background flusher out of the way
+    return SQLiteDraftStore(path, ttl=3600, flush_interval=3600)
+
+
+def test_saves_are_buffered_until_flushed(sqlite_path):
+    worker_a, worker_b = _store(sqlite_path), _store(sqlite_path)
+    worker_a.save("attempt", {"q1": "A"})
+    worker_a.save("attempt", {"q1": "B"})
+
+    assert worker_a.load("attempt") == {"q1": "B"}  # Read through the buffer
+    assert worker_b.load("attempt") is None
+
+    worker_a.flush()
+    assert worker_b.load("attempt") == {"q1": "B"}
+
+
+def test_delete_drops_the_buffered_draft_and_leaves_a_tombstone(sqlite_path):
+    worker_a, worker_b = _store(sqlite_path), _store(sqlite_path)
+    worker_a.save("attempt", {"q1": "A"})
+    worker_a.delete("attempt")
+    worker_a.flush()
+
+    assert worker_a.load("attempt") is None
+    assert worker_b.load("attempt") is None
+
+
+def test_flush_after_a_delete_on_another_worker_does_not_resurrect(sqlite_path):
+    worker_a, worker_b = _store(sqlite_path), _store(sqlite_path)
+    worker_a.save("attempt", {"q1": "A"})
+    worker_b.delete("attempt")
+    worker_a.flush()
+
+    assert worker_b.load("attempt") is None
+
+
+def test_late_save_after_delete_is_ignored(sqlite_path):
+    store = _store(sqlite_path)
+    store.delete("attempt")
+    store.save("attempt", {"q1": "A"})
+
+    assert store.load("attempt") is None
+
+
+def test_memory_store_keeps_the_tombstone():
+    store = MemoryDraftStore(maxsize=10, ttl=60)
+    store.save("attempt", {"q1": "A"})
+    store.delete("attempt")
+    store.save("attempt", {"q1": "B"})
+
+    assert store.load("attempt") is None
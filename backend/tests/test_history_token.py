@@ -0,0 +1,54 @@
+"""Quiz takers read their submission history only with their own token."""
+import uuid
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("jose")
+
+from fastapi import HTTPException  # noqa: E402
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from app.core.security import create_attempt_token, create_history_token, get_history_user_id  # noqa: E402
+from app.handlers import user_handler  # noqa: E402
+
+
+def _bearer(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_history_token_resolves_its_user():
+    user_id = str(uuid.uuid4())
+    assert get_history_user_id(_bearer(create_history_token(user_id))) == user_id
+
+
+@pytest.mark.parametrize("credentials", [
+    None,
+    _bearer("not-a-token"),
+    _bearer(create_attempt_token(str(uuid.uuid4()), str(uuid.uuid4()), 1, None)[0]),
+])
+def test_missing_or_foreign_tokens_are_rejected(credentials):
+    with pytest.raises(HTTPException) as rejected:
+        get_history_user_id(credentials)
+    assert rejected.value.status_code == 401
+
+
+def test_history_of_another_user_is_forbidden():
+    with mock.patch.object(user_handler.submission_service, "get_user_submission_history") as history:
+        with pytest.raises(HTTPException) as rejected:
+            user_handler.get_submission_history(
+                uuid.uuid4(), limit=20, cursor=None, db=mock.MagicMock(), token_user_id=str(uuid.uuid4())
+            )
+    assert rejected.value.status_code == 403
+    history.assert_not_called()
+
+
+def test_history_of_the_token_owner_is_served():
+    user_id = uuid.uuid4()
+    with mock.patch.object(user_handler.submission_service, "get_user_submission_history") as history:
+        user_handler.get_submission_history(
+            user_id, limit=20, cursor=None, db=mock.MagicMock(), token_user_id=str(user_id)
+        )
+    history.assert_called_once()
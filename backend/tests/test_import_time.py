@@ -0,0 +1,27 @@
+"""Import-time budget for app.main (see scripts/import_time.py)."""
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+import import_time  # noqa: E402
+
+
+def test_app_import_stays_within_budget():
+    pytest.importorskip("fastapi")
+    timings = import_time.measure_fastest("app.main")
+    import_ms = import_time.total_ms(timings, "app.main")
+    slowest = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[1:6]
+    assert import_ms <= import_time.DEFAULT_BUDGET_MS, (
+        f"import app.main took {import_ms:.0f} ms (budget {import_time.DEFAULT_BUDGET_MS} ms); "
+        "slowest: " + ", ".join(f"{t.module} {t.cumulative_us / 1000:.0f} ms" for t in slowest)
+    )
+
+
+def test_security_dependencies_are_imported_lazily():
+    pytest.importorskip("fastapi")
+    modules = {timing.module for timing in import_time.measure("app.main")}
+    assert not modules & {"jose", "passlib", "bcrypt"}
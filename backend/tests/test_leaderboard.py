@@ -0,0 +1,69 @@
+"""Top-k leaderboard ranking and board refresh."""
+from datetime import datetime, timedelta
+import uuid
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from app.core.leaderboard import LeaderboardEntry, LeaderboardStore, TopK, display_name  # noqa: E402
+
+START = datetime(2024, 3, 1, 12, 0, 0)
+
+
+def _entry(score, total, minutes=0, name="player"):
+    return LeaderboardEntry(uuid.uuid4(), name, score, total, START + timedelta(minutes=minutes))
+
+
+def test_ranks_by_fraction_correct_not_raw_score():
+    board = TopK(3, as_of=START)
+    pooled = _entry(5, 5, name="pooled")  # 100% of a 5-question pool
+    full = _entry(8, 10, name="full")  # 80% of all 10 questions
+    board.offer(full)
+    board.offer(pooled)
+    assert [entry.name for entry in board.top(3)] == ["pooled", "full"]
+
+
+def test_ties_go_to_the_earlier_submission():
+    board = TopK(3, as_of=START)
+    late, early = _entry(4, 5, minutes=10, name="late"), _entry(4, 5, minutes=1, name="early")
+    board.offer(late)
+    board.offer(early)
+    assert [entry.name for entry in board.top(2)] == ["early", "late"]
+
+
+def test_keeps_only_the_best_k():
+    board = TopK(2, as_of=START)
+    for score in (1, 4, 2, 5, 3):
+        board.offer(_entry(score, 5, name=str(score)))
+    assert [entry.name for entry in board.top(5)] == ["5", "4"]
+
+
+def test_zero_question_submissions_rank_last_and_duplicates_are_ignored():
+    board = TopK(3, as_of=START)
+    empty, scored = _entry(0, 0, name="empty"), _entry(1, 5, name="scored")
+    board.offer(empty)
+    board.offer(scored)
+    board.offer(scored)
+    assert [entry.name for entry in board.top(3)] == ["scored", "empty"]
+
+
+def test_store_records_only_into_loaded_boards_and_rebuilds_when_stale():
+    quiz_id = uuid.uuid4()
+    store = LeaderboardStore(k=3, max_staleness=3600, maxsize=10)
+    store.record(quiz_id, _entry(5, 5, name="unseen"))  # No board yet: dropped
+
+    loads = []
+    board = store.get(quiz_id, lambda n: loads.append(n) or [_entry(2, 5, name="loaded")])
+    store.record(quiz_id, _entry(3, 5, name="recorded"))
+    assert store.get(quiz_id, lambda n: loads.append(n) or []) is board
+    assert loads == [3]
+    assert [entry.name for entry in board.top(3)] == ["recorded", "loaded"]
+
+    store.max_staleness = -1
+    assert store.get(quiz_id, lambda n: []).top(3) == []
+
+
+def test_display_name_masks_the_email():
+    assert display_name("alice@example.com") == "al***@example.com"
+    assert display_name("bob") == "bo***"
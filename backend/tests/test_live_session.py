@@ -0,0 +1,126 @@
+"""Live session answering, closing and ranking (no sockets or database)."""
+import asyncio
+import json
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.models.question import QuestionType  # noqa: E402
+from app.schemas.live_session import LiveSessionState  # noqa: E402
+from app.services.live_session_service import LiveQuestion, LiveQuiz, LiveSession  # noqa: E402
+
+
+class RecordingConnection:
+    """Collects what a session sends instead of writing to a socket."""
+
+    def __init__(self):
+        self.messages = []
+        self.closed = False
+
+    def send(self, text):
+        self.messages.append(json.loads(text))
+
+    def finish(self):
+        self.closed = True
+
+    def close(self, code=1000, reason=""):
+        self.closed = True
+
+    def events(self, name):
+        return [message["data"] for message in self.messages if message["event"] == name]
+
+
+def _quiz():
+    return LiveQuiz(
+        id=uuid.uuid4(),
+        title="Live",
+        version=1,
+        questions=[
+            LiveQuestion(uuid.uuid4(), 0, QuestionType.MCQ, "Pick", {"A": "a", "B": "b"}, "A", None),
+            LiveQuestion(uuid.uuid4(), 1, QuestionType.TRUE_FALSE, "True?", None, "true", "Because"),
+        ],
+    )
+
+
+def _session(emails):
+    session = LiveSession("123456", _quiz(), uuid.uuid4(), persist=False)
+    players = {email: session.join(email, RecordingConnection()) for email in emails}
+    return session, players
+
+
+def test_answer_is_graded_counted_and_accepted_once():
+    async def scenario():
+        session, players = _session(["a@x.io", "b@x.io", "c@x.io"])
+        session.open_question(seconds=60)
+
+        assert session.answer(players["a@x.io"], 0, " a ") == "accepted"
+        assert session.answer(players["a@x.io"], 0, "B") == "duplicate"
+        assert session.answer(players["b@x.io"], 0, "B") == "accepted"
+        assert session.answer(players["c@x.io"], 1, "true") == "closed"  # Not the open question
+
+        tally = session.tallies[0]
+        assert (tally.answered, tally.correct, tally.counts) == (2, 1, {"a": 1, "b": 1})
+        assert players["a@x.io"].score == 1 and players["a@x.io"].answers == {0: True}
+        assert players["b@x.io"].score == 0 and players["b@x.io"].answers == {0: False}
+        session.close_question()
+
+    asyncio.run(scenario())
+
+
+def test_close_question_reveals_and_stops_answers():
+    async def scenario():
+        session, players = _session(["a@x.io", "b@x.io"])
+        session.open_question(seconds=60)
+        session.answer(players["a@x.io"], 0, "A")
+
+        session.close_question(index=5)  # A stale timer for another question is ignored
+        assert session.state == LiveSessionState.QUESTION
+
+        session.close_question(index=0)
+        assert session.state == LiveSessionState.REVEAL
+        assert session.answer(players["b@x.io"], 0, "A") == "closed"
+
+        connection = players["a@x.io"].connection
+        [results] = connection.events("results")
+        assert results["correct_answer"] == "A" and results["answered"] == 1
+        [mine] = connection.events("your_result")
+        assert mine == {"index": 0, "correct": True, "score": 1, "rank": 1, "participants": 2}
+
+        session.close_question()  # Closing twice sends nothing more
+        assert len(connection.events("results")) == 1
+
+    asyncio.run(scenario())
+
+
+def test_question_closes_once_everyone_connected_has_answered():
+    async def scenario():
+        session, players = _session(["a@x.io", "b@x.io"])
+        session.open_question(seconds=60)
+        session.answer(players["a@x.io"], 0, "A")
+        await asyncio.sleep(0)
+        assert session.state == LiveSessionState.QUESTION
+
+        session.answer(players["b@x.io"], 0, "A")
+        await asyncio.sleep(0)
+        assert session.state == LiveSessionState.REVEAL
+
+    asyncio.run(scenario())
+
+
+def test_ranking_breaks_score_ties_by_time_on_correct_answers():
+    async def scenario():
+        session, players = _session(["slow@x.io", "fast@x.io", "wrong@x.io"])
+        session.open_question(seconds=60)
+        session.answer(players["fast@x.io"], 0, "A")
+        await asyncio.sleep(0.02)
+        session.answer(players["slow@x.io"], 0, "A")
+        session.answer(players["wrong@x.io"], 0, "B")
+        await asyncio.sleep(0)
+
+        assert [standing.name for standing in session.standings(3)] == ["fa***@x.io", "sl***@x.io", "wr***@x.io"]
+        assert [standing.rank for standing in session.standings(2)] == [1, 2]
+
+    asyncio.run(scenario())
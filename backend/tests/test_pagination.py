@@ -0,0 +1,32 @@
+"""Keyset cursors round-trip and reject tampering."""
+from datetime import datetime, timezone
+import base64
+import uuid
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize("timestamp", [
+    datetime(2024, 3, 1, 12, 30, 15, 123456),
+    datetime(2024, 3, 1, 12, 30, 15, tzinfo=timezone.utc),
+])
+def test_cursor_round_trips(timestamp):
+    row_id = uuid.uuid4()
+    cursor = encode_cursor(timestamp, row_id)
+    assert "=" not in cursor  # Padding is stripped for URLs
+    assert decode_cursor(cursor) == (timestamp, row_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not base64!",
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+    base64.urlsafe_b64encode(b"yesterday|" + str(uuid.uuid4()).encode()).decode(),
+    base64.urlsafe_b64encode(b"2024-03-01T12:30:15|not-a-uuid").decode(),
+    base64.urlsafe_b64encode(b"2024-03-01T12:30:15").decode(),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
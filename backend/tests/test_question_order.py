@@ -0,0 +1,89 @@
+"""Question placement and renumbering for quiz question diffs."""
+from types import SimpleNamespace
+from unittest import mock
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.models import admin, answer, submission, user  # noqa: E402,F401  (register every mapper)
+from app.accessors import quiz_accessor  # noqa: E402
+from app.models.question import Question  # noqa: E402
+from app.schemas.quiz import QuizQuestionsPatch  # noqa: E402
+
+
+def _existing(count):
+    ids = [uuid.uuid4() for _ in range(count)]
+    return ids, {question_id: position for position, question_id in enumerate(ids, start=1)}
+
+
+def test_plan_appends_at_the_end_without_moving_others():
+    ids, current = _existing(3)
+    new_id = uuid.uuid4()
+    added, moved = quiz_accessor.plan_question_order(current, ids, [(4, new_id)])
+    assert added == {new_id: 4}
+    assert moved == {}
+
+
+def test_plan_inserts_in_the_middle_and_shifts_later_questions():
+    ids, current = _existing(3)
+    new_id = uuid.uuid4()
+    added, moved = quiz_accessor.plan_question_order(current, ids, [(2, new_id)])
+    assert added == {new_id: 2}
+    assert moved == {ids[1]: 3, ids[2]: 4}
+
+
+def test_plan_clamps_positions_and_renumbers_after_deletes():
+    ids, current = _existing(4)
+    first, last = uuid.uuid4(), uuid.uuid4()
+    remaining = [ids[0], ids[2], ids[3]]  # ids[1] deleted
+    added, moved = quiz_accessor.plan_question_order(current, remaining, [(0, first), (99, last)])
+    assert added == {first: 1, last: 5}
+    assert moved == {ids[0]: 2}  # ids[2] and ids[3] keep 3 and 4
+
+
+def _apply(existing_ids, patch):
+    """Run apply_question_changes against a mocked session; return the final order."""
+    rows = [SimpleNamespace(id=question_id, order=position) for position, question_id in enumerate(existing_ids, 1)]
+    db = mock.MagicMock()
+    db.query.return_value.filter.return_value.order_by.return_value.all.return_value = rows
+    db.query.return_value.filter.return_value.one.return_value = (None, None)
+
+    with mock.patch.object(quiz_accessor, "invalidate_quiz"), \
+            mock.patch.object(quiz_accessor, "case", wraps=quiz_accessor.case) as renumber:
+        quiz_accessor.apply_question_changes(db, uuid.uuid4(), patch)
+
+    final = {row.id: row.order for row in rows}
+    for call in renumber.call_args_list:
+        final.update(call.args[0])
+    for call in db.add.call_args_list:
+        if isinstance(call.args[0], Question):
+            final[call.args[0].id] = call.args[0].order
+    return final
+
+
+def _question(text, order):
+    return {
+        "question_type": "text",
+        "question_text": text,
+        "order": order,
+        "answer": {"correct_answer": "x"},
+    }
+
+
+def test_added_question_at_the_end_is_served_last():
+    ids, _ = _existing(3)
+    final = _apply(ids, QuizQuestionsPatch.model_validate({"add": [_question("new", 4)]}))
+    new_id = next(question_id for question_id in final if question_id not in ids)
+    assert final[new_id] == 4
+    assert [final[question_id] for question_id in ids] == [1, 2, 3]
+
+
+def test_added_question_in_the_middle_shifts_the_rest():
+    ids, _ = _existing(3)
+    final = _apply(ids, QuizQuestionsPatch.model_validate({"add": [_question("new", 2)]}))
+    new_id = next(question_id for question_id in final if question_id not in ids)
+    assert final[new_id] == 2
+    assert [final[question_id] for question_id in ids] == [1, 3, 4]
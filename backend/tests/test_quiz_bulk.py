@@ -0,0 +1,50 @@
+"""Per-quiz outcomes of bulk quiz actions."""
+from unittest import mock
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.models import admin, answer, submission, user  # noqa: E402,F401  (register every mapper)
+from app.schemas.quiz import QuizBulkRequest  # noqa: E402
+from app.services import quiz_service  # noqa: E402
+
+
+def _run(request, updated_ids):
+    with mock.patch.object(quiz_service.quiz_accessor, "bulk_update_quizzes", return_value=updated_ids) as update:
+        result = quiz_service.run_bulk_action(mock.MagicMock(), request, uuid.uuid4())
+    return result, update
+
+
+def test_explicit_ids_report_each_once_in_request_order():
+    mine, other, missing = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    request = QuizBulkRequest(action="deactivate", ids=[missing, mine, other, mine])
+    result, update = _run(request, [other, mine])
+
+    assert result.updated == 2
+    assert [(outcome.id, outcome.status) for outcome in result.outcomes] == [
+        (missing, "not_found"), (mine, "updated"), (other, "updated")
+    ]
+    assert update.call_args.args[2] == {"is_active": False}
+
+
+def test_filter_reports_only_matched_quizzes():
+    matched = [uuid.uuid4(), uuid.uuid4()]
+    request = QuizBulkRequest(action="activate", filter={"title_contains": "draft"})
+    result, _ = _run(request, matched)
+
+    assert result.updated == 2
+    assert [outcome.id for outcome in result.outcomes] == matched
+    assert {outcome.status for outcome in result.outcomes} == {"updated"}
+
+
+@pytest.mark.parametrize("fields", [
+    {"action": "activate"},
+    {"action": "activate", "ids": [uuid.uuid4()], "filter": {"is_active": True}},
+    {"action": "transfer", "ids": [uuid.uuid4()]},
+])
+def test_ambiguous_or_incomplete_requests_are_rejected(fields):
+    with pytest.raises(ValueError):
+        _run(QuizBulkRequest(**fields), [])